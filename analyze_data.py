@@ -3,22 +3,47 @@ Analysis script for Solar Mining data
 Reads CSV and displays statistics + creates simple plots
 """
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from pathlib import Path
 
 DATA_FILE = Path("logs/solar_data.csv")
+MAX_ROW_INTERVAL = 360  # Rows come at least every 5 min (delta logging) - longer gaps = controller was off
 
 def load_data():
-    """Load CSV data."""
-    if not DATA_FILE.exists():
+    """Load CSV data (daily archives solar_data_YYYYMMDD.csv.gz + current file)."""
+    files = sorted(DATA_FILE.parent.glob(f"{DATA_FILE.stem}_*.csv.gz"))
+    if DATA_FILE.exists():
+        files.append(DATA_FILE)
+    if not files:
         print(f"❌ No data found: {DATA_FILE}")
         return None
     
-    df = pd.read_csv(DATA_FILE)
+    df = pd.concat((pd.read_csv(f) for f in files), ignore_index=True)
     df['timestamp'] = pd.to_datetime(df['timestamp'])
+    # Rows are written at varying intervals - weight each row by the time until the next one
+    df['interval_s'] = (
+        df['timestamp'].diff().shift(-1).dt.total_seconds()
+        .clip(upper=MAX_ROW_INTERVAL).fillna(0)
+    )
     return df
 
+def time_weighted_mean(df, column, mask=None):
+    """
+    Average of a column weighted by interval_s (time each row stands for).
+    
+    Delta logging writes rows clustered where values change, so a plain row
+    mean over-weights volatile periods. Falls back to the row mean if the
+    selected rows carry no time (e.g. a single row).
+    """
+    rows = df if mask is None else df[mask]
+    if rows.empty:
+        return float('nan')
+    if rows['interval_s'].sum() <= 0:
+        return rows[column].mean()
+    return np.average(rows[column], weights=rows['interval_s'])
+
 def show_statistics(df):
     """Display basic statistics."""
     print("=" * 80)
@@ -29,33 +54,33 @@ def show_statistics(df):
     print()
     
     print("SOLAR PRODUCTION:")
-    print(f"  Average: {df['solar_production_w'].mean():.0f} W")
+    print(f"  Average: {time_weighted_mean(df, 'solar_production_w'):.0f} W")
     print(f"  Maximum: {df['solar_production_w'].max():.0f} W")
     print(f"  Minimum: {df['solar_production_w'].min():.0f} W")
     print()
     
     print("HOUSE CONSUMPTION:")
-    print(f"  Average: {df['house_consumption_w'].mean():.0f} W")
+    print(f"  Average: {time_weighted_mean(df, 'house_consumption_w'):.0f} W")
     print(f"  Maximum: {df['house_consumption_w'].max():.0f} W")
     print(f"  Minimum: {df['house_consumption_w'].min():.0f} W")
     print()
     
     print("GRID FEED-IN:")
-    print(f"  Average: {df['grid_feed_in_w'].mean():.0f} W")
+    print(f"  Average: {time_weighted_mean(df, 'grid_feed_in_w'):.0f} W")
     print(f"  Maximum: {df['grid_feed_in_w'].max():.0f} W")
-    print(f"  Total: {df['grid_feed_in_w'].sum() * 30 / 3600:.2f} kWh (at 30s interval)")
+    print(f"  Total: {(df['grid_feed_in_w'] * df['interval_s']).sum() / 3600 / 1000:.2f} kWh")
     print()
     
     print("MINING:")
-    mining_time = df['mining_active'].sum() * 30 / 3600  # 30s interval
-    total_time = len(df) * 30 / 3600
+    mining_time = (df['mining_active'] * df['interval_s']).sum() / 3600
+    total_time = df['interval_s'].sum() / 3600
     print(f"  Mining time: {mining_time:.2f} h ({mining_time/total_time*100:.1f}%)")
-    print(f"  Average hashrate: {df[df['hashrate_mhs']>0]['hashrate_mhs'].mean():.2f} MH/s")
-    print(f"  GPU temperature (mining): {df[df['mining_active']==1]['gpu_temp_c'].mean():.1f}°C")
+    print(f"  Average hashrate: {time_weighted_mean(df, 'hashrate_mhs', df['hashrate_mhs'] > 0):.2f} MH/s")
+    print(f"  GPU temperature (mining): {time_weighted_mean(df, 'gpu_temp_c', df['mining_active'] == 1):.1f}°C")
     print()
     
     if df['mining_paused'].sum() > 0:
-        pause_time = df['mining_paused'].sum() * 30 / 60
+        pause_time = (df['mining_paused'] * df['interval_s']).sum() / 60
         print(f"GPU PAUSES:")
         print(f"  Paused: {pause_time:.1f} minutes")
         print()
@@ -113,13 +138,12 @@ def plot_daily_pattern(df):
     """Display daily patterns."""
     df['hour'] = df['timestamp'].dt.hour
     
-    hourly = df.groupby('hour').agg({
-        'solar_production_w': 'mean',
-        'house_consumption_w': 'mean',
-        'available_for_mining_w': 'mean',
-        'mining_active': 'mean',
-        'hashrate_mhs': 'mean'
-    })
+    # Time-weighted hourly means (rows are not evenly spaced with delta logging)
+    columns = ['solar_production_w', 'house_consumption_w', 'available_for_mining_w',
+               'mining_active', 'hashrate_mhs']
+    hourly = df.groupby('hour')[columns + ['interval_s']].apply(
+        lambda rows: pd.Series({column: time_weighted_mean(rows, column) for column in columns})
+    )
     
     fig, axes = plt.subplots(2, 1, figsize=(12, 8))
     
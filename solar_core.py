@@ -8,14 +8,18 @@ Provides reusable infrastructure for both deployment targets.
 """
 
 import asyncio
+import atexit
 import os
 import logging
 import csv
 import time
+from contextlib import suppress
+from operator import itemgetter
 from datetime import datetime, time as dt_time
 from pathlib import Path
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
 
 try:
     from huawei_solar import create_tcp_bridge
@@ -24,6 +28,31 @@ except ImportError:
     HUAWEI_AVAILABLE = False
 
 
+def create_http_session(pool_maxsize=4):
+    """
+    Create a requests.Session with keep-alive connection pooling (shared).
+    
+    Reusing one session avoids a new TCP/TLS handshake per API call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared HTTP session for NiceHash, Open-Meteo, the update checks and the local QuickMiner API
+HTTP_SESSION = create_http_session()
+atexit.register(HTTP_SESSION.close)
+
+# Keys of WeatherAPI.get_current_weather(); stand-in with zeros while no weather data is cached
+WEATHER_FIELDS = (
+    'temperature_c', 'cloud_cover_percent', 'wind_speed_kmh', 'precipitation_mm',
+    'global_radiation_wm2', 'direct_radiation_wm2', 'diffuse_radiation_wm2',
+)
+EMPTY_WEATHER = dict.fromkeys(WEATHER_FIELDS, 0)
+
+
 class WeatherAPI:
     """Open-Meteo Weather API Client (shared)."""
     
@@ -52,7 +81,7 @@ class WeatherAPI:
                 'timezone': 'auto'
             }
             
-            response = requests.get(self.api_url, params=params, timeout=10)
+            response = HTTP_SESSION.get(self.api_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -108,6 +137,40 @@ class InverterConnection:
         return await self.bridge.client.get(register_name)
 
 
+async def read_register_block(client, names, timeout=10, strict=False):
+    """
+    Read inverter registers in ONE Modbus transaction (shared).
+    
+    names must be in ascending register order (huawei-solar get_multiple()
+    reads from the first to the last register and decodes locally). If the
+    block read is rejected - e.g. a model lacks one register in the range -
+    the registers are read individually; unreadable ones are left out.
+    Every read is bounded by timeout seconds, so a stalled Modbus socket
+    cannot hang the caller. Returns {name: value} ({} on timeout).
+    With strict=True a timeout or the first failed single read is raised instead.
+    """
+    try:
+        results = await asyncio.wait_for(client.get_multiple(list(names)), timeout=timeout)
+        return {name: result.value for name, result in zip(names, results)}
+    except asyncio.TimeoutError:
+        # Inverter busy - single reads would only time out again
+        if strict:
+            raise
+        return {}
+    except Exception as e:
+        logging.getLogger('error_logger').debug(
+            "Block read %s..%s failed (%s) - reading registers individually", names[0], names[-1], e)
+    results = await asyncio.gather(
+        *(asyncio.wait_for(client.get(name), timeout=timeout) for name in names),
+        return_exceptions=not strict
+    )
+    return {
+        name: result.value
+        for name, result in zip(names, results)
+        if not isinstance(result, BaseException)
+    }
+
+
 class AlarmParser:
     """
     Alarm parsing logic (shared).
@@ -126,7 +189,8 @@ class AlarmParser:
         
         Returns alarm ID as integer, or 0 if no alarm.
         """
-        if alarm_raw is None:
+        # Normalfall ohne Alarm (None, [], 0) vor allen hasattr()/isinstance()-Tests
+        if not alarm_raw:
             return 0
         
         val = alarm_raw.value if hasattr(alarm_raw, 'value') else alarm_raw
@@ -153,9 +217,10 @@ class AlarmParser:
         """
         Get detailed alarm information (ID + Alarm object).
         
+        Accepts a register result (with .value) or the raw value.
         Returns tuple: (alarm_id: int, alarm_object: Alarm|None)
         """
-        val = alarm_obj.value
+        val = alarm_obj.value if hasattr(alarm_obj, 'value') else alarm_obj
         
         # List of Alarm objects
         if isinstance(val, list) and len(val) > 0:
@@ -174,31 +239,91 @@ class AlarmParser:
         return int(val) if val else 0, None
 
 
+def format_csv_line(row):
+    """
+    Format a data row as one CSV line without csv.writer's per-field quoting logic.
+    
+    Output is identical to csv.writer (None -> "", \\r\\n terminator). Returns None
+    if any field would need quoting (comma, quote, line break) - the caller
+    then falls back to csv.writer.
+    """
+    line = ",".join(["" if value is None else str(value) for value in row])
+    if line.count(",") != len(row) - 1 or '"' in line or "\n" in line or "\r" in line:
+        return None
+    return line + "\r\n"
+
+
 class CSVLogger:
-    """CSV Data Logger (shared)."""
+    """
+    CSV Data Logger (shared) with a persistent, buffered append handle.
+    
+    The file is opened on the first write instead of per row; the header is
+    written when the file is new or empty. Rows are flushed every
+    flush_every rows and on close(). If a write fails (SD card hiccup,
+    file locked) the handle is re-opened once before the error is raised.
+    """
     
-    def __init__(self, log_file, columns):
+    def __init__(self, log_file, columns, buffer_size=64 * 1024, flush_every=10):
         self.log_file = Path(log_file)
         self.columns = columns
-        self._init_csv()
+        self.buffer_size = buffer_size
+        self.flush_every = flush_every
+        self._row_getter = itemgetter(*columns)
+        self._fh = None
+        self._writer = None
+        self._rows_pending = 0  # Rows since the last flush()
     
-    def _init_csv(self):
-        """Initialize CSV file with header if it doesn't exist."""
-        if not self.log_file.exists():
-            self.log_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.log_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(self.columns)
+    def _open(self):
+        """Open the append handle; header if the file is new or empty."""
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.log_file, 'a', buffering=self.buffer_size, newline='', encoding='utf-8')
+        self._writer = csv.writer(self._fh)
+        self._rows_pending = 0
+        # Append mode starts at the end of the file: 0 = new or empty file
+        if self._fh.tell() == 0:
+            self._writer.writerow(self.columns)
+    
+    def write_row(self, row):
+        """Append one row (sequence in column order)."""
+        for attempt in range(2):
+            try:
+                if self._writer is None:
+                    self._open()
+                line = format_csv_line(row)
+                if line is None:
+                    self._writer.writerow(row)
+                else:
+                    self._fh.write(line)
+                self._rows_pending += 1
+                if self._rows_pending >= self.flush_every:
+                    self._fh.flush()
+                    self._rows_pending = 0
+                return
+            except OSError:
+                self.close()
+                if attempt:
+                    raise
     
     def log_data(self, data_dict):
-        """Write data row to CSV file."""
+        """Write data row (dict keyed by column) to the CSV file."""
         try:
-            with open(self.log_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
+            try:
+                row = self._row_getter(data_dict)
+            except KeyError:
+                # Incomplete sample - fill missing columns with 0
                 row = [data_dict.get(col, 0) for col in self.columns]
-                writer.writerow(row)
+            self.write_row(row)
         except Exception as e:
             logging.error(f"CSV logging error: {e}")
+    
+    def close(self):
+        """Flush and close the handle (if open); the next write re-opens it."""
+        if self._fh is not None:
+            with suppress(OSError):
+                self._fh.close()
+        self._fh = None
+        self._writer = None
+        self._rows_pending = 0
 
 
 class AlarmDiagnostics:
@@ -629,11 +754,11 @@ def setup_logging(log_dir, error_log_filename):
 
 
 # CSV Column Definitions (shared)
-CSV_COLUMNS_FULL = [
+CSV_COLUMNS_FULL = (
     'timestamp', 'unix_timestamp',
     'solar_production_w', 'grid_power_w', 'house_consumption_w',
     'grid_feed_in_w', 'grid_import_w', 'available_for_mining_w',
-    'mining_active', 'mining_paused', 'hashrate_mhs', 'excavator_errors',
+    'mining_active', 'mining_paused', 'hashrate_mhs', 'algorithm', 'excavator_errors',
     'start_confirmations', 'stop_confirmations',
     'gpu_usage_percent', 'gpu_temp_c',
     'pv_01_voltage_v', 'pv_01_current_a', 'pv_01_power_w',
@@ -649,9 +774,9 @@ CSV_COLUMNS_FULL = [
     'weather_direct_radiation_wm2', 'weather_diffuse_radiation_wm2',
     'inverter_alarm_1', 'inverter_alarm_2', 'inverter_alarm_3',
     'inverter_device_status'
-]
+)
 
-CSV_COLUMNS_MINIMAL = [
+CSV_COLUMNS_MINIMAL = (
     'timestamp', 'unix_timestamp',
     'solar_production_w', 'grid_power_w', 'house_consumption_w',
     'grid_feed_in_w', 'grid_import_w',
@@ -666,4 +791,8 @@ CSV_COLUMNS_MINIMAL = [
     'weather_direct_radiation_wm2', 'weather_diffuse_radiation_wm2',
     'inverter_alarm_1', 'inverter_alarm_2', 'inverter_alarm_3',
     'inverter_device_status'
-]
+)
+
+# Row builders: pick a {column: value} sample into header order in one C-level call
+CSV_ROW_FULL = itemgetter(*CSV_COLUMNS_FULL)
+CSV_ROW_MINIMAL = itemgetter(*CSV_COLUMNS_MINIMAL)
@@ -18,6 +18,7 @@ GPU Monitoring:
 """
 
 import asyncio
+import atexit
 import json
 import subprocess
 import os
@@ -27,29 +28,61 @@ import requests
 from huawei_solar import create_tcp_bridge
 from datetime import datetime
 import time
-import GPUtil
 import psutil
 import logging
-import traceback
 import csv
+import errno
+import gzip
+import hashlib
+import operator
+import random
+import re
+import socket
+import threading
+import statistics
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
 from dotenv import load_dotenv
 import shutil
-import zipfile
-import tempfile
 from urllib.parse import urlparse
-import pkg_resources
-from packaging import version
+from importlib import metadata as importlib_metadata
+
+# Optional: NVML direkt (kein nvidia-smi Subprozess pro Abfrage wie bei GPUtil)
+try:
+    import pynvml
+    NVML_AVAILABLE = True
+except ImportError:
+    NVML_AVAILABLE = False
+
+# Optional: schnellerer JSON-Parser für NiceHash- und Excavator-Antworten
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Beide akzeptieren bytes direkt (kein decode() vorher nötig)
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def json_line(obj):
+    """Serialisiert ein JSON-RPC Kommando als newline-terminierte Bytes-Zeile."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj) + "\n").encode()
 
 # Import shared components
 from solar_core import (
     WeatherAPI,
-    InverterConnection,
     AlarmParser,
+    HTTP_SESSION,
+    CSV_COLUMNS_FULL,
+    CSV_ROW_FULL,
     CSVLogger,
-    AlarmDiagnostics,
-    setup_logging as core_setup_logging,
-    CSV_COLUMNS_FULL
+    EMPTY_WEATHER,
+    read_register_block
 )
 
 # Import translation system
@@ -68,6 +101,7 @@ QUICKMINER_API_PORT = int(os.getenv("QUICKMINER_API_PORT", "18000"))
 EXCAVATOR_PATH = os.getenv("EXCAVATOR_PATH", r"H:\miner\excavator.exe")
 EXCAVATOR_API_HOST = os.getenv("EXCAVATOR_API_HOST", "127.0.0.1")
 EXCAVATOR_API_PORT = int(os.getenv("EXCAVATOR_API_PORT", "3456"))
+EXCAVATOR_MAX_RESPONSE_BYTES = 1024 * 1024  # Max size of one JSON-RPC response line
 
 INVERTER_HOST = os.getenv("INVERTER_HOST", "192.168.18.206")
 INVERTER_PORT = int(os.getenv("INVERTER_PORT", "6607"))
@@ -75,9 +109,12 @@ INVERTER_PORT = int(os.getenv("INVERTER_PORT", "6607"))
 # GPU settings
 DEVICE_ID = os.getenv("DEVICE_ID", "0")
 DEVICE_IDS = [id.strip() for id in DEVICE_ID.split(",")]  # Support multiple GPUs
+MAX_GPU_COUNT = len(DEVICE_IDS)
 ALGORITHM = os.getenv("ALGORITHM", "daggerhashimoto")
 STRATUM_URL = os.getenv("STRATUM_URL", "nhmp-ssl.eu.nicehash.com:443")
 NICEHASH_WALLET = os.getenv("NICEHASH_WALLET", "YOUR_WALLET_ADDRESS.worker_name")
+# Einmal zerlegen: "adresse.worker" (Worker-Name optional -> "")
+NICEHASH_WALLET_ADDRESS, _, NICEHASH_WORKER_NAME = NICEHASH_WALLET.partition(".")
 
 # NiceHash API (authenticated access for account stats)
 NICEHASH_API_KEY = os.getenv("NICEHASH_API_KEY", "")
@@ -95,15 +132,39 @@ MIN_POWER_TO_START = int(os.getenv("MIN_POWER_TO_START", "200"))
 MIN_POWER_TO_KEEP = int(os.getenv("MIN_POWER_TO_KEEP", "150"))
 CHECK_INTERVAL = int(os.getenv("CHECK_INTERVAL", "30"))
 ALARM_CHECK_INTERVAL = int(os.getenv("ALARM_CHECK_INTERVAL", "5"))
+EARNINGS_CHECK_INTERVAL = int(os.getenv("EARNINGS_CHECK_INTERVAL", "300"))  # NiceHash earnings (own task)
+# Adaptive loop interval: after STABLE_TICKS_PER_STEP stable ticks, sleep one more
+# CHECK_INTERVAL - up to CHECK_INTERVAL_MAX_FACTOR * CHECK_INTERVAL (1 = disabled)
+CHECK_INTERVAL_MAX_FACTOR = int(os.getenv("CHECK_INTERVAL_MAX_FACTOR", "2"))
+STABLE_TICKS_PER_STEP = 30
+STABLE_HEADROOM_POWER = MIN_POWER_TO_KEEP * 1.5  # Surplus above which mining counts as "plenty of headroom"
+# Wall-clock cadences for periodic work in the main loop (seconds, independent of CHECK_INTERVAL)
+FULL_SNAPSHOT_INTERVAL = 60  # Full inverter snapshot + CSV row
+WEATHER_REFRESH_INTERVAL = 900  # Weather API (Open-Meteo "current" has 15-min resolution)
+POLL_JITTER = 10  # ± seconds added to earnings/weather intervals so polls don't line up
+CONNECT_BACKOFF_BASE = 5  # Inverter reconnect: full-jitter back-off base (seconds)
+CONNECT_BACKOFF_MAX = 300  # Inverter reconnect: upper bound of the back-off window (seconds)
+# Give up after N failed inverter connect attempts (0 = retry forever), e.g. so a service manager restarts the process
+INVERTER_CONNECT_MAX_ATTEMPTS = int(os.getenv("INVERTER_CONNECT_MAX_ATTEMPTS", "0"))
+RIG_STATUS_INTERVAL = 600  # NiceHash rig status display
+GPU_HEALTH_CHECK_INTERVAL = 120  # Stuck-GPU (0 hashrate) check
 
 # Hysteresis
 START_CONFIRMATIONS_NEEDED = int(os.getenv("START_CONFIRMATIONS_NEEDED", "3"))
 STOP_CONFIRMATIONS_NEEDED = int(os.getenv("STOP_CONFIRMATIONS_NEEDED", "5"))
+# Rolling median over the last N power samples for GPU-count scaling (filters single cloud spikes)
+POWER_SMOOTHING_SAMPLES = max(START_CONFIRMATIONS_NEEDED, STOP_CONFIRMATIONS_NEEDED)
 
 # GPU usage monitoring
 GPU_USAGE_THRESHOLD = int(os.getenv("GPU_USAGE_THRESHOLD", "10"))
 GPU_CHECK_ENABLED = os.getenv("GPU_CHECK_ENABLED", "True").lower() == "true"
 
+# Back-off for failing probes (Excavator API, GPU queries) - stop hammering broken subsystems
+PROBE_BACKOFF_INITIAL = 10  # Seconds before first retry after failure
+PROBE_BACKOFF_MAX = 600  # Upper bound for back-off (seconds)
+BLOCK_FAILURES_BEFORE_BACKOFF = 3  # Failed reads in a row before an optional register block is paused
+EXCAVATOR_BACKOFF_AFTER_ERRORS = 30  # Consecutive API errors before back-off starts
+
 # GPU power limit (safety feature to prevent crashes)
 # Set to percentage of maximum TDP (e.g., 85 = 85% of max power)
 # Lower values = safer but less performance. 100 = maximum power (not recommended).
@@ -117,6 +178,8 @@ GPU_VRAM_TEMP_TARGET = int(os.getenv("GPU_VRAM_TEMP_TARGET", "90"))  # Target VR
 GPU_VRAM_TEMP_THROTTLE = int(os.getenv("GPU_VRAM_TEMP_THROTTLE", "95"))  # VRAM throttle temp
 GPU_VRAM_TEMP_CRITICAL = int(os.getenv("GPU_VRAM_TEMP_CRITICAL", "100"))  # VRAM emergency temp
 GPU_THERMAL_CHECK_INTERVAL = int(os.getenv("GPU_THERMAL_CHECK_INTERVAL", "60"))  # Seconds between checks
+GPU_POLL_INTERVAL = int(os.getenv("GPU_POLL_INTERVAL", "10"))  # Seconds between background GPU load/temp polls
+GPU_CACHE_TTL = 2  # Seconds a GPU load/temp reading is reused by other callers
 
 # QuickMiner startup wait (for autostart scenarios)
 QUICKMINER_STARTUP_WAIT = int(os.getenv("QUICKMINER_STARTUP_WAIT", "120"))  # Max seconds to wait for QuickMiner
@@ -124,6 +187,37 @@ QUICKMINER_STARTUP_WAIT = int(os.getenv("QUICKMINER_STARTUP_WAIT", "120"))  # Ma
 # Modbus timeout settings (for improved reliability)
 MODBUS_READ_TIMEOUT = int(os.getenv("MODBUS_READ_TIMEOUT", "10"))  # Timeout for non-critical reads
 MODBUS_CRITICAL_TIMEOUT = int(os.getenv("MODBUS_CRITICAL_TIMEOUT", "15"))  # Timeout for critical reads (solar power)
+REGISTER_CACHE_TTL = CHECK_INTERVAL / 2  # Register snapshot shared by main loop and alarm check
+
+# Contiguous inverter register blocks (ascending SUN2000 register order).
+# Each block is read in ONE Modbus transaction via huawei-solar's get_multiple().
+INVERTER_BLOCK_ALARMS_PV = (  # 32008-32019
+    "alarm_1", "alarm_2", "alarm_3",
+    "pv_01_voltage", "pv_01_current", "pv_02_voltage", "pv_02_current",
+)
+INVERTER_BLOCK_STATUS = (  # 32064-32115
+    "input_power",
+    "grid_A_voltage", "grid_B_voltage", "grid_C_voltage",
+    "grid_A_current", "grid_B_current", "grid_C_current",
+    "efficiency", "internal_temperature", "device_status",
+    "accumulated_yield_energy", "daily_yield_energy",
+)
+INVERTER_BLOCK_BATTERY = (  # 37760-37766
+    "storage_state_of_capacity", "storage_charge_discharge_power",
+)
+# Spannung/Strom-Paare (U, I abwechselnd) für String- (PV1, PV2) und Phasenleistung (A, B, C)
+POWER_KEYS = (
+    "pv_01_voltage", "pv_01_current", "pv_02_voltage", "pv_02_current",
+    "grid_A_voltage", "grid_A_current", "grid_B_voltage", "grid_B_current",
+    "grid_C_voltage", "grid_C_current",
+)
+
+def smudged(interval, jitter=POLL_JITTER):
+    """Return interval ± jitter seconds ("smudged" so periodic polls drift apart)."""
+    return interval + random.uniform(-jitter, jitter)
+
+# Trennlinie für Banner und Alarm-Snapshots
+BANNER_LINE = "=" * 80
 
 # LOGGING CONFIGURATION
 LOG_DIR = Path("logs")
@@ -131,11 +225,38 @@ LOG_DIR.mkdir(exist_ok=True)
 ERROR_LOG_FILE = LOG_DIR / "errors.log"
 DATA_LOG_FILE = LOG_DIR / "solar_data.csv"
 GPU_HEALTH_LOG = LOG_DIR / "gpu_health.csv"
+CSV_BUFFER_SIZE = 64 * 1024  # Write buffer of the persistent data CSV handle
+CSV_FLUSH_EVERY = 10  # Flush the data CSV every N rows (~10 min at one row per minute)
+CSV_QUEUE_SIZE = 1024  # Rows waiting for the CSV writer task before the oldest is dropped
+# Rotate the data CSV at midnight into solar_data_YYYYMMDD.csv.gz (False = one ever-growing file)
+DATA_LOG_ROTATE_DAILY = os.getenv("DATA_LOG_ROTATE_DAILY", "True").lower() == "true"
+# Delta logging: write a row only if a monitored value changed (False = every snapshot)
+DATA_LOG_DELTA_ONLY = os.getenv("DATA_LOG_DELTA_ONLY", "True").lower() == "true"
+DATA_LOG_HEARTBEAT = 300  # Write a row at least every N seconds even if nothing changed
+DATA_LOG_TOLERANCES = {  # Numeric columns: change >= tolerance forces a row
+    'solar_production_w': 20,
+    'house_consumption_w': 20,
+    'grid_power_w': 20,
+    'available_for_mining_w': 20,
+    'battery_power_w': 20,
+    'battery_soc_percent': 1,
+    'gpu_usage_percent': 5,
+    'gpu_temp_c': 2,
+    'internal_temp_c': 1,
+}
+DATA_LOG_STATE_KEYS = (  # Columns where any change forces a row
+    'mining_active', 'mining_paused', 'algorithm',
+    'start_confirmations', 'stop_confirmations',
+    'inverter_alarm_1', 'inverter_alarm_2', 'inverter_alarm_3', 'inverter_device_status',
+)
 GPU_THERMAL_LOG = LOG_DIR / "gpu_thermal.csv"
 
 # Setup Error Logger
+# LOG_LEVEL=INFO skips the debug diagnostics entirely (debug calls use lazy %-args / exc_info)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG").upper()
 error_logger = logging.getLogger('error_logger')
-error_logger.setLevel(logging.DEBUG)
+error_logger.setLevel(getattr(logging, LOG_LEVEL, logging.DEBUG))
+error_logger.propagate = False  # Own file handler only - no second pass through root handlers
 from logging.handlers import RotatingFileHandler
 
 # Use rotating logs to avoid huge files
@@ -176,75 +297,27 @@ EXCAVATOR_LOG_DIR.mkdir(exist_ok=True)
 EXCAVATOR_STDOUT = EXCAVATOR_LOG_DIR / "excavator_out.log"
 EXCAVATOR_STDERR = EXCAVATOR_LOG_DIR / "excavator_err.log"
 
-# Data Logger Setup
-def init_data_log():
-    """Initialize CSV file for data logging if it doesn't exist."""
-    if not DATA_LOG_FILE.exists():
-        with open(DATA_LOG_FILE, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                # Basis
-                'timestamp',
-                'unix_timestamp',
-                # Solar/Grid
-                'solar_production_w',
-                'grid_power_w',
-                'house_consumption_w',
-                'grid_feed_in_w',
-                'grid_import_w',
-                'available_for_mining_w',
-                # Mining
-                'mining_active',
-                'mining_paused',
-                'hashrate_mhs',
-                'algorithm',
-                'excavator_errors',
-                'start_confirmations',
-                'stop_confirmations',
-                # GPU
-                'gpu_usage_percent',
-                'gpu_temp_c',
-                # String-Daten (PV)
-                'pv_01_voltage_v',
-                'pv_01_current_a',
-                'pv_01_power_w',
-                'pv_02_voltage_v',
-                'pv_02_current_a',
-                'pv_02_power_w',
-                # Grid Details (3 Phasen)
-                'grid_A_voltage_v',
-                'grid_B_voltage_v',
-                'grid_C_voltage_v',
-                'grid_A_current_a',
-                'grid_B_current_a',
-                'grid_C_current_a',
-                'grid_A_power_w',
-                'grid_B_power_w',
-                'grid_C_power_w',
-                # Inverter Status
-                'internal_temp_c',
-                'efficiency_percent',
-                'daily_yield_kwh',
-                'total_yield_kwh',
-                # Batterie (optional)
-                'battery_power_w',
-                'battery_soc_percent',
-                # Wetter
-                'weather_temp_c',
-                'weather_cloud_cover_percent',
-                'weather_wind_speed_kmh',
-                'weather_precipitation_mm',
-                'weather_global_radiation_wm2',
-                'weather_direct_radiation_wm2',
-                'weather_diffuse_radiation_wm2',
-                # Inverter Alarms
-                'inverter_alarm_1',
-                'inverter_alarm_2',
-                'inverter_alarm_3',
-                'inverter_device_status'
-            ])
+# Data Logger Setup (header is written by solar_core.CSVLogger when the file is empty)
+def sample_changed(sample, last):
+    """True if any monitored value of sample moved beyond its tolerance since last (the last written row)."""
+    if last is None:
+        return True
+    for key, tolerance in DATA_LOG_TOLERANCES.items():
+        if abs((sample[key] or 0) - (last[key] or 0)) >= tolerance:
+            return True
+    return any(sample[key] != last[key] for key in DATA_LOG_STATE_KEYS)
 
-init_data_log()
+def gzip_file(path):
+    """Compress path to path.gz (via a temp file, so a crash never leaves a broken archive) and delete the original."""
+    gz_path = path.with_name(path.name + ".gz")
+    tmp_path = gz_path.with_name(gz_path.name + ".tmp")
+    try:
+        with open(path, 'rb') as src, gzip.open(tmp_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        tmp_path.replace(gz_path)
+        path.unlink()
+    except OSError as e:
+        error_logger.warning(f"Could not compress {path}: {e}")
 
 def init_gpu_health_log():
     """Initialize GPU health CSV used for offline analysis."""
@@ -367,6 +440,122 @@ def log_gpu_thermal_event(device_id, device_name, core_temp, vram_temp, fan_spee
 # AUTO-UPDATE FUNCTIONS
 # ============================================================================
 
+UPDATE_CACHE_DIR = Path(".cache")  # GitHub/PyPI release info between starts
+UPDATE_CHECK_TTL = 24 * 3600  # Seconds before release info is revalidated
+# Offline (air-gapped rig, flaky link): skip all update checks without any DNS/TCP
+AUTO_UPDATE_OFFLINE = (
+    os.getenv('AUTO_UPDATE_OFFLINE', 'False').lower() in ('1', 'true', 'yes')
+    or "--offline" in sys.argv
+)
+EXCAVATOR_RELEASE_URL = "https://api.github.com/repos/nicehash/excavator/releases/latest"
+EXCAVATOR_RELEASE_CACHE = UPDATE_CACHE_DIR / "excavator_release.json"
+HUAWEI_SOLAR_PYPI_URL = "https://pypi.org/pypi/huawei-solar/json"
+HUAWEI_SOLAR_PYPI_CACHE = UPDATE_CACHE_DIR / "huawei_solar_pypi.json"
+
+
+def version_tuple(text):
+    """
+    "v1.8.6.4" -> (1, 8, 6, 4) for plain numeric tags.
+    
+    Raises ValueError for anything else (letters, pre-releases) - callers
+    then fall back to packaging.version, which is imported only on that path.
+    """
+    return tuple(int(part) for part in text.lstrip('v').split('.'))
+
+
+def slim_github_release(data):
+    """Keep only what the Excavator update check reads (the full release JSON is 100+ KB)."""
+    return {
+        'tag_name': data.get('tag_name', ''),
+        'assets': [
+            {'name': asset['name'], 'browser_download_url': asset['browser_download_url']}
+            for asset in data.get('assets', [])
+        ],
+    }
+
+
+EXCAVATOR_RELEASE_OPTIONS = {
+    'slim': slim_github_release,
+    'headers': {'Accept': 'application/vnd.github+json'},
+}
+
+
+def get_cached_json(url, cache_path, ttl=UPDATE_CHECK_TTL, slim=None, headers=None):
+    """
+    GET a JSON document with an on-disk cache (stale-while-revalidate).
+    
+    - Cache younger than ttl: returned without any HTTP request.
+    - Older: conditional GET with the stored ETag; 304 keeps the cached
+      body and resets its age, 200 replaces it (atomically via os.replace).
+    - Network error or non-200 answer: stale cache if present.
+    
+    slim: optional callable applied to a fresh 200 body before it is cached
+    and returned, so later runs read and parse only the fields they need.
+    Returns the parsed JSON or None (no cache and no usable answer).
+    Raises requests.RequestException only if there is no cache to fall back to.
+    """
+    cached = None
+    try:
+        if time.time() - cache_path.stat().st_mtime < ttl:
+            return json_loads(cache_path.read_bytes())["data"]
+        cached = json_loads(cache_path.read_bytes())
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    headers = dict(headers or {})
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    try:
+        response = HTTP_SESSION.get(url, headers=headers, timeout=10)
+    except requests.exceptions.RequestException:
+        if cached:
+            error_logger.warning(f"{url} not reachable - using cached release info")
+            return cached["data"]
+        raise
+    
+    if response.status_code == 304 and cached:
+        with suppress(OSError):
+            os.utime(cache_path)
+        return cached["data"]
+    if response.status_code != 200:
+        error_logger.warning(f"{url} returned {response.status_code}")
+        return cached["data"] if cached else None
+    
+    data = json_loads(response.content)
+    if slim:
+        data = slim(data)
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        tmp_path.write_text(json.dumps({"etag": response.headers.get("ETag"), "data": data}), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        error_logger.debug("Could not write %s: %s", cache_path, e)
+    return data
+
+
+def prefetch_release_info():
+    """
+    Fetch GitHub and PyPI release info concurrently into the on-disk cache.
+    
+    The update checks print progress and may stop Excavator or run pip, so
+    they stay sequential - but their network round-trips overlap here and
+    the checks then read from the fresh cache.
+    """
+    if AUTO_UPDATE_OFFLINE:
+        return
+    sources = (
+        (EXCAVATOR_RELEASE_URL, EXCAVATOR_RELEASE_CACHE, EXCAVATOR_RELEASE_OPTIONS),
+        (HUAWEI_SOLAR_PYPI_URL, HUAWEI_SOLAR_PYPI_CACHE, {}),
+    )
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        futures = [pool.submit(get_cached_json, url, cache_path, **options) for url, cache_path, options in sources]
+    for future in futures:
+        if future.exception():
+            # Der eigentliche Check versucht es erneut und meldet den Fehler
+            error_logger.debug("Release info prefetch failed: %s", future.exception())
+
+
 def check_and_update_excavator(excavator_path):
     """
     Check for updates to NiceHash Excavator and auto-update if available.
@@ -374,21 +563,24 @@ def check_and_update_excavator(excavator_path):
     Returns:
         bool: True if update was performed or not needed, False if error occurred
     """
+    if AUTO_UPDATE_OFFLINE:
+        print("\n⏭️  Offline-Modus - Excavator-Update-Check übersprungen")
+        return True
+    
+    # Nur für den Update-Pfad gebraucht - nicht bei jedem Start laden
+    import tempfile
+    import zipfile
+    
     try:
         print("\n🔍 Prüfe auf Excavator-Updates...")
         error_logger.info("Checking for Excavator updates")
         
-        # GitHub API für NiceHash Excavator Releases
-        api_url = "https://api.github.com/repos/nicehash/excavator/releases/latest"
-        
-        # Get latest release info
-        response = requests.get(api_url, timeout=10)
-        if response.status_code != 200:
-            print(f"   ⚠️  GitHub API nicht erreichbar (Status {response.status_code})")
-            error_logger.warning(f"GitHub API returned status {response.status_code}")
+        # Get latest release info (cached on disk, revalidated once per day)
+        release_data = get_cached_json(EXCAVATOR_RELEASE_URL, EXCAVATOR_RELEASE_CACHE, **EXCAVATOR_RELEASE_OPTIONS)
+        if not release_data:
+            print("   ⚠️  GitHub API nicht erreichbar")
             return True  # Not a critical error, continue
         
-        release_data = response.json()
         latest_version = release_data.get('tag_name', '').replace('v', '')
         
         if not latest_version:
@@ -411,18 +603,22 @@ def check_and_update_excavator(excavator_path):
             else:
                 current_version = "0.0.0"  # No excavator installed
         except Exception as e:
-            error_logger.debug(f"Could not determine current version: {e}")
+            error_logger.debug("Could not determine current version: %s", e)
             current_version = "0.0.0"
         
         print(f"   Installiert: {current_version}")
         print(f"   Verfügbar:   {latest_version}")
         
+        # Häufigster Fall zuerst: unverändert, ohne Versions-Parsing oder Asset-Suche
+        if current_version == latest_version:
+            print("   ✅ Excavator ist aktuell")
+            return True
+        
         # Compare versions - handle versions with letters like "1.7.1d"
         try:
             # Normalize versions by removing letter suffixes for comparison
             def normalize_version(v):
                 """Remove letter suffixes like 'd', 'a', 'b' from version string."""
-                import re
                 # Extract just the numeric version (e.g., "1.7.1d" -> "1.7.1")
                 match = re.match(r'(\d+\.\d+\.\d+)', v)
                 return match.group(1) if match else v
@@ -436,24 +632,67 @@ def check_and_update_excavator(excavator_path):
                 if current_version == latest_version:
                     print(f"   ✅ Excavator ist aktuell")
                     return True
-            elif version.parse(current_normalized) > version.parse(latest_normalized):
-                # Current version is newer
-                print(f"   ✅ Excavator ist aktuell")
-                return True
+            else:
+                try:
+                    current_is_newer = version_tuple(current_normalized) > version_tuple(latest_normalized)
+                except ValueError:
+                    from packaging import version
+                    current_is_newer = version.parse(current_normalized) > version.parse(latest_normalized)
+                if current_is_newer:
+                    # Current version is newer
+                    print("   ✅ Excavator ist aktuell")
+                    return True
         except Exception as e:
-            error_logger.debug(f"Version comparison failed: {e}, will update")
+            error_logger.debug("Version comparison failed: %s, will update", e)
+        
+        # Find Windows download (+ published .sha256 checksum, if any)
+        download_url = None
+        download_name = None
+        sha_assets = {}
+        for asset in release_data.get('assets', []):
+            name = asset['name']
+            if name.lower().endswith('.sha256'):
+                sha_assets[name[:-len('.sha256')]] = asset['browser_download_url']
+            elif download_url is None and ('windows' in name.lower() or name.endswith('.zip')):
+                download_url = asset['browser_download_url']
+                download_name = name
+        
+        if not download_url:
+            print("   ❌ Keine Windows-Version gefunden")
+            error_logger.error("No Windows download found in release")
+            return True  # Continue anyway
+        
+        expected_sha = None
+        sha_url = sha_assets.get(download_name)
+        if sha_url:
+            with suppress(requests.exceptions.RequestException, IndexError):
+                sha_response = HTTP_SESSION.get(sha_url, timeout=15)
+                sha_response.raise_for_status()
+                # Format: "<hex>  <dateiname>"
+                expected_sha = sha_response.text.split()[0].lower()
+        
+        # Gleiches Archiv wie zuletzt installiert (z.B. nur neu getaggt): nichts herunterladen
+        sha_file = Path(excavator_path).parent / "excavator.sha256"
+        if expected_sha and os.path.exists(excavator_path) and sha_file.exists():
+            with suppress(OSError):
+                if sha_file.read_text().strip() == expected_sha:
+                    (Path(excavator_path).parent / "version.txt").write_text(latest_version)
+                    print("   ✅ Excavator ist aktuell (Archiv unverändert)")
+                    return True
         
         # Check if Excavator is running before attempting update
         excavator_running = False
         excavator_proc = None
-        try:
-            for proc in psutil.process_iter(['name', 'exe', 'pid']):
-                if proc.info['name'] and 'excavator' in proc.info['name'].lower():
+        with suppress(Exception):
+            for pid, name_lower, _exe in process_snapshot():
+                if 'excavator' in name_lower:
+                    # Snapshot bis zu 1s alt: PID kann inzwischen beendet sein
+                    try:
+                        excavator_proc = psutil.Process(pid)
+                    except psutil.NoSuchProcess:
+                        continue
                     excavator_running = True
-                    excavator_proc = proc
                     break
-        except:
-            pass
         
         if excavator_running:
             # Check if AUTO_UPDATE_EXCAVATOR_STOP is enabled
@@ -467,22 +706,22 @@ def check_and_update_excavator(excavator_path):
                 return True
             
             # Auto-stop is enabled - stop Excavator for update
-            print(f"   ⚠️  Excavator läuft (PID {excavator_proc.info['pid']})")
+            print(f"   ⚠️  Excavator läuft (PID {excavator_proc.pid})")
             print(f"   🛑 Stoppe Excavator für Update (AUTO_UPDATE_EXCAVATOR_STOP=True)...")
-            error_logger.info(f"Stopping Excavator (PID {excavator_proc.info['pid']}) for auto-update")
+            error_logger.info(f"Stopping Excavator (PID {excavator_proc.pid}) for auto-update")
             
             try:
-                # Try graceful shutdown via API first
+                # Try graceful shutdown via API first (JSON-RPC over TCP, like every other Excavator command)
                 try:
-                    api_response = requests.post(
-                        f'http://{os.getenv("EXCAVATOR_API_HOST", "127.0.0.1")}:{os.getenv("EXCAVATOR_API_PORT", "3456")}',
-                        json={"id": 1, "method": "quit", "params": []},
-                        timeout=5
-                    )
+                    quit_api = ExcavatorAPI(EXCAVATOR_API_HOST, EXCAVATOR_API_PORT)
+                    try:
+                        quit_api.send_command("quit", retries=1)
+                    finally:
+                        quit_api.close()
                     print(f"   ✓ API quit command sent")
                     time.sleep(3)  # Wait for graceful shutdown
                 except Exception as api_err:
-                    error_logger.debug(f"API quit failed: {api_err}")
+                    error_logger.debug("API quit failed: %s", api_err)
                 
                 # Check if still running, terminate if needed
                 if excavator_proc.is_running():
@@ -510,30 +749,31 @@ def check_and_update_excavator(excavator_path):
         # Update needed
         print(f"\n📥 Lade Excavator {latest_version} herunter...")
         
-        # Find Windows download
-        download_url = None
-        for asset in release_data.get('assets', []):
-            if 'windows' in asset['name'].lower() or asset['name'].endswith('.zip'):
-                download_url = asset['browser_download_url']
-                break
-        
-        if not download_url:
-            print(f"   ❌ Keine Windows-Version gefunden")
-            error_logger.error("No Windows download found in release")
-            return True  # Continue anyway
-        
-        # Download to temp directory
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Download to temp directory - neben der exe, damit die Installation ein Rename statt einer Kopie ist
+        excavator_path_obj = Path(excavator_path)
+        temp_parent = excavator_path_obj.parent if excavator_path_obj.parent.is_dir() else None
+        with tempfile.TemporaryDirectory(dir=temp_parent) as temp_dir:
             temp_dir_path = Path(temp_dir)
             zip_path = temp_dir_path / "excavator.zip"
             
             print(f"   Downloading from {download_url}...")
-            response = requests.get(download_url, stream=True, timeout=60)
+            response = HTTP_SESSION.get(download_url, stream=True, timeout=60)
             response.raise_for_status()
             
+            # 1 MiB-Blöcke direkt vom Socket in die Datei (statt 8 KiB iter_content-Schleife),
+            # SHA256 wird beim Schreiben mitgerechnet
+            response.raw.decode_content = True
+            digest = hashlib.sha256()
             with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in iter(lambda: response.raw.read(1024 * 1024), b''):
+                    digest.update(chunk)
                     f.write(chunk)
+            download_sha = digest.hexdigest()
+            
+            if expected_sha and download_sha != expected_sha:
+                print("   ❌ Prüfsumme stimmt nicht - Download verworfen")
+                error_logger.error(f"Excavator download checksum mismatch: expected {expected_sha}, got {download_sha}")
+                return True
             
             print(f"   ✅ Download abgeschlossen")
             
@@ -542,35 +782,51 @@ def check_and_update_excavator(excavator_path):
             extract_dir = temp_dir_path / "extract"
             extract_dir.mkdir()
             
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-            
-            # Find excavator.exe in extracted files
+            # Nur excavator.exe wird installiert - im Inhaltsverzeichnis suchen und
+            # gezielt entpacken statt das ganze Archiv zu schreiben und per os.walk zu durchsuchen
             new_excavator = None
-            for root, dirs, files in os.walk(extract_dir):
-                if 'excavator.exe' in files:
-                    new_excavator = Path(root) / 'excavator.exe'
-                    break
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                exe_members = [
+                    name for name in zip_ref.namelist()
+                    if name.replace('\\', '/').rsplit('/', 1)[-1] == 'excavator.exe'
+                ]
+                if exe_members:
+                    # Oberste Ebene bevorzugen (wie os.walk zuerst gefunden hätte)
+                    member = min(exe_members, key=lambda name: name.count('/'))
+                    new_excavator = Path(zip_ref.extract(member, extract_dir))
             
             if not new_excavator or not new_excavator.exists():
                 print(f"   ❌ excavator.exe nicht im Archiv gefunden")
                 error_logger.error("excavator.exe not found in downloaded archive")
                 return True
             
-            # Backup old version
-            excavator_path_obj = Path(excavator_path)
+            # Backup old version (Rename statt Kopie: O(1) und nie eine halb kopierte exe)
+            backup_path = None
             if excavator_path_obj.exists():
                 backup_path = excavator_path_obj.parent / f"excavator_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.exe"
                 print(f"   💾 Sichere alte Version nach {backup_path.name}...")
-                shutil.copy2(excavator_path, backup_path)
+                os.replace(excavator_path_obj, backup_path)
             
             # Replace with new version
             print(f"   📥 Installiere neue Version...")
-            shutil.copy2(new_excavator, excavator_path)
+            try:
+                try:
+                    os.replace(new_excavator, excavator_path_obj)
+                except OSError as e:
+                    # Temp-Verzeichnis auf anderem Laufwerk (z.B. Fallback auf %TEMP%) - kopieren
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.move(str(new_excavator), str(excavator_path_obj))
+            except OSError:
+                # Alte Version zurückholen, damit kein Excavator fehlt
+                if backup_path and not excavator_path_obj.exists():
+                    os.replace(backup_path, excavator_path_obj)
+                raise
             
             # Save version file
             version_file = excavator_path_obj.parent / "version.txt"
             version_file.write_text(latest_version)
+            sha_file.write_text(download_sha)
             
             print(f"   ✅ Excavator erfolgreich aktualisiert auf {latest_version}!")
             error_logger.info(f"Excavator updated to version {latest_version}")
@@ -584,7 +840,7 @@ def check_and_update_excavator(excavator_path):
     except Exception as e:
         print(f"   ❌ Fehler beim Excavator-Update: {e}")
         error_logger.error(f"Excavator update failed: {e}")
-        error_logger.debug(f"Traceback:\n{traceback.format_exc()}")
+        error_logger.debug("Traceback:", exc_info=True)
         return True  # Continue anyway, don't block startup
 
 
@@ -595,13 +851,17 @@ def check_and_update_huawei_solar():
     Returns:
         bool: True if update was performed or not needed, False if error occurred
     """
+    if AUTO_UPDATE_OFFLINE:
+        print("\n⏭️  Offline-Modus - huawei-solar Update-Check übersprungen")
+        return True
+    
     try:
         print("\n🔍 Prüfe auf huawei-solar Updates...")
         error_logger.info("Checking for huawei-solar package updates")
         
         # Get currently installed version
         try:
-            current_version = pkg_resources.get_distribution('huawei-solar').version
+            current_version = importlib_metadata.version('huawei-solar')
             print(f"   Installiert: {current_version}")
         except Exception as e:
             print(f"   ⚠️  Konnte installierte Version nicht ermitteln: {e}")
@@ -609,10 +869,17 @@ def check_and_update_huawei_solar():
         
         # Check latest version on PyPI and pick newest compatible release for this Python
         try:
-            response = requests.get('https://pypi.org/pypi/huawei-solar/json', timeout=10)
-            if response.status_code == 200:
-                pypi_data = response.json()
+            pypi_data = get_cached_json(HUAWEI_SOLAR_PYPI_URL, HUAWEI_SOLAR_PYPI_CACHE)
+            if pypi_data:
                 latest_version = pypi_data['info']['version']
+                
+                # Installiert == neueste Release: sie läuft auf diesem Python, also kompatibel -
+                # kein Sortieren/Parsen aller Releases nötig
+                if current_version == latest_version:
+                    print(f"   ✅ huawei-solar ist aktuell (installed: {current_version})")
+                    return True
+                
+                from packaging import version
 
                 # Determine the newest release that has files compatible with current Python
                 releases = pypi_data.get('releases', {})
@@ -659,7 +926,7 @@ def check_and_update_huawei_solar():
                 latest_compatible = stable_versions[0] if stable_versions else compatible_versions[0]
                 print(f"   Verfügbar (neueste kompatible): {latest_compatible}")
             else:
-                print(f"   ⚠️  PyPI nicht erreichbar (Status {response.status_code})")
+                print("   ⚠️  PyPI nicht erreichbar")
                 return True
         except Exception as e:
             print(f"   ⚠️  Konnte PyPI nicht abfragen: {e}")
@@ -688,7 +955,7 @@ def check_and_update_huawei_solar():
                 print(f"   ✅ huawei-solar ist aktuell (installed: {current_version})")
                 return True
         except Exception as e:
-            error_logger.debug(f"Version comparison failed: {e}, will attempt update")
+            error_logger.debug("Version comparison failed: %s, will attempt update", e)
 
         # Update needed
         print(f"\n📥 Aktualisiere huawei-solar auf {latest_compatible}...")
@@ -697,9 +964,13 @@ def check_and_update_huawei_solar():
         # Install the specific compatible version (pin to avoid pre-release incompatibles)
         try:
             install_target = f"huawei-solar=={latest_compatible}"
+            # Nur stderr wird für die Fehlermeldung gebraucht - pip's Fortschritts-/Abhängigkeits-
+            # ausgabe nicht in einen String puffern
             result = subprocess.run(
-                [sys.executable, '-m', 'pip', 'install', '--upgrade', install_target],
-                capture_output=True,
+                [sys.executable, '-m', 'pip', 'install', '--upgrade', '--quiet', '--no-input',
+                 '--disable-pip-version-check', install_target],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=240
             )
@@ -712,24 +983,12 @@ def check_and_update_huawei_solar():
             print(f"   ✅ huawei-solar erfolgreich aktualisiert!")
             error_logger.info(f"huawei-solar updated to version {latest_version}")
 
-            # Verify new version using pip show via the same interpreter (avoids pkg_resources cache issues)
+            # Verify new version - importlib.metadata reads the dist-info from disk
+            # on every call (no stale cache like pkg_resources, no pip subprocess)
             try:
-                proc = subprocess.run(
-                    [sys.executable, '-m', 'pip', 'show', 'huawei-solar'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if proc.returncode == 0 and proc.stdout:
-                    for line in proc.stdout.splitlines():
-                        if line.startswith('Version:'):
-                            new_version = line.split(':', 1)[1].strip()
-                            print(f"   Neue Version: {new_version}")
-                            break
-                else:
-                    # Fallback to pkg_resources
-                    import importlib
-                    importlib.reload(pkg_resources)
-                    new_version = pkg_resources.get_distribution('huawei-solar').version
-                    print(f"   Neue Version: {new_version}")
+                importlib.invalidate_caches()
+                new_version = importlib_metadata.version('huawei-solar')
+                print(f"   Neue Version: {new_version}")
             except Exception as e:
                 print(f"   ⚠️  Konnte neue Version nicht überprüfen: {e}")
 
@@ -747,10 +1006,14 @@ def check_and_update_huawei_solar():
     except Exception as e:
         print(f"   ❌ Fehler beim huawei-solar Update: {e}")
         error_logger.error(f"huawei-solar update failed: {e}")
-        error_logger.debug(f"Traceback:\n{traceback.format_exc()}")
+        error_logger.debug("Traceback:", exc_info=True)
         return True  # Continue anyway
 
 
+class InverterUnreachableError(ConnectionError):
+    """connect() gave up after INVERTER_CONNECT_MAX_ATTEMPTS failed attempts."""
+
+
 class NiceHashAPI:
     """NiceHash API mit Authentifizierung für Account-Stats."""
     
@@ -764,6 +1027,10 @@ class NiceHashAPI:
         # Prüfe ob authentifiziert
         self.authenticated = bool(self.api_key and self.api_secret and self.org_id)
         
+        # Letzte gültige Earnings (siehe get_cached_earnings)
+        self._earnings_cache = None
+        self._earnings_ts = 0
+        
     def _get_auth_header(self, method, path, query='', body=''):
         """Erstellt NiceHash API Authentifizierungs-Header."""
         import hmac
@@ -814,10 +1081,11 @@ class NiceHashAPI:
             if query:
                 url += f"?{query}"
             
-            response = requests.request(method, url, headers=headers, timeout=10)
+            response = HTTP_SESSION.request(method, url, headers=headers, timeout=10)
             
             if response.status_code == 200:
-                return response.json()
+                # Parst direkt die (bereits entpackten) Bytes
+                return json_loads(response.content)
             else:
                 error_logger.warning(f"NiceHash API {path} returned {response.status_code}: {response.text[:200]}")
                 return None
@@ -877,6 +1145,23 @@ class NiceHashAPI:
             'current_profitability': current_profitability,  # BTC/day
         }
     
+    def get_cached_earnings(self, ttl=EARNINGS_CHECK_INTERVAL):
+        """
+        get_earnings_info() mit TTL-Cache.
+        
+        Innerhalb von ttl Sekunden wird kein HTTPS-Call gemacht. Schlägt der
+        Abruf fehl, wird die letzte gültige Antwort zurückgegeben, damit ein
+        kurzer Netzwerkausfall die Anzeige nicht leert.
+        """
+        if self._earnings_cache is not None and time.time() - self._earnings_ts < ttl:
+            return self._earnings_cache
+        
+        earnings = self.get_earnings_info()
+        if earnings:
+            self._earnings_cache = earnings
+            self._earnings_ts = time.time()
+        return self._earnings_cache
+    
     def get_rig_stats(self, active_only=False, worker_name=None):
         """
         Holt detaillierte Rig-Statistiken.
@@ -948,9 +1233,8 @@ class NiceHashAPI:
     
     def get_current_rig(self):
         """Holt nur das aktuelle MANAGED Rig (von QuickMiner)."""
-        # Extrahiere Worker-Name aus NICEHASH_WALLET
-        worker_name = NICEHASH_WALLET.split('.')[-1] if '.' in NICEHASH_WALLET else None
-        rigs = self.get_rig_stats(active_only=True, worker_name=worker_name)
+        # Worker-Name aus NICEHASH_WALLET (beim Import zerlegt)
+        rigs = self.get_rig_stats(active_only=True, worker_name=NICEHASH_WORKER_NAME or None)
         return rigs[0] if rigs else None
     
     def format_btc(self, btc_amount):
@@ -974,15 +1258,187 @@ class NiceHashAPI:
             return f"{sats_per_day:.0f} sats/Tag"
 
 
+# Gemeinsamer Prozess-Snapshot: process_iter() läuft die komplette Prozesstabelle ab
+# (auf Windows CreateToolhelp32Snapshot, zig ms) - Aufrufer innerhalb von ttl Sekunden teilen sich einen Durchlauf
+_process_cache = {'t': 0.0, 'procs': []}
+
+def process_snapshot(ttl=1.0):
+    """Return a cached list of (pid, name_lower, exe) tuples, refreshed at most every ttl seconds."""
+    now = time.monotonic()
+    if _process_cache['procs'] and now - _process_cache['t'] < ttl:
+        return _process_cache['procs']
+    procs = [(p.info['pid'], (p.info['name'] or '').lower(), p.info['exe'] or '')
+             for p in psutil.process_iter(['pid', 'name', 'exe'])]
+    _process_cache.update(t=now, procs=procs)
+    return procs
+
+
+# GPU-Messwert mit denselben Attributen wie GPUtil.GPU (load 0..1, temperature °C)
+GPUReading = namedtuple("GPUReading", ["id", "load", "temperature"])
+
+
 class GPUMonitor:
     """Überwacht GPU-Nutzung durch andere Prozesse."""
     
+    # Bekannte Gaming/GPU-intensive Prozesse (OHNE python.exe - zu generisch), bereits
+    # kleingeschrieben: Prozessnamen als Set (exakter Treffer), Tool-Namen als Teilstring
+    GPU_PROCESS_NAMES = frozenset({
+        'rocketleague.exe', 'blender.exe', 'unity.exe', 'unrealeditor.exe',
+        'ue4editor.exe', 'ue5editor.exe', '3dsmax.exe', 'maya.exe', 'afterfx.exe',
+        'premiere.exe', 'davinciresolve.exe', 'obs64.exe', 'obs32.exe', 'streamlabsobs.exe',
+        # Gaming
+        'rainbowsix.exe', 'fortniteclient-win64-shipping.exe', 'cs2.exe', 'csgo.exe',
+        'valorant.exe', 'overwatch.exe', 'apex_legends.exe', 'destiny2.exe', 'gta5.exe',
+        'cyberpunk2077.exe', 'witcher3.exe',
+    })
+    GPU_PROCESS_PATTERNS = ('comfyui', 'stable-diffusion-webui', 'automatic1111', 'invokeai')
+    SD_CMDLINE_KEYWORDS = ('stable-diffusion', 'comfy', 'automatic1111', 'invoke', 'diffusers', 'torch')
+    # Teilstring-Listen als eine Alternation: ein search() in C statt any() über Python-Generator
+    GPU_PROCESS_RE = re.compile('|'.join(map(re.escape, GPU_PROCESS_PATTERNS)))
+    SD_CMDLINE_RE = re.compile('|'.join(map(re.escape, SD_CMDLINE_KEYWORDS)))
+    PID_VERDICT_CACHE_SIZE = 128
+    
     def __init__(self, gpu_id=0, threshold=10):
         self.gpu_id = gpu_id
         self.threshold = threshold
         self.excavator_pid = None
         self.current_script_pid = os.getpid()  # PID vom Controller-Script selbst
         self.mining_active = False  # Flag ob Mining gerade läuft
+        self._python_pid_verdict = OrderedDict()  # {(pid, create_time): is_stable_diffusion} - LRU, cmdline nur einmal pro Prozess prüfen
+        self._probe_backoff = 0  # Aktuelles Back-off (s) wenn GPU-Abfrage fehlschlägt
+        self._next_probe_ts = 0  # Frühester Zeitpunkt für nächste GPU-Abfrage
+        self._nvml_handles = None  # NVML Device-Handles (einmal pro Prozess), None = nicht initialisiert
+        self._gpu_cache = (0, [])  # (timestamp, gpus) - teilt Abfragen zwischen Poller und Usage-Check
+        self._nvml_proc_supported = True  # False sobald der Treiber keine Per-Prozess-Auslastung liefert
+        self._nvml_last_sample_ts = 0  # lastSeenTimeStamp für nvmlDeviceGetProcessUtilization (µs)
+        self._usage_cache = (0, None)  # (monotonic ts, Ergebnis) von get_gpu_usage_by_others
+        
+    def _read_nvml(self):
+        """
+        Liest Last/Temperatur aller GPUs direkt über NVML.
+        
+        nvmlInit() und die Device-Handles werden einmal pro Prozess geholt;
+        jede weitere Abfrage kostet nur zwei Bibliotheksaufrufe pro GPU.
+        Returns None wenn NVML nicht nutzbar ist (dann GPUtil-Fallback).
+        """
+        if not NVML_AVAILABLE or self._nvml_handles == []:
+            return None
+        
+        try:
+            if self._nvml_handles is None:
+                pynvml.nvmlInit()
+                self._nvml_handles = [
+                    pynvml.nvmlDeviceGetHandleByIndex(index)
+                    for index in range(pynvml.nvmlDeviceGetCount())
+                ]
+                # Auch freigeben, wenn der Prozess nicht über main()'s finally endet
+                atexit.register(self.shutdown)
+            return [
+                GPUReading(
+                    index,
+                    pynvml.nvmlDeviceGetUtilizationRates(handle).gpu / 100,
+                    pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU),
+                )
+                for index, handle in enumerate(self._nvml_handles)
+            ]
+        except pynvml.NVMLError as e:
+            if self._nvml_handles is None:
+                # Kein NVIDIA-Treiber/NVML - dauerhaft auf GPUtil zurückfallen
+                error_logger.debug("NVML not available (%s) - using GPUtil", e)
+                self._nvml_handles = []
+            else:
+                error_logger.debug("NVML read failed: %s", e)
+            return None
+    
+    def _nvml_usage_by_others(self):
+        """
+        Summiert die SM-Auslastung aller fremden Prozesse auf der GPU über NVML.
+        
+        Excavator und das Controller-Script selbst werden per PID übersprungen,
+        damit die eigene Mining-Last nie als Fremdnutzung zählt.
+        Returns: (usage_percent, process_name) oder None wenn NVML keine
+        Per-Prozess-Auslastung liefert (dann Gesamtlast + Prozessliste).
+        """
+        if not self._nvml_proc_supported or not self._nvml_handles or len(self._nvml_handles) <= self.gpu_id:
+            return None
+        
+        handle = self._nvml_handles[self.gpu_id]
+        try:
+            samples = pynvml.nvmlDeviceGetProcessUtilization(handle, self._nvml_last_sample_ts)
+        except pynvml.NVMLError as e:
+            if e.value == pynvml.NVML_ERROR_NOT_FOUND:
+                # Keine neuen Samples seit dem letzten Aufruf = kein Prozess aktiv
+                return 0, None
+            # z.B. NOT_SUPPORTED (WDDM/ältere Treiber) - nicht jedes Mal neu versuchen
+            error_logger.debug("NVML per-process utilization not available (%s) - using total load", e)
+            self._nvml_proc_supported = False
+            return None
+        
+        ignored_pids = {self.current_script_pid, self.excavator_pid}
+        usage_by_pid = {}
+        for sample in samples:
+            self._nvml_last_sample_ts = max(self._nvml_last_sample_ts, sample.timeStamp)
+            if sample.pid in ignored_pids:
+                continue
+            # Pro PID den höchsten Wert im Zeitfenster nehmen, nicht alle Samples aufaddieren
+            usage_by_pid[sample.pid] = max(usage_by_pid.get(sample.pid, 0), sample.smUtil)
+        
+        top_name = None
+        for pid in sorted(usage_by_pid, key=usage_by_pid.get, reverse=True):
+            try:
+                proc_name = psutil.Process(pid).name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                proc_name = f"PID {pid}"
+            # Ignoriere excavator.exe auch ohne PID (falls mehrfach gestartet)
+            if 'excavator' in proc_name.lower():
+                del usage_by_pid[pid]
+                continue
+            if top_name is None:
+                top_name = proc_name
+        
+        return min(100, sum(usage_by_pid.values())), top_name
+    
+    def shutdown(self):
+        """Gibt NVML wieder frei (falls initialisiert)."""
+        if self._nvml_handles:
+            with suppress(Exception):
+                pynvml.nvmlShutdown()
+            self._nvml_handles = None
+        
+    def get_gpus(self):
+        """
+        GPU-Last/-Temperatur (NVML, sonst GPUtil) mit exponentiellem Back-off.
+        
+        Liefert keine GPU-Abfrage Ergebnisse (nvidia-smi fehlt, Treiber hängt),
+        wird sie immer seltener wiederholt (bis PROBE_BACKOFF_MAX) und bis
+        dahin eine leere Liste zurückgegeben.
+        """
+        now = time.time()
+        cached_ts, cached_gpus = self._gpu_cache
+        if now - cached_ts < GPU_CACHE_TTL:
+            return cached_gpus
+        if now < self._next_probe_ts:
+            return []
+        
+        gpus = self._read_nvml()
+        if gpus is None:
+            try:
+                # Erst hier importieren: mit NVML wird GPUtil (und dessen distutils-Import) nie geladen
+                import GPUtil
+                gpus = GPUtil.getGPUs()
+            except Exception as e:
+                error_logger.debug("GPUtil probe failed: %s", e)
+                gpus = []
+        
+        if gpus:
+            self._probe_backoff = 0
+            self._next_probe_ts = 0
+            self._gpu_cache = (now, gpus)
+        else:
+            self._probe_backoff = min(PROBE_BACKOFF_MAX, max(PROBE_BACKOFF_INITIAL, 2 * self._probe_backoff))
+            self._next_probe_ts = now + self._probe_backoff
+            error_logger.warning(f"No GPU data available - next probe in {self._probe_backoff}s")
+        return gpus
         
     def set_excavator_pid(self, pid):
         """Speichert PID von Excavator um ihn zu ignorieren."""
@@ -995,13 +1451,32 @@ class GPUMonitor:
     def get_gpu_usage_by_others(self):
         """
         Prüft ob andere Prozesse (außer Excavator und Mining-Script) die GPU nutzen.
+        Innerhalb von GPU_CACHE_TTL wird das letzte Ergebnis wiederverwendet.
         Returns: (is_gpu_busy, usage_percent, process_name)
         """
+        now = time.monotonic()
+        cached_ts, cached_result = self._usage_cache
+        if cached_result is not None and now - cached_ts < GPU_CACHE_TTL:
+            return cached_result
+        result = self._scan_gpu_usage_by_others()
+        self._usage_cache = (now, result)
+        return result
+    
+    def _scan_gpu_usage_by_others(self):
+        """Eigentliche Prüfung für get_gpu_usage_by_others (NVML bzw. Gesamtlast + Prozessliste)."""
         try:
-            gpus = GPUtil.getGPUs()
+            gpus = self.get_gpus()
             if not gpus or len(gpus) <= self.gpu_id:
                 return False, 0, None
             
+            # NVML kann die Last pro Prozess zuordnen - dann zählt nur fremde Last
+            others = self._nvml_usage_by_others()
+            if others is not None:
+                others_load, proc_name = others
+                if others_load >= self.threshold:
+                    return True, others_load, proc_name
+                return False, others_load, None
+            
             gpu = gpus[self.gpu_id]
             total_gpu_load = gpu.load * 100  # In Prozent
             
@@ -1009,39 +1484,8 @@ class GPUMonitor:
             if total_gpu_load < self.threshold:
                 return False, total_gpu_load, None
             
-            # Bekannte Gaming/GPU-intensive Prozesse (OHNE python.exe - zu generisch)
-            gpu_intensive_processes = [
-                'RocketLeague.exe',
-                'ComfyUI',
-                'stable-diffusion-webui',
-                'AUTOMATIC1111',
-                'InvokeAI',
-                'blender.exe',
-                'Unity.exe',
-                'UnrealEditor.exe',
-                'UE4Editor.exe',
-                'UE5Editor.exe',
-                '3dsmax.exe',
-                'maya.exe',
-                'AfterFX.exe',
-                'Premiere.exe',
-                'DaVinciResolve.exe',
-                'obs64.exe',
-                'obs32.exe',
-                'StreamlabsOBS.exe',
-                # Gaming
-                'RainbowSix.exe',
-                'FortniteClient-Win64-Shipping.exe',
-                'cs2.exe',
-                'csgo.exe',
-                'valorant.exe',
-                'Overwatch.exe',
-                'apex_legends.exe',
-                'destiny2.exe',
-                'GTA5.exe',
-                'Cyberpunk2077.exe',
-                'witcher3.exe',
-            ]
+            gpu_process_names = self.GPU_PROCESS_NAMES
+            gpu_process_re = self.GPU_PROCESS_RE
             
             # PIDs die wir ignorieren müssen
             ignored_pids = {self.current_script_pid}
@@ -1049,38 +1493,49 @@ class GPUMonitor:
                 ignored_pids.add(self.excavator_pid)
             
             # Suche nach bekannten GPU-Prozessen
-            for proc in psutil.process_iter(['pid', 'name', 'exe']):
-                try:
-                    proc_pid = proc.info['pid']
-                    proc_name = proc.info['name']
-                    
-                    # Ignoriere Mining-relevante Prozesse
-                    if proc_pid in ignored_pids:
-                        continue
-                    
-                    # Ignoriere excavator.exe auch ohne PID (falls mehrfach gestartet)
-                    if 'excavator' in proc_name.lower():
+            for proc_pid, name_lower, _exe in process_snapshot():
+                # Ignoriere Mining-relevante Prozesse
+                if proc_pid in ignored_pids:
+                    continue
+                
+                # Ignoriere excavator.exe auch ohne PID (falls mehrfach gestartet)
+                if 'excavator' in name_lower:
+                    continue
+                
+                # Prüfe ob bekannter GPU-Prozess läuft
+                if name_lower in gpu_process_names or gpu_process_re.search(name_lower):
+                    # Wenn GPU-Last hoch ist UND ein bekannter Prozess läuft
+                    if total_gpu_load > self.threshold:
+                        return True, total_gpu_load, name_lower
+                
+                # Special case: python.exe - check if it's NOT our script
+                if 'python' in name_lower and total_gpu_load > 30:
+                    # Command line nur beim ersten Sichten des Prozesses prüfen (teuer auf Windows);
+                    # create_time im Schlüssel erkennt wiederverwendete PIDs
+                    try:
+                        proc = psutil.Process(proc_pid)
+                        key = (proc_pid, proc.create_time())
+                    except psutil.NoSuchProcess:
                         continue
-                    
-                    # Prüfe ob bekannter GPU-Prozess läuft
-                    if any(known.lower() in proc_name.lower() for known in gpu_intensive_processes):
-                        # Wenn GPU-Last hoch ist UND ein bekannter Prozess läuft
-                        if total_gpu_load > self.threshold:
-                            return True, total_gpu_load, proc_name
-                    
-                    # Special case: python.exe - check if it's NOT our script
-                    if 'python' in proc_name.lower() and total_gpu_load > 30:
+                    except psutil.AccessDenied:
+                        key = (proc_pid, None)
+                    is_sd = self._python_pid_verdict.get(key)
+                    if is_sd is None:
                         # Check command line for Stable Diffusion indicators
                         try:
-                            cmdline = ' '.join(proc.cmdline())
-                            sd_keywords = ['stable-diffusion', 'comfy', 'automatic1111', 'invoke', 'diffusers', 'torch']
-                            if any(kw in cmdline.lower() for kw in sd_keywords):
-                                return True, total_gpu_load, f"Python (Stable Diffusion)"
-                        except (psutil.AccessDenied, psutil.NoSuchProcess):
-                            pass
-                            
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+                            cmdline = ' '.join(proc.cmdline()).lower()
+                            is_sd = self.SD_CMDLINE_RE.search(cmdline) is not None
+                        except psutil.AccessDenied:
+                            is_sd = False
+                        except psutil.NoSuchProcess:
+                            continue
+                        self._python_pid_verdict[key] = is_sd
+                        if len(self._python_pid_verdict) > self.PID_VERDICT_CACHE_SIZE:
+                            self._python_pid_verdict.popitem(last=False)
+                    else:
+                        self._python_pid_verdict.move_to_end(key)
+                    if is_sd:
+                        return True, total_gpu_load, f"Python (Stable Diffusion)"
             
             # IMPORTANT: When mining is active, high GPU load is NORMAL
             # Only pause at >80% AND mining is NOT active
@@ -1092,8 +1547,8 @@ class GPUMonitor:
             
         except Exception as e:
             error_logger.error(f"GPU monitoring error: {e}")
-            error_logger.debug(f"Traceback:\n{traceback.format_exc()}")
-            error_logger.debug(f"GPU ID: {self.gpu_id}, Threshold: {self.threshold}, Mining Active: {self.mining_active}")
+            error_logger.debug("Traceback:", exc_info=True)
+            error_logger.debug("GPU ID: %s, Threshold: %s, Mining Active: %s", self.gpu_id, self.threshold, self.mining_active)
             print(f"⚠️ {t('gpu_monitoring_error')}: {e}")
             return False, 0, None
 
@@ -1101,27 +1556,33 @@ class GPUMonitor:
 class QuickMinerAPI:
     """API Wrapper für NiceHash QuickMiner (REST API auf Port 18000)."""
     
-    def __init__(self, host="localhost", port=18000):
+    def __init__(self, host="localhost", port=18000, stop_event=None):
         self.host = host
         self.port = port
         self.base_url = f"http://{host}:{port}"
         self.consecutive_errors = 0
-        self.last_successful_command = None
+        self.last_successful_command = None  # time.monotonic() des letzten erfolgreichen Kommandos
         self.miner_type = "QuickMiner"
+        self.stop_event = stop_event or threading.Event()  # Gesetzt beim Beenden: Retry-Pausen brechen sofort ab
         # Get API auth token from config
         self.auth_token = self._get_auth_token()
     
     def _get_auth_token(self):
         """Read API auth token from QuickMiner config."""
-        try:
+        with suppress(Exception):
             config_path = os.path.join(os.path.dirname(QUICKMINER_PATH), "nhqm.conf")
             if os.path.exists(config_path):
                 with open(config_path, 'r') as f:
                     config = json.load(f)
                     return config.get("watchDogAPIAuth", "")
-        except:
-            pass
         return ""
+    
+    def close(self):
+        """REST-API über HTTP_SESSION - keine eigene Verbindung zu schließen (gleiche Signatur wie ExcavatorAPI)."""
+    
+    def send_batch(self, commands):
+        """REST-API kennt kein Pipelining - Kommandos nacheinander senden (gleiche Signatur wie ExcavatorAPI)."""
+        return [self.send_command(method, params) for method, params in commands]
         
     def send_command(self, method, params=None, retries=3):
         """
@@ -1174,11 +1635,11 @@ class QuickMinerAPI:
         """Holt Worker-Info von QuickMiner via /workers endpoint."""
         try:
             headers = {"Authorization": self.auth_token} if self.auth_token else {}
-            response = requests.get(f"{self.base_url}/workers", headers=headers, timeout=5)
+            response = HTTP_SESSION.get(f"{self.base_url}/workers", headers=headers, timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 self.consecutive_errors = 0
-                self.last_successful_command = datetime.now()
+                self.last_successful_command = time.monotonic()
                 return data  # Already in correct format
         except Exception as e:
             self.consecutive_errors += 1
@@ -1190,9 +1651,9 @@ class QuickMinerAPI:
         """Holt Miner-Info via /info endpoint."""
         try:
             headers = {"Authorization": self.auth_token} if self.auth_token else {}
-            response = requests.get(f"{self.base_url}/info", headers=headers, timeout=5)
+            response = HTTP_SESSION.get(f"{self.base_url}/info", headers=headers, timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 return data  # Already in correct format
         except Exception as e:
             error_logger.warning(f"QuickMiner info error: {e}")
@@ -1202,16 +1663,14 @@ class QuickMinerAPI:
     
     def is_mining(self):
         """Prüft ob QuickMiner aktiv mined via /workers endpoint."""
-        try:
+        with suppress(Exception):
             headers = {"Authorization": self.auth_token} if self.auth_token else {}
-            response = requests.get(f"{self.base_url}/workers", headers=headers, timeout=5)
+            response = HTTP_SESSION.get(f"{self.base_url}/workers", headers=headers, timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 # Check if there are any active workers
                 workers = data.get("workers", [])
                 return len(workers) > 0
-        except:
-            pass
         return False
     
     def get_info(self):
@@ -1227,17 +1686,22 @@ class QuickMinerAPI:
         """Get list of all GPU devices from QuickMiner."""
         try:
             headers = {"Authorization": self.auth_token} if self.auth_token else {}
-            response = requests.get(f"{self.base_url}/devices_cuda", headers=headers, timeout=5)
+            response = HTTP_SESSION.get(f"{self.base_url}/devices_cuda", headers=headers, timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 return data.get("devices", [])
         except Exception as e:
             error_logger.warning(f"QuickMiner get devices error: {e}")
         return []
     
-    def get_hashrate(self):
-        """Returns total hashrate and per-GPU breakdown."""
-        workers = self.get_workers()
+    def get_hashrate(self, workers=None):
+        """
+        Returns total hashrate and per-GPU breakdown.
+        
+        Pass an already fetched worker list to avoid another worker.list round-trip.
+        """
+        if workers is None:
+            workers = self.get_workers()
         total_hashrate = 0
         gpu_hashrates = {}
         
@@ -1251,9 +1715,14 @@ class QuickMinerAPI:
         
         return total_hashrate, gpu_hashrates
     
-    def get_current_algorithms(self):
-        """Returns dict of device_id -> algorithm name for all active workers."""
-        workers = self.get_workers()
+    def get_current_algorithms(self, workers=None):
+        """
+        Returns dict of device_id -> algorithm name for all active workers.
+        
+        Pass an already fetched worker list to avoid another worker.list round-trip.
+        """
+        if workers is None:
+            workers = self.get_workers()
         algorithms = {}
         
         if workers:
@@ -1354,9 +1823,9 @@ class QuickMinerAPI:
             last_err = None
             for attempt in range(retries):
                 try:
-                    response = requests.get(f"{self.base_url}/enable", params=params, headers=headers, timeout=5)
+                    response = HTTP_SESSION.get(f"{self.base_url}/enable", params=params, headers=headers, timeout=5)
                     if response.status_code == 200:
-                        result = response.json()
+                        result = json_loads(response.content)
                         if result.get("error") is None:
                             return True
                         else:
@@ -1368,7 +1837,8 @@ class QuickMinerAPI:
                     last_err = str(e)
 
                 # small backoff between attempts
-                time.sleep(1 + attempt)
+                if self.stop_event.wait(1 + attempt):
+                    return False
 
             error_logger.warning(f"Enable device failed after {retries} retries: {last_err}")
             return False
@@ -1391,10 +1861,10 @@ class QuickMinerAPI:
                 return False
             
             headers = {"Authorization": self.auth_token} if self.auth_token else {}
-            response = requests.get(f"{self.base_url}/disable", params={"id": uuid}, headers=headers, timeout=5)
+            response = HTTP_SESSION.get(f"{self.base_url}/disable", params={"id": uuid}, headers=headers, timeout=5)
             
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
                 return result.get("error") is None
             return False
         except Exception as e:
@@ -1405,9 +1875,9 @@ class QuickMinerAPI:
         """Get GPU UUID from numeric device ID."""
         try:
             headers = {"Authorization": self.auth_token} if self.auth_token else {}
-            response = requests.get(f"{self.base_url}/devices_cuda", headers=headers, timeout=5)
+            response = HTTP_SESSION.get(f"{self.base_url}/devices_cuda", headers=headers, timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 devices = data.get("devices", [])
                 # Device ID might be string or int
                 device_id_str = str(device_id)
@@ -1429,7 +1899,7 @@ class QuickMinerAPI:
                 if "algorithms" in workers[0] and workers[0]["algorithms"]:
                     return workers[0]["algorithms"][0].get("name", "")
             return ""
-        except:
+        except Exception:
             return ""
     
     def set_power_limit(self, device_id, tdp_percent=None, power_watts=None):
@@ -1476,7 +1946,7 @@ class QuickMinerAPI:
                 error_logger.warning("Must specify either tdp_percent or power_watts")
                 return False
             
-            response = requests.get(
+            response = HTTP_SESSION.get(
                 f"{self.base_url}/setpowerlimit",
                 params=params,
                 headers=headers,
@@ -1484,7 +1954,7 @@ class QuickMinerAPI:
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
                 if result.get("error") is None:
                     # Calculate effective TDP for display
                     device_info = self._get_device_info(device_id)
@@ -1510,9 +1980,9 @@ class QuickMinerAPI:
         """Get detailed info for a specific device."""
         try:
             headers = {"Authorization": self.auth_token} if self.auth_token else {}
-            response = requests.get(f"{self.base_url}/devices_cuda", headers=headers, timeout=5)
+            response = HTTP_SESSION.get(f"{self.base_url}/devices_cuda", headers=headers, timeout=5)
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 devices = data.get("devices", [])
                 device_id_str = str(device_id)
                 for device in devices:
@@ -1689,25 +2159,176 @@ class QuickMinerAPI:
             
         except Exception as e:
             error_logger.error(f"Thermal throttling error: {e}")
-            error_logger.debug(f"Traceback:\n{traceback.format_exc()}")
+            error_logger.debug("Traceback:", exc_info=True)
             return {}
 
 
 class ExcavatorAPI:
     """API Wrapper für Excavator Miner."""
     
-    def __init__(self, host="127.0.0.1", port=3456):
+    def __init__(self, host="127.0.0.1", port=3456, stop_event=None):
         self.host = host
         self.port = port
         self.cmd_id = 1
+        self.stop_event = stop_event or threading.Event()  # Gesetzt beim Beenden: Retry-Pausen brechen sofort ab
         self.consecutive_errors = 0
-        self.last_successful_command = None
+        self.last_successful_command = None  # time.monotonic() des letzten erfolgreichen Kommandos
         self.miner_type = "Excavator"
+        self._probe_backoff = 0  # Aktuelles Back-off (s) nach vielen Fehlern
+        self._next_probe_ts = 0  # Frühester Zeitpunkt für nächsten API-Versuch
+        self._sock = None  # Persistente TCP-Verbindung (None = nicht verbunden)
+        self._rfile = None  # Gepufferter Reader auf self._sock
+        self._sock_lock = threading.Lock()  # send_command läuft auch aus to_thread()-Workern
+    
+    def _connect(self):
+        """Öffnet die persistente TCP-Verbindung zur API."""
+        # QuickMiner lauscht auf IPv6 ([::1]:18000), Standalone-Excavator auf IPv4 (127.0.0.1:3456)
+        family = socket.AF_INET  # Default: IPv4
+        if self.host == "localhost" or self.host == "::1":
+            family = socket.AF_INET6
+            connect_host = "::1" if self.host == "localhost" else self.host
+        else:
+            connect_host = self.host
+        
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.settimeout(10)  # Erhöht von 5 auf 10 Sekunden
+        # Kleine JSON-RPC Nachrichten: Nagle aus (sonst ~40ms Verzögerung auf Windows)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Vor connect() setzen, damit das TCP-Fenster gleich passend ausgehandelt wird
+        # (worker.list mit vielen GPUs kommt so in einem Stück)
+        with suppress(OSError):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 256 * 1024)
+        try:
+            sock.connect((connect_host, self.port))
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        # TCP kann mitten in der Zeile splitten, daher gepufferter Reader
+        self._rfile = sock.makefile('rb', buffering=65536)
+    
+    def close(self):
+        """Schließt die persistente Verbindung (nächstes Kommando verbindet neu)."""
+        if self._rfile is not None:
+            with suppress(OSError):
+                self._rfile.close()
+        if self._sock is not None:
+            with suppress(OSError):
+                self._sock.close()
+        self._sock = None
+        self._rfile = None
+    
+    def _roundtrip(self, message):
+        """
+        Schickt eine JSON-Zeile über die persistente Verbindung und liest genau eine Antwortzeile.
+        
+        Hat die API die Verbindung inzwischen geschlossen (Excavator-Neustart,
+        Idle-Timeout), wird einmal neu verbunden und erneut gesendet.
+        """
+        for reused in (self._sock is not None, False):
+            if self._sock is None:
+                self._connect()
+            try:
+                self._sock.sendall(message)
+                response = self._rfile.readline(EXCAVATOR_MAX_RESPONSE_BYTES)
+            except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+                self.close()
+                if reused:
+                    continue
+                raise
+            except Exception:
+                # Timeout o.ä.: Antwort kann noch unterwegs sein - Verbindung nicht weiterverwenden
+                self.close()
+                raise
+            if response or not reused:
+                if not response:
+                    self.close()
+                return response
+            # EOF auf wiederverwendeter Verbindung: Gegenseite hat geschlossen
+            self.close()
+        return b""
+    
+    def send_batch(self, commands):
+        """
+        Sendet mehrere Kommandos gepipelined: alle Zeilen in einem Write, dann N Antwortzeilen lesen.
+        
+        Excavator arbeitet die Zeilen einer Verbindung der Reihe nach ab; die Antworten
+        werden über ihre "id" zugeordnet (1×RTT statt N×RTT).
+        commands: Liste von (method, params). Returns: Antworten in derselben Reihenfolge (None = keine Antwort).
+        """
+        if not commands:
+            return []
+        if self.consecutive_errors >= EXCAVATOR_BACKOFF_AFTER_ERRORS and time.time() < self._next_probe_ts:
+            return [None] * len(commands)
+        
+        ids = list(range(self.cmd_id, self.cmd_id + len(commands)))
+        self.cmd_id += len(commands)
+        payload = b"".join(
+            json_line({"id": cmd_id, "method": method, "params": params if params is not None else []})
+            for cmd_id, (method, params) in zip(ids, commands)
+        )
+        
+        responses = {}
+        try:
+            with self._sock_lock:
+                for reused in (self._sock is not None, False):
+                    if self._sock is None:
+                        self._connect()
+                    try:
+                        self._sock.sendall(payload)
+                        first = self._rfile.readline(EXCAVATOR_MAX_RESPONSE_BYTES)
+                    except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+                        first = b""
+                    if first:
+                        break
+                    # Alte Verbindung war tot, bevor etwas verarbeitet wurde - einmal neu verbinden
+                    self.close()
+                    if not reused:
+                        raise ConnectionError("no response")
+                
+                line = first
+                for position in range(len(ids)):
+                    if position:
+                        line = self._rfile.readline(EXCAVATOR_MAX_RESPONSE_BYTES)
+                    if not line:
+                        self.close()
+                        break
+                    response = json_loads(line)
+                    responses[response.get("id", ids[position])] = response
+        except Exception as e:
+            # Kein erneutes Senden: bereits verarbeitete worker.add dürfen nicht doppelt laufen
+            self.close()
+            error_logger.error(f"Excavator API batch error: {e}")
+            error_logger.debug("Batch: %s, answered: %s/%s", [method for method, _ in commands], len(responses), len(ids))
+        
+        if responses:
+            self.consecutive_errors = 0
+            self._probe_backoff = 0
+            self.last_successful_command = time.monotonic()
+        else:
+            # Keine einzige Antwort: zählt wie ein fehlgeschlagenes send_command,
+            # damit check_excavator_health eine tote API auch bei Batch-Aufrufen erkennt
+            self._record_failure()
+            error_logger.error(f"Excavator API batch without response ({self.consecutive_errors}x)")
+        return [responses.get(cmd_id) for cmd_id in ids]
+    
+    def _record_failure(self):
+        """Count a failed API call and arm the probe back-off after repeated failures."""
+        self.consecutive_errors += 1
+        if self.consecutive_errors >= EXCAVATOR_BACKOFF_AFTER_ERRORS:
+            self._probe_backoff = min(PROBE_BACKOFF_MAX, max(PROBE_BACKOFF_INITIAL, 2 * self._probe_backoff))
+            self._next_probe_ts = time.time() + self._probe_backoff
         
     def send_command(self, method, params=None, retries=3):
         """Sendet Kommando an Excavator API mit Retry-Logik."""
         if params is None:
             params = []
+        
+        # Excavator dauerhaft nicht erreichbar: nicht jeden Tick erneut versuchen.
+        # (Reset von consecutive_errors, z.B. beim Neustart, hebt das Back-off auf.)
+        if self.consecutive_errors >= EXCAVATOR_BACKOFF_AFTER_ERRORS and time.time() < self._next_probe_ts:
+            return None
             
         cmd = {
             "id": self.cmd_id,
@@ -1716,86 +2337,67 @@ class ExcavatorAPI:
         }
         self.cmd_id += 1
         
+        message = json_line(cmd)
+        
         last_error = None
         for attempt in range(retries):
             try:
-                # Verbinde via TCP
-                import socket
-                
-                # Try to determine if we need IPv6 (for QuickMiner on [::1]:18000)
-                # or IPv4 (for standalone Excavator on 127.0.0.1:3456)
-                family = socket.AF_INET  # Default: IPv4
-                if self.host == "localhost" or self.host == "::1":
-                    # QuickMiner uses IPv6
-                    family = socket.AF_INET6
-                    connect_host = "::1" if self.host == "localhost" else self.host
-                else:
-                    connect_host = self.host
-                
-                sock = socket.socket(family, socket.SOCK_STREAM)
-                sock.settimeout(10)  # Erhöht von 5 auf 10 Sekunden
-                sock.connect((connect_host, self.port))
-                
-                # Sende Kommando
-                message = json.dumps(cmd) + "\n"
-                sock.sendall(message.encode())
-                
-                # Empfange Antwort
-                response = b""
-                while True:
-                    chunk = sock.recv(1024)
-                    if not chunk or b"\n" in chunk:
-                        response += chunk
-                        break
-                    response += chunk
-                
-                sock.close()
+                # Eine persistente Verbindung statt Connect/Close pro Kommando;
+                # der Lock hält Request und Antwortzeile zusammen.
+                with self._sock_lock:
+                    response = self._roundtrip(message)
                 
-                # Parse JSON
-                response_str = response.decode().strip()
-                if response_str:
+                # Parse JSON (Bytes direkt, ohne decode()/strip()-Kopien)
+                if response.strip():
                     self.consecutive_errors = 0
-                    self.last_successful_command = datetime.now()
-                    return json.loads(response_str)
+                    self._probe_backoff = 0
+                    self.last_successful_command = time.monotonic()
+                    return json_loads(response)
                 return None
                 
             except ConnectionRefusedError as e:
                 last_error = f"Verbindung verweigert (Port {self.port})"
                 if attempt < retries - 1:
-                    time.sleep(1)  # Warte 1s vor Retry
+                    if self.stop_event.wait(1):  # Warte 1s vor Retry
+                        return None
                     continue
             except socket.timeout:
                 last_error = f"Timeout nach 10s"
                 if attempt < retries - 1:
-                    time.sleep(0.5)
+                    if self.stop_event.wait(0.5):
+                        return None
                     continue
             except Exception as e:
                 last_error = str(e)
                 if attempt < retries - 1:
-                    time.sleep(0.5)
+                    if self.stop_event.wait(0.5):
+                        return None
                     continue
         
         # All retries failed
-        self.consecutive_errors += 1
+        self._record_failure()
         
         # Detailed error logging
         error_logger.error(f"Excavator API error ({self.consecutive_errors}x): {last_error}")
-        error_logger.debug(f"Method: {method}, Params: {params}, Retries: {retries}")
-        error_logger.debug(f"Host: {self.host}, Port: {self.port}, Command ID: {self.cmd_id-1}")
-        error_logger.debug(f"Last successful command: {self.last_successful_command}")
+        error_logger.debug("Method: %s, Params: %s, Retries: %s", method, params, retries)
+        error_logger.debug("Host: %s, Port: %s, Command ID: %s", self.host, self.port, self.cmd_id-1)
+        if self.last_successful_command is not None:
+            error_logger.debug("Last successful command: %.1fs ago", time.monotonic() - self.last_successful_command)
+        else:
+            error_logger.debug("Last successful command: never")
 
         # If Excavator process is available, log PID/ memory/CPU for diagnostics
         try:
             if hasattr(self, 'controller') and self.controller and self.controller.excavator_process:
                 pid = self.controller.excavator_process.pid
-                error_logger.debug(f"Excavator PID: {pid}")
+                error_logger.debug("Excavator PID: %s", pid)
                 try:
                     p = psutil.Process(pid)
                     mem = p.memory_info().rss / (1024*1024)
                     cpu = p.cpu_percent(interval=0.1)
-                    error_logger.debug(f"Excavator Memory: {mem:.1f} MB, CPU%: {cpu}")
+                    error_logger.debug("Excavator Memory: %.1f MB, CPU%%: %s", mem, cpu)
                 except Exception as pe:
-                    error_logger.debug(f"Could not read excavator process stats: {pe}")
+                    error_logger.debug("Could not read excavator process stats: %s", pe)
         except Exception:
             pass
         
@@ -1808,12 +2410,15 @@ class ExcavatorAPI:
         
         return None
     
-    def is_mining(self):
-        """Prüft ob aktiv gemined wird."""
-        result = self.send_command("worker.list")
-        if result and "workers" in result:
-            return len(result["workers"]) > 0
-        return False
+    def is_mining(self, workers=None):
+        """
+        Prüft ob aktiv gemined wird.
+        
+        Eine bereits geholte Worker-Liste spart den worker.list Round-Trip.
+        """
+        if workers is None:
+            workers = self.get_workers()
+        return len(workers) > 0
     
     def get_workers(self):
         """Gibt Liste aller Worker zurück."""
@@ -1823,41 +2428,49 @@ class ExcavatorAPI:
         return []
     
     def start_mining(self, device_ids, algorithm, stratum_url, wallet):
-        """Start mining on multiple GPUs (if not already active)."""
+        """
+        Start mining on multiple GPUs.
+        
+        The controller tracks mining state itself (self.is_mining), so no
+        extra worker.list round-trip is made before configuring.
+        subscribe and algorithm.add share one round-trip; the worker.add
+        batch is only sent once both succeeded. A failed setup is cleared
+        again so a retry starts from a clean Excavator.
+        """
         try:
-            # Check if already mining
-            if self.is_mining():
-                print(f"ℹ️  {t('mining_already_running')}")
-                return True
-                
             print(f"🔧 {t('configuring_mining')}")
             
+            # subscribe + algorithm.add in EINEM Round-Trip
+            subscribed, algo_added = self.send_batch(
+                [("subscribe", [stratum_url, wallet]), ("algorithm.add", [algorithm])]
+            )
+            
             # 1. Subscribe to stratum
-            result = self.send_command("subscribe", [stratum_url, wallet])
-            if result is None:
+            if subscribed is None:
                 print(f"❌ {t('subscribe_no_response')}")
+                self._clear_mining_setup()
                 return False
-            if result.get("error"):
-                print(f"❌ {t('subscribe_error')}: {result['error']}")
+            if subscribed.get("error"):
+                print(f"❌ {t('subscribe_error')}: {subscribed['error']}")
+                self._clear_mining_setup()
                 return False
             print(f"   ✓ {t('subscribe_success')}")
             
-            # 2. Add algorithm with fallback support
-            result = self.send_command("algorithm.add", [algorithm])
-            if result is None:
+            # 2. Add algorithm
+            if algo_added is None:
                 print(f"❌ {t('algorithm_no_response')}")
+                self._clear_mining_setup()
                 return False
-            if result.get("error"):
-                error_msg = result.get("error", "")
-                print(f"❌ {t('algorithm_error')}: {error_msg}")
-                
+            if algo_added.get("error"):
+                print(f"❌ {t('algorithm_error')}: {algo_added['error']}")
+                self._clear_mining_setup()
                 return False
             print(f"   ✓ {t('algorithm_added', algo=algorithm)}")
             
-            # 3. Add worker for each GPU
+            # 3. Add worker for each GPU - alle worker.add in einem Round-Trip
+            results = self.send_batch([("worker.add", [algorithm, device_id]) for device_id in device_ids])
             workers_started = 0
-            for device_id in device_ids:
-                result = self.send_command("worker.add", [algorithm, device_id])
+            for device_id, result in zip(device_ids, results):
                 if result is None:
                     print(f"❌ {t('worker_no_response')} (GPU {device_id})")
                     continue
@@ -1875,37 +2488,52 @@ class ExcavatorAPI:
                 return True
             else:
                 print(f"   ❌ Keine GPUs gestartet")
+                self._clear_mining_setup()
                 return False
             
         except Exception as e:
             print(f"❌ {t('start_error')}: {e}")
             return False
     
+    def _clear_mining_setup(self):
+        """
+        Undo a partial start_mining() (workers, algorithm, subscription).
+        
+        Without this a half-configured Excavator keeps e.g. a loaded algorithm
+        without pool, and the next attempt stacks duplicate workers.
+        """
+        self.send_batch([("worker.clear", None), ("algorithm.clear", None), ("unsubscribe", None)])
+    
     def stop_mining(self):
-        """Stop mining completely (all workers and algorithms)."""
+        """
+        Stop mining completely (all workers and algorithms).
+        
+        Clearing is idempotent, so no worker.list pre-check is needed.
+        """
         try:
-            # Check if mining at all
-            if not self.is_mining():
-                return True
-                
             print(f"🔧 {t('stopping_mining')}")
             
+            # Alle drei Kommandos in einem Round-Trip (Excavator führt sie der Reihe nach aus)
+            cleared_workers, cleared_algos, unsubscribed = self.send_batch(
+                [("worker.clear", None), ("algorithm.clear", None), ("unsubscribe", None)]
+            )
+            
             # 1. Clear all workers
-            result = self.send_command("worker.clear")
+            result = cleared_workers
             if result and result.get("error"):
                 print(f"⚠️  {t('worker_error')}: {result['error']}")
             else:
                 print(f"   ✓ {t('workers_cleared')}")
             
             # 2. Clear all algorithms
-            result = self.send_command("algorithm.clear")
+            result = cleared_algos
             if result and result.get("error"):
                 print(f"⚠️  {t('algorithm_error')}: {result['error']}")
             else:
                 print(f"   ✓ {t('algorithms_cleared')}")
             
             # 3. Disconnect from stratum
-            result = self.send_command("unsubscribe")
+            result = unsubscribed
             if result and result.get("error"):
                 print(f"⚠️  {t('unsubscribe_error')}: {result['error']}")
             else:
@@ -1924,7 +2552,7 @@ class ExcavatorAPI:
             if result and not result.get("error"):
                 return True
             return False
-        except:
+        except Exception:
             return False
     
     def resume_worker(self, worker_id="0"):
@@ -1935,16 +2563,46 @@ class ExcavatorAPI:
             if result and not result.get("error"):
                 return True
             return False
-        except:
+        except Exception:
             return False
     
     def get_info(self):
         """Holt Excavator Info."""
         return self.send_command("info")
     
-    def get_hashrate(self):
-        """Returns total hashrate and per-GPU breakdown."""
-        workers = self.get_workers()
+    def wait_ready(self, timeout=30):
+        """
+        Wartet bis die API Verbindungen annimmt und holt dann einmal die Info.
+        
+        Probt nur den TCP-Connect alle 100 ms (Connection refused kommt sofort zurück)
+        statt jede Sekunde ein volles info-Kommando mit Retries und Fehlerzählung.
+        Die erfolgreiche Verbindung bleibt als persistente Verbindung offen.
+        Returns: Info-Dict oder None nach timeout Sekunden.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._sock_lock:
+                if self._sock is None:
+                    with suppress(OSError):
+                        self._connect()
+                connected = self._sock is not None
+            if connected:
+                self._next_probe_ts = 0  # Port ist offen - ein laufendes Back-off nicht abwarten
+                info = self.get_info()
+                if info:
+                    return info
+            if self.stop_event.wait(0.1):
+                return None
+        return None
+    
+    def get_hashrate(self, workers=None):
+        """
+        Returns total hashrate and per-GPU breakdown.
+        
+        Pass an already fetched worker list to avoid another worker.list round-trip.
+        """
+        if workers is None:
+            workers = self.get_workers()
         total_hashrate = 0
         gpu_hashrates = {}
         
@@ -1958,9 +2616,14 @@ class ExcavatorAPI:
         
         return total_hashrate, gpu_hashrates
     
-    def get_current_algorithms(self):
-        """Returns dict of device_id -> algorithm name for all active workers."""
-        workers = self.get_workers()
+    def get_current_algorithms(self, workers=None):
+        """
+        Returns dict of device_id -> algorithm name for all active workers.
+        
+        Pass an already fetched worker list to avoid another worker.list round-trip.
+        """
+        if workers is None:
+            workers = self.get_workers()
         algorithms = {}
         
         if workers:
@@ -1973,18 +2636,17 @@ class ExcavatorAPI:
         return algorithms
 
 
-def get_available_miner():
+def get_available_miner(stop_event=None):
     """
     Automatische Miner-Erkennung.
     
     Priorität: QuickMiner > Excavator
+    stop_event wird an die API weitergereicht, damit Retry-Pausen beim Beenden sofort abbrechen.
     
     WICHTIG: QuickMiner managed alles selbst (Algorithmen, Workers, etc.)!
     QuickMiner startet excavator.exe mit JSON-RPC API auf Port 18000.
     Wir können QuickMiner's excavator DIREKT über die API steuern!
     """
-    import psutil
-    
     # 1. Prüfe ob QuickMiner-Prozess läuft (und damit excavator auf Port 18000)
     quickminer_running = False
     excavator_running = False
@@ -2006,7 +2668,7 @@ def get_available_miner():
         print(f"   → Solar-basierte Start/Stop Steuerung aktiv")
         print(f"")
         # QuickMiner uses HTTP REST API, not JSON-RPC TCP sockets
-        return QuickMinerAPI(QUICKMINER_API_HOST, QUICKMINER_API_PORT)
+        return QuickMinerAPI(QUICKMINER_API_HOST, QUICKMINER_API_PORT, stop_event)
     
     # 3. Fallback: Standalone Excavator auf Port 3456
     if excavator_running and not quickminer_running:
@@ -2014,7 +2676,7 @@ def get_available_miner():
         print(f"   ⚠️  HINWEIS: Standalone Excavator unterstützt KEINE RTX 5000 Serie!")
         print(f"   💡 Empfehlung: Verwende QuickMiner für bessere Kompatibilität")
         print(f"")
-        return ExcavatorAPI(EXCAVATOR_API_HOST, EXCAVATOR_API_PORT)
+        return ExcavatorAPI(EXCAVATOR_API_HOST, EXCAVATOR_API_PORT, stop_event)
     
     # 4. Kein Miner läuft - informiere User
     print(f"⚠️  Kein Miner gefunden!")
@@ -2030,7 +2692,7 @@ def get_available_miner():
     print(f"")
     
     # Return QuickMiner API as default (user needs to start it)
-    return ExcavatorAPI(QUICKMINER_API_HOST, QUICKMINER_API_PORT)
+    return ExcavatorAPI(QUICKMINER_API_HOST, QUICKMINER_API_PORT, stop_event)
 
 
 def log_gpu_health_event(event_type, gpu_id, gpu_name, stuck_algorithm, target_algorithm="", 
@@ -2071,19 +2733,44 @@ def log_gpu_health_event(event_type, gpu_id, gpu_name, stuck_algorithm, target_a
 class SolarMiningController:
     def __init__(self):
         self.bridge = None
-        self.excavator = get_available_miner()
+        self._stop = threading.Event()  # Beim Beenden gesetzt - weckt Retry-Pausen in Worker-Threads
+        self.excavator = get_available_miner(self._stop)
         self.nicehash = NiceHashAPI(NICEHASH_WALLET)
         self.weather = WeatherAPI(WEATHER_LATITUDE, WEATHER_LONGITUDE) if WEATHER_ENABLED else None
         # Monitor first GPU for pause detection, but mine on all GPUs
         self.gpu_monitor = GPUMonitor(gpu_id=int(DEVICE_IDS[0]), threshold=GPU_USAGE_THRESHOLD)
         self.excavator_process = None
+        self._loop = None  # Event-Loop von run() - für Weckrufe aus Watcher-Threads
+        self._excavator_exited = None  # asyncio.Event, gesetzt wenn unser Excavator-Prozess endet
         self.is_mining = False
         self.start_confirmations = 0
         self.stop_confirmations = 0
+        self._power_window = deque(maxlen=POWER_SMOOTHING_SAMPLES)  # Letzte verfügbare Leistungen (W)
         self.total_mining_time = 0
         self.mining_start_time = None
         self.gpu_paused = False  # Flag für GPU-Pause
         self.last_weather_data = {}  # Cache für Wetterdaten (immer verfügbar)
+        self.last_earnings = None  # Cache für NiceHash Earnings (vom Earnings-Task aktualisiert)
+        self._earnings_task = None
+        self.last_gpu_stats = (0, 0)  # (avg load %, avg temp °C) - vom GPU-Poller aktualisiert
+        self._gpu_task = None
+        self._weather_task = None
+        self._register_cache = {}  # {register: (timestamp, value)} - letzter Modbus-Snapshot
+        self._block_backoff = {}  # {block names: (Fehler in Folge, Back-off s, nächster Versuch)} - nur optionale Blöcke (Batterie)
+        # Dauerhaft offene, gepufferte Daten-CSV (Header bei leerer Datei)
+        self._data_log = CSVLogger(DATA_LOG_FILE, CSV_COLUMNS_FULL, CSV_BUFFER_SIZE, CSV_FLUSH_EVERY)
+        self._csv_date = None  # Kalendertag der offenen Daten-CSV (für die tägliche Rotation)
+        self._csv_lock = threading.RLock()  # Writer-Thread vs. Shutdown
+        self._csv_queue = None  # asyncio.Queue mit fertigen CSV-Zeilen (in run() angelegt)
+        self._csv_task = None
+        self._last_logged_sample = None  # Zuletzt geschriebene Zeile (Delta-Logging)
+        self._last_logged_ts = 0
+        self.last_inverter_data = {}
+        self._stable_ticks = 0  # Ticks ohne Statuswechsel bei viel Power-Reserve (adaptives Intervall)
+        # Zeitstempel der periodischen Aufgaben im Main-Loop (in run() gestaffelt gesetzt)
+        self._last_snapshot_ts = 0
+        self._last_rig_status_ts = 0
+        self._last_health_ts = 0
         
         # New: Mining failure tracking for immediate retry
         self.mining_start_failures = 0
@@ -2132,9 +2819,9 @@ class SolarMiningController:
             return True
         
         print()
-        print("=" * 80)
+        print(BANNER_LINE)
         print("⏳ WAITING FOR QUICKMINER TO START")
-        print("=" * 80)
+        print(BANNER_LINE)
         print(f"QuickMiner needs time to:")
         print(f"  1. Launch process")
         print(f"  2. Initialize Excavator API")
@@ -2144,7 +2831,7 @@ class SolarMiningController:
         print()
         print(f"Maximum wait time: {max_wait_time} seconds")
         print(f"Checking every 5 seconds...")
-        print("=" * 80)
+        print(BANNER_LINE)
         print()
         
         start_time = time.time()
@@ -2202,9 +2889,9 @@ class SolarMiningController:
                         mining_started = True
                         print(f"✅ [{elapsed}s] Mining active: {', '.join(active_workers)}")
                         print()
-                        print("=" * 80)
+                        print(BANNER_LINE)
                         print("✅ QUICKMINER FULLY STARTED AND MINING")
-                        print("=" * 80)
+                        print(BANNER_LINE)
                         print(f"Total startup time: {elapsed} seconds")
                         print()
                         return True
@@ -2219,9 +2906,9 @@ class SolarMiningController:
         
         # Timeout reached
         print()
-        print("=" * 80)
+        print(BANNER_LINE)
         print("⚠️  TIMEOUT WAITING FOR QUICKMINER")
-        print("=" * 80)
+        print(BANNER_LINE)
         print(f"QuickMiner did not fully start after {max_wait_time} seconds")
         print()
         print("Possible issues:")
@@ -2237,7 +2924,7 @@ class SolarMiningController:
         print("  4. Restart both QuickMiner and this script")
         print()
         print("Continuing anyway (script may not work correctly)...")
-        print("=" * 80)
+        print(BANNER_LINE)
         print()
         error_logger.warning(f"QuickMiner startup timeout after {max_wait_time}s")
         return False
@@ -2283,62 +2970,105 @@ class SolarMiningController:
                         ts = datetime.now().strftime('%Y%m%d_%H%M%S')
                         p.rename(p.with_name(p.stem + f"_{ts}" + p.suffix))
             except Exception as e:
-                error_logger.debug(f"Could not rotate excavator logs: {e}")
+                error_logger.debug("Could not rotate excavator logs: %s", e)
 
-            # Start Excavator in background and capture stdout/stderr to files
+            # Start Excavator in background; the child writes stdout/stderr straight
+            # into the log files (no Python forwarding). Never use PIPE here: nobody
+            # reads it, so Excavator would block once the pipe buffer is full.
             try:
-                stdout_f = open(EXCAVATOR_STDOUT, 'a', encoding='utf-8')
-                stderr_f = open(EXCAVATOR_STDERR, 'a', encoding='utf-8')
-            except Exception:
-                stdout_f = subprocess.PIPE
-                stderr_f = subprocess.PIPE
-
-            self.excavator_process = subprocess.Popen(
-                [EXCAVATOR_PATH, "-p", str(EXCAVATOR_API_PORT)],
-                stdout=stdout_f,
-                stderr=stderr_f,
-                creationflags=subprocess.CREATE_NEW_CONSOLE  # Own window
-            )
+                stdout_f = open(EXCAVATOR_STDOUT, 'ab')
+                stderr_f = open(EXCAVATOR_STDERR, 'ab')
+            except OSError:
+                stdout_f = subprocess.DEVNULL
+                stderr_f = subprocess.DEVNULL
+
+            try:
+                self.excavator_process = subprocess.Popen(
+                    [EXCAVATOR_PATH, "-p", str(EXCAVATOR_API_PORT)],
+                    stdout=stdout_f,
+                    stderr=stderr_f,
+                    creationflags=subprocess.CREATE_NEW_CONSOLE  # Own window
+                )
+            finally:
+                # Child has its own copies of the handles - don't leak ours per restart
+                for f in (stdout_f, stderr_f):
+                    if f is not subprocess.DEVNULL:
+                        f.close()
+            
+            self._watch_excavator(self.excavator_process)
             
             # Set low process priority (gaming has priority!)
-            try:
-                import psutil
+            with suppress(Exception):
                 p = psutil.Process(self.excavator_process.pid)
                 p.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)  # Windows: Lower priority
                 print(f"   ✓ {t('priority_set')}")
-            except:
-                pass
             
             # Wait until API is available
             print(f"   {t('waiting_for_api')}")
-            for i in range(30):  # Max 30 seconds wait
-                time.sleep(1)
-                info = self.excavator.get_info()
-                if info:
-                    print(f"✅ {t('excavator_started', version=info.get('version', 'unknown'))}")
-                    # Save PID for GPU monitoring
-                    self.gpu_monitor.set_excavator_pid(self.excavator_process.pid)
-                    print(f"   {t('pid')}: {self.excavator_process.pid}")
-                    return True
-                if i % 5 == 0 and i > 0:
-                    print(f"   {t('remaining_seconds', seconds=30-i)}")
+            info = self.excavator.wait_ready(timeout=30)  # Max 30 seconds wait
+            if info:
+                print(f"✅ {t('excavator_started', version=info.get('version', 'unknown'))}")
+                # Save PID for GPU monitoring
+                self.gpu_monitor.set_excavator_pid(self.excavator_process.pid)
+                print(f"   {t('pid')}: {self.excavator_process.pid}")
+                return True
             
             print(f"❌ {t('excavator_start_timeout')}")
             error_logger.error("Excavator API not reachable after 30s")
-            error_logger.debug(f"Excavator Path: {EXCAVATOR_PATH}")
-            error_logger.debug(f"API Host: {self.excavator.host}, Port: {self.excavator.port}")
-            error_logger.debug(f"Process PID: {self.excavator_process.pid if self.excavator_process else 'None'}")
+            error_logger.debug("Excavator Path: %s", EXCAVATOR_PATH)
+            error_logger.debug("API Host: %s, Port: %s", self.excavator.host, self.excavator.port)
+            error_logger.debug("Process PID: %s", self.excavator_process.pid if self.excavator_process else 'None')
             return False
             
         except Exception as e:
             print(f"❌ {t('excavator_start_error')}: {e}")
             error_logger.error(f"Excavator start error: {e}")
-            error_logger.debug(f"Traceback:\n{traceback.format_exc()}")
-            error_logger.debug(f"Excavator Path exists: {os.path.exists(EXCAVATOR_PATH)}")
+            error_logger.debug("Traceback:", exc_info=True)
+            error_logger.debug("Excavator Path exists: %s", os.path.exists(EXCAVATOR_PATH))
             return False
     
+    def _watch_excavator(self, process):
+        """
+        Weckt den Main-Loop sobald der gestartete Excavator endet.
+        
+        Ein Daemon-Thread blockiert in process.wait() (kein Polling, funktioniert
+        auch unter Windows, wo es kein pidfd gibt) und setzt danach per
+        call_soon_threadsafe das _excavator_exited Event. Bewusst beendete oder
+        ersetzte Prozesse (excavator_process zeigt nicht mehr auf sie) wecken nicht.
+        """
+        def wait_for_exit():
+            with suppress(Exception):
+                process.wait()
+            loop = self._loop
+            if process is self.excavator_process and loop is not None and not loop.is_closed():
+                with suppress(RuntimeError):  # Loop gerade beendet
+                    loop.call_soon_threadsafe(self._excavator_exited.set)
+        
+        threading.Thread(target=wait_for_exit, name=f"excavator-watch-{process.pid}", daemon=True).start()
+    
     def check_excavator_health(self):
-        """Check if Excavator is still responding and restart if necessary."""
+        """
+        Check if Excavator is still responding and restart if necessary.
+        
+        If the miner answered a command (e.g. the worker.list of the previous
+        iteration) within the last CHECK_INTERVAL, that already proves the API
+        is alive and the extra info round-trip is skipped.
+        A process we started that has exited is restarted right away instead of
+        waiting for API errors to pile up.
+        """
+        if self.excavator_process and self.excavator_process.poll() is not None:
+            print(f"\n⚠️  {t('excavator_crashed')}")
+            print(f"   {t('restarting_excavator')}")
+            error_logger.error("Excavator process exited (code %s) - restarting", self.excavator_process.returncode)
+            self.excavator.close()  # Verbindung zum beendeten Prozess ist tot
+            self.excavator_process = None
+            self.excavator.consecutive_errors = 0
+            return self.start_excavator()
+        
+        last_ok = self.excavator.last_successful_command
+        if last_ok is not None and time.monotonic() - last_ok < CHECK_INTERVAL and self.excavator.consecutive_errors == 0:
+            return True
+        
         # Check if API responds
         info = self.excavator.get_info()
         
@@ -2357,7 +3087,7 @@ class SolarMiningController:
                 print(f"   API Timeouts: {self.excavator.consecutive_errors}x")
                 print(f"   {t('terminating_old_process')}")
                 error_logger.warning(f"Excavator frozen - API not responding after {self.excavator.consecutive_errors} attempts")
-                error_logger.debug(f"PID: {self.excavator_process.pid}, Consecutive Errors: {self.excavator.consecutive_errors}")
+                error_logger.debug("PID: %s, Consecutive Errors: %s", self.excavator_process.pid, self.excavator.consecutive_errors)
                 try:
                     print(f"   Beende Excavator (PID {self.excavator_process.pid})...")
                     self.excavator_process.terminate()
@@ -2368,6 +3098,7 @@ class SolarMiningController:
                     self.excavator_process.kill()
                 
                 print(f"   Starte Excavator neu...")
+                self.excavator.close()  # Verbindung zum alten Prozess ist tot
                 self.excavator_process = None
                 self.excavator.consecutive_errors = 0
                 return self.start_excavator()
@@ -2377,7 +3108,8 @@ class SolarMiningController:
                 print(f"\n⚠️  {t('excavator_crashed')}")
                 print(f"   {t('restarting_excavator')}")
                 error_logger.error("Excavator process crashed - restarting")
-                error_logger.debug(f"Consecutive Errors: {self.excavator.consecutive_errors}")
+                error_logger.debug("Consecutive Errors: %s", self.excavator.consecutive_errors)
+                self.excavator.close()  # Verbindung zum abgestürzten Prozess ist tot
                 self.excavator_process = None
                 self.excavator.consecutive_errors = 0
                 return self.start_excavator()
@@ -2385,8 +3117,15 @@ class SolarMiningController:
         return False
         
     async def connect(self):
-        """Connect to inverter with unlimited retry logic."""
-        RETRY_DELAY = 30  # seconds between retries
+        """
+        Connect to inverter with unlimited retry logic.
+        
+        Retries wait random.uniform(0, min(CONNECT_BACKOFF_MAX, BASE * 2**attempt))
+        ("full jitter"), so a restarted controller and other Modbus clients
+        do not keep colliding on the inverter at fixed intervals.
+        With INVERTER_CONNECT_MAX_ATTEMPTS set, the last failed attempt raises
+        InverterUnreachableError (a ConnectionError) right away instead of sleeping first.
+        """
         CONNECTION_TIMEOUT = 60  # seconds for each connection attempt
         
         attempt = 0
@@ -2400,6 +3139,7 @@ class SolarMiningController:
         
         while True:  # Infinite retry loop
             attempt += 1
+            retry_delay = random.uniform(0, min(CONNECT_BACKOFF_MAX, CONNECT_BACKOFF_BASE * 2 ** min(attempt, 6)))
             try:
                 print(f"🔌 {t('connecting_to_inverter')} {INVERTER_HOST}:{INVERTER_PORT}... (Versuch {attempt})")
                 
@@ -2411,6 +3151,7 @@ class SolarMiningController:
                 )
                 
                 print(f"✅ {t('inverter_connection_success')}")
+                self._register_cache.clear()  # Werte der alten Verbindung verwerfen
                 
                 # Test connection with a simple read
                 try:
@@ -2439,15 +3180,19 @@ class SolarMiningController:
             except asyncio.TimeoutError:
                 error_logger.error(f"Connection attempt {attempt} timed out after {CONNECTION_TIMEOUT}s")
                 print(f"⏱️  Timeout nach {CONNECTION_TIMEOUT}s - Inverter antwortet nicht")
-                print(f"⏳ Warte {RETRY_DELAY}s vor erneutem Verbindungsversuch...")
+                if attempt == INVERTER_CONNECT_MAX_ATTEMPTS:
+                    raise InverterUnreachableError(f"Inverter not reachable after {attempt} attempts")
+                print(f"⏳ Warte {retry_delay:.0f}s vor erneutem Verbindungsversuch...")
                 if attempt == 1:
                     print(f"   💡 TIPP: Schließe jetzt FusionSolar App oder andere Monitoring-Software!")
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(retry_delay)
                 # Continue loop - no else needed anymore
                     
             except Exception as e:
                 error_logger.error(f"Connection attempt {attempt} failed: {e}")
-                error_logger.debug(f"Traceback:\n{traceback.format_exc()}")
+                error_logger.debug("Traceback:", exc_info=True)
+                if attempt == INVERTER_CONNECT_MAX_ATTEMPTS:
+                    raise InverterUnreachableError(f"Inverter not reachable after {attempt} attempts") from e
                 
                 # Check for specific Modbus conflict errors
                 error_msg = str(e).lower()
@@ -2458,14 +3203,14 @@ class SolarMiningController:
                     "connection" in error_msg
                 )
                 
-                print(f"⏳ Warte {RETRY_DELAY}s vor erneutem Verbindungsversuch...")
+                print(f"⏳ Warte {retry_delay:.0f}s vor erneutem Verbindungsversuch...")
                 if is_modbus_conflict:
                     print(f"   🔴 MODBUS-KONFLIKT ERKANNT!")
                     print(f"   → Ein anderes Programm greift auf den Inverter zu")
                     print(f"   → Schließe JETZT: FusionSolar App, Home Assistant, etc.")
                 else:
                     print(f"   Fehler: {type(e).__name__}")
-                await asyncio.sleep(RETRY_DELAY)
+                await asyncio.sleep(retry_delay)
                 # Continue loop
         
         # Wait for QuickMiner to fully start (if using QuickMiner)
@@ -2497,12 +3242,13 @@ class SolarMiningController:
         """Read available solar power with timeout protection."""
         try:
             # Wrap Modbus reads with timeout to prevent hangs
+            get = self.bridge.client.get
             solar_power = await asyncio.wait_for(
-                self.bridge.client.get("input_power"),
+                get("input_power"),
                 timeout=MODBUS_CRITICAL_TIMEOUT
             )
             grid_power = await asyncio.wait_for(
-                self.bridge.client.get("power_meter_active_power"),
+                get("power_meter_active_power"),
                 timeout=MODBUS_CRITICAL_TIMEOUT
             )
             
@@ -2514,6 +3260,10 @@ class SolarMiningController:
             # This is power we can redirect to mining without importing from grid
             available = max(0, grid_power.value)
             
+            # In den Register-Snapshot übernehmen: Alarm-Check und Snapshot-Reads
+            # (_cached_get/_cached_block) lesen diese Register im selben Tick nicht erneut
+            self._cache_registers({"input_power": solar_power.value, "power_meter_active_power": grid_power.value})
+            
             return solar_power.value, grid_power.value, available
         except asyncio.TimeoutError:
             error_logger.warning(f"Timeout reading solar data after {MODBUS_CRITICAL_TIMEOUT}s (Modbus slow/busy)")
@@ -2521,274 +3271,334 @@ class SolarMiningController:
             raise  # Re-raise to trigger reconnection logic
         except Exception as e:
             error_logger.error(f"Error reading solar data: {e}")
-            error_logger.debug(f"Traceback:\n{traceback.format_exc()}")
-            error_logger.debug(f"Bridge connected: {self.bridge is not None}")
+            error_logger.debug("Traceback:", exc_info=True)
+            error_logger.debug("Bridge connected: %s", self.bridge is not None)
             print(f"❌ {t('reading_error')}: {e}")
             raise  # Re-raise to trigger reconnection logic
     
+    async def _get_many(self, names, timeout=MODBUS_READ_TIMEOUT, strict=False):
+        """
+        Read several registers concurrently via asyncio.gather.
+        
+        Returns {name: value}. With strict=False, registers that time out or
+        fail are left out of the dict (callers treat them as "not available");
+        with strict=True the first error is raised like a single get() would.
+        """
+        get = self.bridge.client.get
+        try:
+            results = await asyncio.gather(
+                *(asyncio.wait_for(get(name), timeout=timeout) for name in names),
+                return_exceptions=not strict
+            )
+        except Exception:
+            self._invalidate_registers(names)
+            raise
+        values = {}
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                self._register_cache.pop(name, None)
+            else:
+                values[name] = result.value
+        self._cache_registers(values)
+        return values
+    
+    async def _read_block(self, names, timeout=MODBUS_READ_TIMEOUT, strict=False, backoff=False):
+        """
+        Read a contiguous register range in ONE Modbus transaction.
+        
+        names must be in ascending register order (huawei-solar get_multiple()
+        reads from the first to the last register and decodes locally).
+        If the block read is rejected - e.g. a model lacks one register in
+        the range - the registers are read individually via _get_many().
+        Returns {name: value} like _get_many().
+        
+        Truly optional blocks (backoff=True, e.g. the battery) that come back
+        empty BLOCK_FAILURES_BEFORE_BACKOFF times in a row are skipped for an
+        exponential back-off (like the Excavator probe back-off), so a missing
+        battery does not cost a timeout every iteration. The first successful
+        read resets it. Status and alarm blocks are read on every tick.
+        """
+        if strict or not backoff:
+            return await self._read_block_now(names, timeout, strict)
+        
+        failures, backoff, next_try_ts = self._block_backoff.get(names, (0, 0, 0))
+        if time.time() < next_try_ts:
+            return {}
+        values = await self._read_block_now(names, timeout, strict)
+        if values:
+            self._block_backoff.pop(names, None)
+        else:
+            failures += 1
+            if failures >= BLOCK_FAILURES_BEFORE_BACKOFF:
+                backoff = min(PROBE_BACKOFF_MAX, max(PROBE_BACKOFF_INITIAL, 2 * backoff))
+                next_try_ts = time.time() + backoff
+                error_logger.debug("Register block %s..%s unreadable %sx - pausing %ss", names[0], names[-1], failures, backoff)
+            self._block_backoff[names] = (failures, backoff, next_try_ts)
+        return values
+    
+    async def _read_block_now(self, names, timeout, strict):
+        """
+        Single attempt of _read_block() via solar_core.read_register_block()
+        (get_multiple, per-register fallback), kept in the snapshot cache.
+        """
+        try:
+            values = await read_register_block(self.bridge.client, names, timeout, strict=strict)
+        except Exception:
+            self._invalidate_registers(names)
+            raise
+        if len(values) < len(names):
+            # Timeout oder einzelne Register nicht lesbar - nicht aus dem Cache bedienen
+            self._invalidate_registers([name for name in names if name not in values])
+        self._cache_registers(values)
+        return values
+    
+    def _cache_registers(self, values):
+        """Store freshly read register values ({name: value}) in the snapshot cache."""
+        now = time.time()
+        cache = self._register_cache
+        for name, value in values.items():
+            cache[name] = (now, value)
+    
+    def _invalidate_registers(self, names):
+        """Drop registers from the snapshot cache after a failed read."""
+        for name in names:
+            self._register_cache.pop(name, None)
+    
+    async def _cached_get(self, name, ttl=REGISTER_CACHE_TTL):
+        """Return a register value from the snapshot cache if fresh, otherwise read it."""
+        entry = self._register_cache.get(name)
+        if entry is not None and time.time() - entry[0] <= ttl:
+            return entry[1]
+        return (await self._get_many((name,), strict=True))[name]
+    
+    async def _cached_block(self, names, ttl=REGISTER_CACHE_TTL, strict=False):
+        """
+        Return {name: value} from the snapshot cache if ALL registers are fresh.
+        
+        Otherwise the whole block is re-read via _read_block() - one transaction
+        either way, so partially fresh blocks are not worth splitting.
+        """
+        now = time.time()
+        cache = self._register_cache
+        values = {}
+        for name in names:
+            entry = cache.get(name)
+            if entry is None or now - entry[0] > ttl:
+                return await self._read_block(names, strict=strict)
+            values[name] = entry[1]
+        return values
+    
     async def get_all_inverter_data(self):
-        """Read ALL available inverter data with timeout protection."""
+        """
+        Read ALL available inverter data with timeout protection.
+        
+        Registers are read as a few contiguous blocks (one Modbus transaction
+        each) instead of one request per register.
+        """
         data = {}
         
         try:
-            # Basis Solar-Daten (critical - use longer timeout)
-            data['input_power'] = (await asyncio.wait_for(
-                self.bridge.client.get("input_power"), timeout=MODBUS_CRITICAL_TIMEOUT
-            )).value
-            data['power_meter_active_power'] = (await asyncio.wait_for(
-                self.bridge.client.get("power_meter_active_power"), timeout=MODBUS_CRITICAL_TIMEOUT
-            )).value
-            
-            # String-Daten (PV1 & PV2) - non-critical, fail silently
-            try:
-                data['pv_01_voltage'] = (await asyncio.wait_for(
-                    self.bridge.client.get("pv_01_voltage"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                data['pv_01_current'] = (await asyncio.wait_for(
-                    self.bridge.client.get("pv_01_current"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                data['pv_02_voltage'] = (await asyncio.wait_for(
-                    self.bridge.client.get("pv_02_voltage"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                data['pv_02_current'] = (await asyncio.wait_for(
-                    self.bridge.client.get("pv_02_current"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-            except (asyncio.TimeoutError, Exception):
-                pass
-            
-            # Grid-Daten (Phase 1, 2, 3) - non-critical, fail silently
-            try:
-                data['grid_A_voltage'] = (await asyncio.wait_for(
-                    self.bridge.client.get("grid_A_voltage"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                data['grid_B_voltage'] = (await asyncio.wait_for(
-                    self.bridge.client.get("grid_B_voltage"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                data['grid_C_voltage'] = (await asyncio.wait_for(
-                    self.bridge.client.get("grid_C_voltage"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                data['grid_A_current'] = (await asyncio.wait_for(
-                    self.bridge.client.get("grid_A_current"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                data['grid_B_current'] = (await asyncio.wait_for(
-                    self.bridge.client.get("grid_B_current"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                data['grid_C_current'] = (await asyncio.wait_for(
-                    self.bridge.client.get("grid_C_current"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-            except (asyncio.TimeoutError, Exception):
-                pass
-            
-            # Temperatur & Effizienz - non-critical, fail silently
-            try:
-                data['internal_temperature'] = (await asyncio.wait_for(
-                    self.bridge.client.get("internal_temperature"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                data['efficiency'] = (await asyncio.wait_for(
-                    self.bridge.client.get("efficiency"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-            except (asyncio.TimeoutError, Exception):
-                pass
-            
-            # Tages-Statistiken - non-critical, fail silently
-            try:
-                data['daily_yield_energy'] = (await asyncio.wait_for(
-                    self.bridge.client.get("daily_yield_energy"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                data['accumulated_yield_energy'] = (await asyncio.wait_for(
-                    self.bridge.client.get("accumulated_yield_energy"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-            except (asyncio.TimeoutError, Exception):
-                pass
+            # Basis Solar-Daten (critical - use longer timeout, errors abort)
+            data.update(await self._get_many(
+                ("power_meter_active_power",),
+                timeout=MODBUS_CRITICAL_TIMEOUT, strict=True
+            ))
+            
+            # Solar-Leistung, Grid-Daten (Phase 1, 2, 3), Temperatur & Effizienz,
+            # Status, Tages-Statistiken - contains input_power, so use the critical
+            # timeout; registers missing on this model are skipped by the fallback
+            data.update(await self._read_block(
+                INVERTER_BLOCK_STATUS, timeout=MODBUS_CRITICAL_TIMEOUT
+            ))
+            
+            # Alarme & String-Daten (PV1 & PV2) - non-critical, fail silently
+            alarms_pv = await self._read_block(INVERTER_BLOCK_ALARMS_PV)
             
             # Batterie (falls vorhanden) - non-critical, fail silently
-            try:
-                data['battery_charge_discharge_power'] = (await asyncio.wait_for(
-                    self.bridge.client.get("storage_charge_discharge_power"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                data['battery_state_of_capacity'] = (await asyncio.wait_for(
-                    self.bridge.client.get("storage_state_of_capacity"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-            except (asyncio.TimeoutError, Exception):
-                pass
-            
-            # Alarms & Status - important but non-critical
-            try:
-                alarm_1_raw = (await asyncio.wait_for(
-                    self.bridge.client.get("alarm_1"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                alarm_2_raw = (await asyncio.wait_for(
-                    self.bridge.client.get("alarm_2"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                alarm_3_raw = (await asyncio.wait_for(
-                    self.bridge.client.get("alarm_3"), timeout=MODBUS_READ_TIMEOUT
-                )).value
-                
-                # Verwende AlarmParser aus solar_core
-                data['alarm_1'] = AlarmParser.extract_alarm_value(alarm_1_raw)
-                data['alarm_2'] = AlarmParser.extract_alarm_value(alarm_2_raw)
-                data['alarm_3'] = AlarmParser.extract_alarm_value(alarm_3_raw)
-                data['device_status'] = (await self.bridge.client.get("device_status")).value
-            except:
-                pass
+            battery = await self._read_block(INVERTER_BLOCK_BATTERY, backoff=True)
+            if "storage_charge_discharge_power" in battery:
+                data['battery_charge_discharge_power'] = battery["storage_charge_discharge_power"]
+            if "storage_state_of_capacity" in battery:
+                data['battery_state_of_capacity'] = battery["storage_state_of_capacity"]
+            
+            # Verwende AlarmParser aus solar_core
+            for name, value in alarms_pv.items():
+                if name.startswith("alarm_"):
+                    data[name] = AlarmParser.extract_alarm_value(value)
+                else:
+                    data[name] = value
                 
         except Exception as e:
             error_logger.error(f"Fehler beim Lesen von erweiterten Inverter-Daten: {e}")
-            error_logger.debug(f"Traceback:\n{traceback.format_exc()}")
+            error_logger.debug("Traceback:", exc_info=True)
         
         return data
     
+    @staticmethod
+    def _iter_set_bits(value):
+        """Yield the indices of the set bits in value, lowest first (O(popcount))."""
+        while value:
+            lowest = value & -value
+            yield lowest.bit_length() - 1
+            value ^= lowest
+    
+    @staticmethod
+    def _format_alarm_bitfields(packed, alarm_objs):
+        """
+        Split the packed alarm word (3 x 16 bit, alarm_1 in the low bits) again.
+        
+        Returns [(alarm number, "Bits 3, 7 (0xHEX)")] for every non-zero
+        register that has no decoded alarm object.
+        """
+        bitfields = []
+        for index, alarm_obj in enumerate(alarm_objs):
+            word = (packed >> (16 * index)) & 0xFFFF
+            if word and not alarm_obj:
+                bits = ", ".join(map(str, SolarMiningController._iter_set_bits(word)))
+                bitfields.append((index + 1, f"Bits {bits} (0x{word:04X})"))
+        return bitfields
+    
     async def check_inverter_alarms(self):
-        """Prüft Inverter auf aktive Alarme und loggt sie mit vollständigem Kontext."""
+        """
+        Prüft Inverter auf aktive Alarme und loggt sie mit vollständigem Kontext.
+        
+        Registers already read by get_all_inverter_data() in this iteration are
+        taken from the snapshot cache; only the alarm deep-dive registers
+        (fault code, insulation, modules, ...) go to the wire.
+        """
         try:
-            # Add timeout protection to alarm reads
-            alarm_1 = await asyncio.wait_for(
-                self.bridge.client.get("alarm_1"), 
-                timeout=MODBUS_READ_TIMEOUT
-            )
-            alarm_2 = await asyncio.wait_for(
-                self.bridge.client.get("alarm_2"), 
-                timeout=MODBUS_READ_TIMEOUT
-            )
-            alarm_3 = await asyncio.wait_for(
-                self.bridge.client.get("alarm_3"), 
-                timeout=MODBUS_READ_TIMEOUT
-            )
-            device_status = await asyncio.wait_for(
-                self.bridge.client.get("device_status"), 
-                timeout=MODBUS_READ_TIMEOUT
-            )
+            # Add timeout protection to alarm reads (errors abort the check)
+            get = self.bridge.client.get
+            alarms = await self._cached_block(("alarm_1", "alarm_2", "alarm_3"), strict=True)
+            
+            # Normalfall: alle drei Register leer (0 / keine Alarm-Objekte) ->
+            # weder AlarmParser noch device_status nötig
+            if not any(alarms.values()):
+                return False
+            device_status = await self._cached_get("device_status")
             
             # Verwende AlarmParser aus solar_core
-            alarm_1_val, alarm_1_obj = AlarmParser.get_alarm_details(alarm_1)
-            alarm_2_val, alarm_2_obj = AlarmParser.get_alarm_details(alarm_2)
-            alarm_3_val, alarm_3_obj = AlarmParser.get_alarm_details(alarm_3)
+            alarm_1_val, alarm_1_obj = AlarmParser.get_alarm_details(alarms["alarm_1"])
+            alarm_2_val, alarm_2_obj = AlarmParser.get_alarm_details(alarms["alarm_2"])
+            alarm_3_val, alarm_3_obj = AlarmParser.get_alarm_details(alarms["alarm_3"])
+            
+            alarm_objs = (alarm_1_obj, alarm_2_obj, alarm_3_obj)
+            
+            # Alle drei 16-Bit Alarm-Register in ein Wort packen -> ein Test statt sechs
+            packed = (alarm_1_val & 0xFFFF) | ((alarm_2_val & 0xFFFF) << 16) | ((alarm_3_val & 0xFFFF) << 32)
             
             # Check if alarms are active (ID != 0 or alarm object present)
-            has_alarms = (alarm_1_val != 0 or alarm_2_val != 0 or alarm_3_val != 0 or 
-                         alarm_1_obj is not None or alarm_2_obj is not None or alarm_3_obj is not None)
+            has_alarms = packed != 0 or alarm_objs != (None, None, None)
             
             if has_alarms:
                 print(f"\n⚠️  {t('alarm_warning')}")
                 
                 # === COMPLETE ALARM CONTEXT SNAPSHOT ===
-                error_logger.error("=" * 80)
+                error_logger.error(BANNER_LINE)
                 error_logger.error("🚨 ALARM SNAPSHOT - Complete Inverter Diagnostics")
-                error_logger.error("=" * 80)
+                error_logger.error(BANNER_LINE)
                 
                 # Alarm-Details
-                if alarm_1_obj:
-                    error_logger.error(f"Alarm 1: {alarm_1_obj.name} (ID={alarm_1_obj.id}, Level={alarm_1_obj.level})")
-                    print(f"   ⚠️  Alarm 1: {alarm_1_obj.name} (Level: {alarm_1_obj.level})")
-                elif alarm_1_val != 0:
-                    error_logger.warning(f"Alarm 1: Bitfeld = {alarm_1_val:016b} (0x{alarm_1_val:04X})")
-                    print(f"   Alarm 1: {alarm_1_val:016b} (0x{alarm_1_val:04X})")
-                
-                if alarm_2_obj:
-                    error_logger.error(f"Alarm 2: {alarm_2_obj.name} (ID={alarm_2_obj.id}, Level={alarm_2_obj.level})")
-                    print(f"   ⚠️  Alarm 2: {alarm_2_obj.name} (Level: {alarm_2_obj.level})")
-                elif alarm_2_val != 0:
-                    error_logger.warning(f"Alarm 2: Bitfeld = {alarm_2_val:016b} (0x{alarm_2_val:04X})")
-                    print(f"   Alarm 2: {alarm_2_val:016b} (0x{alarm_2_val:04X})")
-                
-                if alarm_3_obj:
-                    error_logger.error(f"Alarm 3: {alarm_3_obj.name} (ID={alarm_3_obj.id}, Level={alarm_3_obj.level})")
-                    print(f"   ⚠️  Alarm 3: {alarm_3_obj.name} (Level: {alarm_3_obj.level})")
-                elif alarm_3_val != 0:
-                    error_logger.warning(f"Alarm 3: Bitfeld = {alarm_3_val:016b} (0x{alarm_3_val:04X})")
-                    print(f"   Alarm 3: {alarm_3_val:016b} (0x{alarm_3_val:04X})")
-                
-                error_logger.error(f"Device Status: {device_status.value}")
-                print(f"   Status: {device_status.value}")
+                for number, alarm_obj in enumerate(alarm_objs, 1):
+                    if alarm_obj:
+                        error_logger.error(f"Alarm {number}: {alarm_obj.name} (ID={alarm_obj.id}, Level={alarm_obj.level})")
+                        print(f"   ⚠️  Alarm {number}: {alarm_obj.name} (Level: {alarm_obj.level})")
+                
+                # Rohe Bitfelder (Register ohne Alarm-Objekt) - ein Format-Durchgang, ein Log-Call
+                bitfields = self._format_alarm_bitfields(packed, alarm_objs)
+                if bitfields:
+                    error_logger.warning("\n".join(f"Alarm {number}: Bitfeld {text}" for number, text in bitfields))
+                    print("\n".join(f"   Alarm {number}: {text}" for number, text in bitfields))
+                
+                error_logger.error(f"Device Status: {device_status}")
+                print(f"   Status: {device_status}")
                 
                 # === GRID-STATUS (kritisch bei Grid Overvoltage!) ===
                 try:
                     error_logger.error("\n📊 GRID-STATUS:")
-                    grid_a_v = await self.bridge.client.get("grid_A_voltage")
-                    grid_b_v = await self.bridge.client.get("grid_B_voltage")
-                    grid_c_v = await self.bridge.client.get("grid_C_voltage")
-                    grid_freq = await self.bridge.client.get("grid_frequency")
-                    line_ab = await self.bridge.client.get("line_voltage_A_B")
-                    line_bc = await self.bridge.client.get("line_voltage_B_C")
-                    line_ca = await self.bridge.client.get("line_voltage_C_A")
+                    grid = await self._cached_block(
+                        ("line_voltage_A_B", "line_voltage_B_C", "line_voltage_C_A",
+                         "grid_A_voltage", "grid_B_voltage", "grid_C_voltage", "grid_frequency"),
+                        strict=True
+                    )
                     
-                    error_logger.error(f"  Phase A: {grid_a_v.value:.1f}V")
-                    error_logger.error(f"  Phase B: {grid_b_v.value:.1f}V")
-                    error_logger.error(f"  Phase C: {grid_c_v.value:.1f}V")
-                    error_logger.error(f"  Frequency: {grid_freq.value:.2f}Hz")
-                    error_logger.error(f"  Line A-B: {line_ab.value:.1f}V")
-                    error_logger.error(f"  Line B-C: {line_bc.value:.1f}V")
-                    error_logger.error(f"  Line C-A: {line_ca.value:.1f}V")
+                    error_logger.error(f"  Phase A: {grid['grid_A_voltage']:.1f}V")
+                    error_logger.error(f"  Phase B: {grid['grid_B_voltage']:.1f}V")
+                    error_logger.error(f"  Phase C: {grid['grid_C_voltage']:.1f}V")
+                    error_logger.error(f"  Frequency: {grid['grid_frequency']:.2f}Hz")
+                    error_logger.error(f"  Line A-B: {grid['line_voltage_A_B']:.1f}V")
+                    error_logger.error(f"  Line B-C: {grid['line_voltage_B_C']:.1f}V")
+                    error_logger.error(f"  Line C-A: {grid['line_voltage_C_A']:.1f}V")
                 except Exception as e:
                     error_logger.warning(f"  Grid-Daten nicht lesbar: {e}")
                 
                 # === PV-STRING-STATUS ===
                 try:
                     error_logger.error("\n☀️ PV-STRINGS:")
-                    pv1_v = await self.bridge.client.get("pv_01_voltage")
-                    pv1_a = await self.bridge.client.get("pv_01_current")
-                    pv2_v = await self.bridge.client.get("pv_02_voltage")
-                    pv2_a = await self.bridge.client.get("pv_02_current")
-                    input_power = await self.bridge.client.get("input_power")
+                    pv = await self._cached_block(
+                        ("pv_01_voltage", "pv_01_current", "pv_02_voltage", "pv_02_current", "input_power"),
+                        strict=True
+                    )
+                    pv1_v, pv1_a = pv['pv_01_voltage'], pv['pv_01_current']
+                    pv2_v, pv2_a = pv['pv_02_voltage'], pv['pv_02_current']
                     
-                    error_logger.error(f"  String 1: {pv1_v.value:.1f}V @ {pv1_a.value:.2f}A = {pv1_v.value * pv1_a.value:.0f}W")
-                    error_logger.error(f"  String 2: {pv2_v.value:.1f}V @ {pv2_a.value:.2f}A = {pv2_v.value * pv2_a.value:.0f}W")
-                    error_logger.error(f"  Total DC Input: {input_power.value:.0f}W")
+                    error_logger.error(f"  String 1: {pv1_v:.1f}V @ {pv1_a:.2f}A = {pv1_v * pv1_a:.0f}W")
+                    error_logger.error(f"  String 2: {pv2_v:.1f}V @ {pv2_a:.2f}A = {pv2_v * pv2_a:.0f}W")
+                    error_logger.error(f"  Total DC Input: {pv['input_power']:.0f}W")
                 except Exception as e:
                     error_logger.warning(f"  PV-Daten nicht lesbar: {e}")
                 
                 # === INVERTER-TEMPERATUR ===
                 try:
                     error_logger.error("\n🌡️ TEMPERATUREN:")
-                    internal_temp = await self.bridge.client.get("internal_temperature")
-                    error_logger.error(f"  Intern: {internal_temp.value:.1f}°C")
+                    internal_temp = await self._cached_get("internal_temperature")
+                    error_logger.error(f"  Intern: {internal_temp:.1f}°C")
                     
                     # Falls Multi-Modul Temperaturen verfügbar
-                    try:
-                        inv_a = await self.bridge.client.get("inv_module_A_temp")
-                        inv_b = await self.bridge.client.get("inv_module_B_temp")
-                        inv_c = await self.bridge.client.get("inv_module_C_temp")
-                        error_logger.error(f"  Modul A: {inv_a.value:.1f}°C")
-                        error_logger.error(f"  Modul B: {inv_b.value:.1f}°C")
-                        error_logger.error(f"  Modul C: {inv_c.value:.1f}°C")
-                    except:
-                        pass  # Nicht alle Modelle haben diese
+                    with suppress(Exception):  # Nicht alle Modelle haben diese
+                        modules = await self._get_many(
+                            ("inv_module_A_temp", "inv_module_B_temp", "inv_module_C_temp"),
+                            strict=True
+                        )
+                        error_logger.error(f"  Modul A: {modules['inv_module_A_temp']:.1f}°C")
+                        error_logger.error(f"  Modul B: {modules['inv_module_B_temp']:.1f}°C")
+                        error_logger.error(f"  Modul C: {modules['inv_module_C_temp']:.1f}°C")
                 except Exception as e:
                     error_logger.warning(f"  Temperatur-Daten nicht lesbar: {e}")
                 
-                # === ZUSÄTZLICHE FEHLER-CODES ===
-                try:
-                    error_logger.error("\n🔍 FEHLER-DETAILS:")
-                    fault_code = await self.bridge.client.get("fault_code")
+                # === ZUSÄTZLICHE FEHLER-CODES, ISOLATIONSWIDERSTAND, LECKSTROM ===
+                # Unabhängige Register: gemeinsam lesen, Fehler pro Register melden
+                error_logger.error("\n🔍 FEHLER-DETAILS:")
+                fault_code, insulation, leakage = await asyncio.gather(
+                    get("fault_code"), get("insulation_resistance"), get("leakage_current_RCD"),
+                    return_exceptions=True
+                )
+                if isinstance(fault_code, Exception):
+                    error_logger.warning(f"  Fault-Code nicht lesbar: {fault_code}")
+                else:
                     error_logger.error(f"  Fault Code: {fault_code.value}")
-                except Exception as e:
-                    error_logger.warning(f"  Fault-Code nicht lesbar: {e}")
                 
-                # === ISOLATIONSWIDERSTAND (kritisch bei Shutdown) ===
-                try:
-                    insulation = await self.bridge.client.get("insulation_resistance")
+                # Isolationswiderstand (kritisch bei Shutdown)
+                if isinstance(insulation, Exception):
+                    error_logger.warning(f"  Isolationswiderstand nicht lesbar: {insulation}")
+                else:
                     error_logger.error(f"  Insulation Resistance: {insulation.value:.2f} MΩ")
-                except Exception as e:
-                    error_logger.warning(f"  Isolationswiderstand nicht lesbar: {e}")
                 
-                # === LECKSTROM ===
-                try:
-                    leakage = await self.bridge.client.get("leakage_current_RCD")
+                if isinstance(leakage, Exception):
+                    error_logger.warning(f"  Leckstrom nicht lesbar: {leakage}")
+                else:
                     error_logger.error(f"  Leakage Current: {leakage.value:.2f} mA")
-                except Exception as e:
-                    error_logger.warning(f"  Leckstrom nicht lesbar: {e}")
                 
                 # === EFFIZIENZ & LEISTUNG ===
                 try:
                     error_logger.error("\n⚡ LEISTUNG:")
-                    efficiency = await self.bridge.client.get("efficiency")
-                    active_power = await self.bridge.client.get("active_power")
-                    error_logger.error(f"  Efficiency: {efficiency.value:.2f}%")
-                    error_logger.error(f"  Active Power: {active_power.value:.0f}W")
+                    power = await self._cached_block(("active_power", "efficiency"), strict=True)
+                    error_logger.error(f"  Efficiency: {power['efficiency']:.2f}%")
+                    error_logger.error(f"  Active Power: {power['active_power']:.0f}W")
                 except Exception as e:
                     error_logger.warning(f"  Leistungs-Daten nicht lesbar: {e}")
                 
-                error_logger.error("=" * 80)
+                error_logger.error(BANNER_LINE)
                 error_logger.error("")  # Leerzeile für bessere Lesbarkeit
                 print()
                 
@@ -2820,8 +3630,8 @@ class SolarMiningController:
         
         # Berechne wie viele GPUs wir mit der verfügbaren Power betreiben können
         max_gpus = min(
-            int(available_power / MIN_POWER_TO_START),
-            len(DEVICE_IDS)
+            int(available_power // MIN_POWER_TO_START),
+            MAX_GPU_COUNT
         )
         
         return max_gpus
@@ -2843,20 +3653,20 @@ class SolarMiningController:
         try:
             if self.excavator.miner_type == "QuickMiner":
                 # Try to get GPU name from QuickMiner API
-                response = requests.get(
+                response = HTTP_SESSION.get(
                     f"{self.excavator.base_url}/devices_cuda",
                     headers={"Authorization": self.excavator.auth_token} if self.excavator.auth_token else {},
                     timeout=5
                 )
                 if response.status_code == 200:
-                    data = response.json()
+                    data = json_loads(response.content)
                     devices = data.get("devices", [])
                     for device in devices:
                         # QuickMiner uses "device_id" field, not "id"
                         if str(device.get("device_id", "")) == str(device_id):
                             return device.get("name", f"GPU {device_id}")
         except Exception as e:
-            error_logger.debug(f"Could not get GPU name: {e}")
+            error_logger.debug("Could not get GPU name: %s", e)
         
         return f"GPU {device_id}"
     
@@ -3066,7 +3876,7 @@ class SolarMiningController:
         
         except Exception as e:
             error_logger.error(f"Error in GPU health check: {e}")
-            error_logger.debug(f"Traceback:\n{traceback.format_exc()}")
+            error_logger.debug("Traceback:", exc_info=True)
     
     async def check_gpu_thermals(self):
         """
@@ -3096,7 +3906,7 @@ class SolarMiningController:
             
         except Exception as e:
             error_logger.error(f"Error in thermal monitoring: {e}")
-            error_logger.debug(f"Traceback:\n{traceback.format_exc()}")
+            error_logger.debug("Traceback:", exc_info=True)
     
     async def scale_gpus(self, available_power):
         """
@@ -3141,10 +3951,12 @@ class SolarMiningController:
             workers = self.excavator.get_workers()
             workers_to_stop = workers[-gpus_to_remove:] if gpus_to_remove < len(workers) else workers
             
-            for worker in workers_to_stop:
+            results = self.excavator.send_batch(
+                [("worker.free", [worker.get("worker_id")]) for worker in workers_to_stop]
+            )
+            for worker, result in zip(workers_to_stop, results):
                 worker_id = worker.get("worker_id")
                 device_id = worker.get("device_id", "?")
-                result = self.excavator.send_command("worker.free", [worker_id])
                 if result and not result.get("error"):
                     print(f"      ⏸️  GPU {device_id} gestoppt (Worker {worker_id})")
                     changed = True
@@ -3156,15 +3968,193 @@ class SolarMiningController:
         self.active_gpu_ids = self.get_active_workers_device_ids()
         return changed, len(self.active_gpu_ids)
     
+    async def _earnings_loop(self):
+        """
+        Aktualisiert NiceHash Earnings unabhängig vom Solar-Regelkreis.
+        
+        Ein langsamer NiceHash-Call blockiert so keine Start/Stop-Entscheidung;
+        der Main-Loop liest nur self.last_earnings.
+        """
+        while True:
+            await asyncio.sleep(smudged(EARNINGS_CHECK_INTERVAL))
+            try:
+                # Der Task selbst taktet die Abrufe - Cache nur als Fallback bei Fehlern
+                earnings = await asyncio.to_thread(self.nicehash.get_cached_earnings, 0)
+                if earnings:
+                    self.last_earnings = earnings
+            except Exception as e:
+                error_logger.warning(f"Earnings update failed: {e}")
+    
+    async def _weather_loop(self):
+        """
+        Aktualisiert die Wetterdaten unabhängig vom Solar-Regelkreis.
+        
+        Der Main-Loop liest nur self.last_weather_data. Schlägt der Abruf fehl,
+        wird mit exponentiellem Back-off (PROBE_BACKOFF_INITIAL bis
+        WEATHER_REFRESH_INTERVAL) erneut versucht statt erst nach 15 Minuten.
+        """
+        # Beim Start gerade geholt - sonst (Abruf fehlgeschlagen) bald erneut versuchen
+        delay = smudged(WEATHER_REFRESH_INTERVAL) if self.last_weather_data else PROBE_BACKOFF_INITIAL
+        backoff = 0
+        while True:
+            await asyncio.sleep(delay)
+            weather = None
+            try:
+                weather = await asyncio.to_thread(self.weather.get_current_weather)
+            except Exception as e:
+                error_logger.warning(f"Weather update failed: {e}")
+            if weather:
+                self.last_weather_data = weather
+                backoff = 0
+                delay = smudged(WEATHER_REFRESH_INTERVAL)
+            else:
+                backoff = min(WEATHER_REFRESH_INTERVAL, max(PROBE_BACKOFF_INITIAL, 2 * backoff))
+                delay = backoff
+    
+    async def _gpu_poller(self):
+        """
+        Aktualisiert GPU-Last/-Temperatur im Hintergrund.
+        
+        Die GPU-Abfrage ist synchron (NVML bzw. nvidia-smi via GPUtil) und würde
+        den Event-Loop blockieren - daher im Thread; der Main-Loop liest nur
+        self.last_gpu_stats.
+        """
+        while True:
+            try:
+                gpus = await asyncio.to_thread(self.gpu_monitor.get_gpus)
+                if gpus:
+                    # Collect data from all configured GPUs
+                    total_usage = 0
+                    total_temp = 0
+                    active_gpus = 0
+                    for device_id in DEVICE_IDS:
+                        gpu_index = int(device_id)
+                        if gpu_index < len(gpus):
+                            gpu = gpus[gpu_index]
+                            total_usage += gpu.load * 100
+                            total_temp += gpu.temperature
+                            active_gpus += 1
+                    # Average across all GPUs
+                    if active_gpus > 0:
+                        self.last_gpu_stats = (total_usage / active_gpus, total_temp / active_gpus)
+            except Exception as e:
+                error_logger.debug("GPU poll failed: %s", e)
+            await asyncio.sleep(GPU_POLL_INTERVAL)
+    
+    def _write_data_row(self, row):
+        """
+        Append one row to the data CSV (persistent, buffered CSVLogger handle).
+        
+        With DATA_LOG_ROTATE_DAILY the first row of a new day archives the
+        previous day's file first.
+        """
+        if DATA_LOG_ROTATE_DAILY:
+            today = datetime.now().date()
+            if self._csv_date != today:
+                # Erster Schreibvorgang des Tages (oder nach Neustart): Vortagesdatei archivieren
+                # (_csv_date gesetzt = Datei enthält Zeilen eines früheren Tages; mtime kann
+                # bei noch gepufferten Zeilen nicht maßgeblich sein)
+                if DATA_LOG_FILE.exists() and (self._csv_date is not None or
+                        datetime.fromtimestamp(DATA_LOG_FILE.stat().st_mtime).date() < today):
+                    self._rotate_data_log()
+                self._csv_date = today
+        
+        self._data_log.write_row(row)
+    
+    def _rotate_data_log(self):
+        """
+        Move the data CSV to solar_data_YYYYMMDD.csv (day of its last row),
+        start a fresh file (header on first write) and gzip the archive in a background thread.
+        """
+        # Tag VOR dem Schließen bestimmen: close() schreibt den Puffer und setzt
+        # st_mtime auf heute. Offene Datei -> Tag ihrer Zeilen, sonst (Neustart) mtime
+        if self._csv_date is not None:
+            day = self._csv_date.strftime("%Y%m%d")
+        else:
+            day = datetime.fromtimestamp(DATA_LOG_FILE.stat().st_mtime).strftime("%Y%m%d")
+        self._close_data_log()
+        archive = DATA_LOG_FILE.with_name(f"{DATA_LOG_FILE.stem}_{day}.csv")
+        if archive.exists() or archive.with_name(archive.name + ".gz").exists():
+            archive = DATA_LOG_FILE.with_name(f"{DATA_LOG_FILE.stem}_{day}_{int(time.time())}.csv")
+        try:
+            DATA_LOG_FILE.replace(archive)
+        except OSError as e:
+            # z.B. Datei in Excel geöffnet - weiter in die bestehende Datei schreiben
+            error_logger.warning(f"Could not rotate {DATA_LOG_FILE}: {e}")
+            return
+        # Nicht-daemon: ein laufendes gzip wird beim Beenden noch fertig geschrieben
+        threading.Thread(target=gzip_file, args=(archive,), name="csv-gzip").start()
+    
+    def _close_data_log(self):
+        """Flush and close the persistent data CSV handle (if open)."""
+        self._data_log.close()
+    
+    def _write_data_rows(self, rows):
+        """Write a batch of rows (runs in a worker thread, see _csv_writer_loop)."""
+        with self._csv_lock:
+            for row in rows:
+                self._write_data_row(row)
+    
+    def _queue_data_row(self, row):
+        """
+        Hand a CSV row to the writer task without touching the disk.
+        
+        If the queue is full (storage stalled for a long time) the oldest row is dropped.
+        """
+        queue = self._csv_queue
+        if queue.full():
+            queue.get_nowait()
+            error_logger.warning("Data CSV writer is behind - dropped the oldest queued row")
+        queue.put_nowait(row)
+    
+    async def _csv_writer_loop(self):
+        """
+        Schreibt die Daten-CSV im Hintergrund.
+        
+        Wartet auf die nächste Zeile, nimmt alles mit was inzwischen ansteht und
+        schreibt den Stapel in einem Worker-Thread - ein langsames Laufwerk
+        (SD-Karte, Netzlaufwerk) verzögert so nie den Modbus-Takt.
+        """
+        queue = self._csv_queue
+        while True:
+            rows = [await queue.get()]
+            while not queue.empty():
+                rows.append(queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._write_data_rows, rows)
+            except Exception as e:
+                error_logger.error(f"Data logging Fehler: {e}")
+                error_logger.debug("Traceback:", exc_info=True)
+    
+    def _shutdown_data_log(self):
+        """Stop the writer task, write rows still queued and close the data CSV."""
+        if self._csv_task:
+            self._csv_task.cancel()
+        queue = self._csv_queue
+        rows = []
+        while queue is not None and not queue.empty():
+            rows.append(queue.get_nowait())
+        try:
+            self._write_data_rows(rows)  # Lock: wartet auf einen laufenden Batch
+        except Exception as e:
+            error_logger.error(f"Data logging Fehler beim Beenden: {e}")
+        with self._csv_lock:
+            self._close_data_log()
+    
     async def run(self):
         """Main loop."""
-        print("=" * 80)
+        self._loop = asyncio.get_running_loop()
+        self._excavator_exited = asyncio.Event()
+        # Initiale Wetterdaten sofort im Executor anfordern - der Abruf läuft parallel
+        # zu den (blockierenden) Miner- und NiceHash-Abfragen unten statt danach
+        initial_weather_future = self._loop.run_in_executor(None, self.weather.get_current_weather) if self.weather else None
+        print(BANNER_LINE)
         print(f"⚡ {t('system_title').upper()}")
-        print("=" * 80)
+        print(BANNER_LINE)
         print(f"GPU Devices: {', '.join(DEVICE_IDS)}")
         print(f"Algorithm: {ALGORITHM}")
-        print(f"Wallet: {NICEHASH_WALLET.split('.')[0][:20]}...")
-        print(f"Worker: {NICEHASH_WALLET.split('.')[1]}")
+        print(f"Wallet: {NICEHASH_WALLET_ADDRESS[:20]}...")
+        print(f"Worker: {NICEHASH_WORKER_NAME or 'default'}")
         print(f"Miner: {self.excavator.miner_type}")
         print(f"Dynamisches GPU-Scaling:")
         print(f"  • 1 GPU  = {MIN_POWER_TO_START}W")
@@ -3174,7 +4164,7 @@ class SolarMiningController:
         print(f"Stop bei: < {MIN_POWER_TO_KEEP}W (alle GPUs)")
         print(f"Check-Intervall: {CHECK_INTERVAL}s")
         print(f"Alarm-Check: {ALARM_CHECK_INTERVAL}s")
-        print("=" * 80)
+        print(BANNER_LINE)
         print()
         
         # Initial Status - QuickMiner may have auto-started
@@ -3206,7 +4196,11 @@ class SolarMiningController:
             print(f"   Solar: {initial_solar:.0f}W | Verfügbar: {initial_available:.0f}W")
             
             target_gpu_count = self.calculate_target_gpu_count(initial_available)
-            if target_gpu_count > 0:
+            if self.is_mining:
+                # start_mining() prüft worker.list nicht mehr selbst - bei laufendem
+                # Mining kein zweites subscribe/algorithm.add/worker.add senden
+                print(f"   ℹ️  {t('mining_already_running')}")
+            elif target_gpu_count > 0:
                 print(f"   ✅ Genug Power für {target_gpu_count} GPU(s)!")
                 print(f"\n   🚀 STARTE MINING SOFORT MIT {target_gpu_count} GPU(s)!\n")
                 
@@ -3234,7 +4228,8 @@ class SolarMiningController:
         # Hole NiceHash Account Stats (mit Authentifizierung)
         print("💰 Hole NiceHash Account Stats...")
         if self.nicehash.authenticated:
-            earnings = self.nicehash.get_earnings_info()
+            earnings = self.nicehash.get_cached_earnings()
+            self.last_earnings = earnings
             if earnings:
                 print(f"   📊 BTC BALANCE:")
                 print(f"      Unbezahlt:   {self.nicehash.format_btc(earnings['unpaid_btc'])}")
@@ -3282,7 +4277,11 @@ class SolarMiningController:
         # Hole initiale Wetterdaten (Cache füllen für CSV!)
         if self.weather:
             print("🌤️  Hole initiale Wetterdaten...")
-            initial_weather = self.weather.get_current_weather()
+            try:
+                initial_weather = await initial_weather_future
+            except Exception as e:
+                error_logger.warning(f"Initial weather fetch failed: {e}")
+                initial_weather = None
             if initial_weather:
                 self.last_weather_data = initial_weather
                 print(f"   ✓ Temperatur: {initial_weather.get('temperature_c', 0):.1f}°C")
@@ -3292,33 +4291,62 @@ class SolarMiningController:
                 print("   ⚠️  Wetterdaten nicht verfügbar")
             print()
         
+        # Earnings laufen in eigenem Task mit langem Intervall
+        if self.nicehash.authenticated and self._earnings_task is None:
+            self._earnings_task = asyncio.create_task(self._earnings_loop())
+        
+        # GPU-Last/-Temperatur ebenfalls im Hintergrund (blockierender nvidia-smi Aufruf)
+        if self._gpu_task is None:
+            self._gpu_task = asyncio.create_task(self._gpu_poller())
+        
+        # Wetter ebenso: ein hängender Open-Meteo-Request hält den Regelkreis nicht auf
+        if self.weather and self._weather_task is None:
+            self._weather_task = asyncio.create_task(self._weather_loop())
+        
+        # CSV-Zeilen gehen über eine Queue an einen eigenen Writer-Task
+        if self._csv_task is None:
+            self._csv_queue = asyncio.Queue(maxsize=CSV_QUEUE_SIZE)
+            self._csv_task = asyncio.create_task(self._csv_writer_loop())
+        
+        # Status-Labels einmal übersetzen statt t() bei jedem Tick (Sprache ist zur Laufzeit fix)
+        self._lbl = {key: t(key) for key in (
+            'solar_production', 'consumption', 'house_consumption', 'grid_export', 'to_grid',
+            'grid_import', 'from_grid', 'available_power', 'for_mining', 'mining_status', 'mining_stopped',
+        )}
+        lbl = self._lbl
+        
         print("�🔄 Starte Monitoring...\n")
         
         iteration = 0
         last_earnings_check = 0
         last_alarm_check = 0  # Separater Timer für Alarm-Checks
         
+        # Periodische Aufgaben nach Uhrzeit statt Iterationszähler. Gestaffelt starten,
+        # damit nicht alle im selben Tick fällig werden
+        loop_start = time.time()
+        self._last_rig_status_ts = loop_start - RIG_STATUS_INTERVAL / 2
+        self._last_health_ts = loop_start
+        
+        # Häufig genutzte Globals als Locals binden (LOAD_FAST statt LOAD_GLOBAL im Loop)
+        _now = datetime.now
+        _fromtimestamp = datetime.fromtimestamp
+        _time = time.time
+        _sleep = asyncio.sleep
+        _loop_time = self._loop.time
+        # Feste Deadlines statt "arbeiten, dann Intervall schlafen": die Dauer der
+        # Iteration verschiebt den Takt nicht (gleichmäßige Abstände in der CSV)
+        next_tick = _loop_time()
+        
         try:
             while True:
                 iteration += 1
-                now = datetime.now().strftime("%H:%M:%S")
-                current_time = time.time()
+                current_time = _time()
                 
                 # Prüfe Excavator Health bei JEDER Iteration (alle 2 Minuten)
-                # Dies ermöglicht schnelleres Erkennen von Problemen
-                self.check_excavator_health()
-                
-                # Prüfe Inverter Alarme (häufiger als normale Checks!)
-                if current_time - last_alarm_check >= ALARM_CHECK_INTERVAL:
-                    try:
-                        await self.check_inverter_alarms()
-                        last_alarm_check = current_time
-                    except asyncio.TimeoutError:
-                        # Timeout during alarm check - not critical, just skip this check
-                        last_alarm_check = current_time  # Update timer to prevent spam
-                    except Exception as e:
-                        error_logger.warning(f"Alarm check failed: {e}")
-                        last_alarm_check = current_time  # Update timer to prevent spam
+                # Dies ermöglicht schnelleres Erkennen von Problemen.
+                # Im Thread: API-Timeouts, terminate()/wait() und der Neustart (bis 30s)
+                # blockieren sonst den Event-Loop (Alarm-/Earnings-/GPU-Tasks).
+                await asyncio.to_thread(self.check_excavator_health)
                 
                 # Prüfe GPU Temperaturen und throttle wenn nötig
                 if current_time - self.last_thermal_check >= GPU_THERMAL_CHECK_INTERVAL:
@@ -3329,9 +4357,13 @@ class SolarMiningController:
                         error_logger.warning(f"Thermal check failed: {e}")
                         self.last_thermal_check = current_time
                 
-                # Lese Solar-Daten (mit Error Handling für Connection Loss)
+                # Lese Solar-Daten (mit Error Handling für Connection Loss) - parallel zu
+                # Excavator worker.list: Modbus und JSON-RPC warten so gleichzeitig statt nacheinander
                 try:
-                    solar, house, available = await self.get_available_solar_power()
+                    (solar, house, available), workers = await asyncio.gather(
+                        self.get_available_solar_power(),
+                        asyncio.to_thread(self.excavator.get_workers),
+                    )
                 except asyncio.TimeoutError:
                     error_logger.error(f"Modbus timeout in main loop - reconnecting")
                     print(f"\n⏱️  Modbus Timeout!")
@@ -3349,23 +4381,23 @@ class SolarMiningController:
                     
                     # Versuche Reconnect
                     print(f"🔄 Versuche Wiederverbindung zum Inverter...")
-                    try:
+                    with suppress(Exception):
                         if self.bridge:
                             await self.bridge.stop()
                             self.bridge = None
-                    except:
-                        pass
                     
-                    # Reconnect mit retry logic (ruft connect() auf, die unbegrenzt versucht)
+                    # Reconnect über connect(): versucht unbegrenzt, oder bei gesetztem
+                    # INVERTER_CONNECT_MAX_ATTEMPTS -> InverterUnreachableError aus run() heraus
+                    # (Mining ist oben schon gestoppt, main() räumt auf und endet mit Exit-Code 1)
                     await self.connect()
                     print(f"✅ Wiederverbindung erfolgreich! Setze Monitoring fort...\n")
-                    await asyncio.sleep(CHECK_INTERVAL)
+                    await _sleep(CHECK_INTERVAL)
+                    next_tick = _loop_time()  # Takt nach dem Reconnect neu ansetzen
                     continue
                     
                 except Exception as e:
-                    tb = traceback.format_exc()
                     error_logger.error(f"Error reading solar data in main loop: {e}")
-                    error_logger.debug(f"Traceback:\n{tb}")
+                    error_logger.debug("Traceback:", exc_info=True)  # formatiert nur wenn DEBUG aktiv
                     print(f"\n⚠️  Verbindung zum Inverter verloren!")
                     # Print a concise but informative error to console and point to logs for details
                     try:
@@ -3384,180 +4416,187 @@ class SolarMiningController:
                     
                     # Versuche Reconnect
                     print(f"🔄 Versuche Wiederverbindung zum Inverter...")
-                    try:
+                    with suppress(Exception):
                         if self.bridge:
                             await self.bridge.stop()
                             self.bridge = None
-                    except:
-                        pass
                     
-                    # Reconnect mit retry logic (ruft connect() auf, die unbegrenzt versucht)
+                    # Reconnect über connect(): versucht unbegrenzt, oder bei gesetztem
+                    # INVERTER_CONNECT_MAX_ATTEMPTS -> InverterUnreachableError aus run() heraus
+                    # (Mining ist oben schon gestoppt, main() räumt auf und endet mit Exit-Code 1)
                     await self.connect()
                     print(f"✅ Wiederverbindung erfolgreich! Setze Monitoring fort...\n")
-                    await asyncio.sleep(CHECK_INTERVAL)
+                    await _sleep(CHECK_INTERVAL)
+                    next_tick = _loop_time()  # Takt nach dem Reconnect neu ansetzen
                     continue
                 
-                # Status Update
+                # Ein Zeitstempel pro Messung - für Session, CSV und Status-Ausgabe.
+                # Epoch-Wert direkt behalten: naive datetime.timestamp() ginge über mktime()
+                now_ts = _time()
+                now_dt = _fromtimestamp(now_ts)
+                now = now_dt.strftime("%H:%M:%S")
+                
+                # Status Update - worker.list nur EINMAL pro Iteration abfragen (oben)
                 was_mining = self.is_mining
-                self.is_mining = self.excavator.is_mining()
-                total_hashrate, gpu_hashrates = self.excavator.get_hashrate() if self.is_mining else (0, {})
+                self.is_mining = len(workers) > 0
+                total_hashrate, gpu_hashrates = self.excavator.get_hashrate(workers) if self.is_mining else (0, {})
                 
                 # Track Mining-Zeit
                 if self.is_mining and not was_mining:
-                    self.mining_start_time = datetime.now()
+                    self.mining_start_time = now_dt
                 elif not self.is_mining and was_mining and self.mining_start_time:
-                    session_time = (datetime.now() - self.mining_start_time).total_seconds()
+                    session_time = (now_dt - self.mining_start_time).total_seconds()
                     self.total_mining_time += session_time
                     self.mining_start_time = None
                 
                 # Berechne aktuelle Mining-Session Zeit
                 session_time = 0
                 if self.is_mining and self.mining_start_time:
-                    session_time = (datetime.now() - self.mining_start_time).total_seconds()
+                    session_time = (now_dt - self.mining_start_time).total_seconds()
                 
                 # Berechne tatsächlichen Haus-Verbrauch
                 actual_house_consumption = solar - house if house > 0 else solar + abs(house)
                 
-                # GPU Info sammeln - check all configured GPUs
-                gpu_usage = 0
-                gpu_temp = 0
-                try:
-                    gpus = GPUtil.getGPUs()
-                    if gpus:
-                        # Collect data from all configured GPUs
-                        total_usage = 0
-                        total_temp = 0
-                        active_gpus = 0
-                        for device_id in DEVICE_IDS:
-                            gpu_index = int(device_id)
-                            if gpu_index < len(gpus):
-                                gpu = gpus[gpu_index]
-                                total_usage += gpu.load * 100
-                                total_temp += gpu.temperature
-                                active_gpus += 1
-                        # Average across all GPUs
-                        if active_gpus > 0:
-                            gpu_usage = total_usage / active_gpus
-                            gpu_temp = total_temp / active_gpus
-                except:
-                    pass
-                
-                # Hole ALLE Inverter-Daten
-                inverter_data = await self.get_all_inverter_data()
-                
-                # Berechne String-Powers (sichere None-Handling)
-                pv1_voltage = inverter_data.get('pv_01_voltage') or 0
-                pv1_current = inverter_data.get('pv_01_current') or 0
-                pv2_voltage = inverter_data.get('pv_02_voltage') or 0
-                pv2_current = inverter_data.get('pv_02_current') or 0
-                pv1_power = pv1_voltage * pv1_current
-                pv2_power = pv2_voltage * pv2_current
-                
-                # Berechne Grid Phase Powers (sichere None-Handling)
-                grid_a_voltage = inverter_data.get('grid_A_voltage') or 0
-                grid_a_current = inverter_data.get('grid_A_current') or 0
-                grid_b_voltage = inverter_data.get('grid_B_voltage') or 0
-                grid_b_current = inverter_data.get('grid_B_current') or 0
-                grid_c_voltage = inverter_data.get('grid_C_voltage') or 0
-                grid_c_current = inverter_data.get('grid_C_current') or 0
-                grid_a_power = grid_a_voltage * grid_a_current
-                grid_b_power = grid_b_voltage * grid_b_current
-                grid_c_power = grid_c_voltage * grid_c_current
-                
-                # Hole Wetter-Daten (API-Call nur alle 10 Minuten, aber Cache immer verwenden!)
-                if self.weather and iteration % 20 == 0:  # Alle 10 Minuten API-Call
-                    new_weather = self.weather.get_current_weather()
-                    if new_weather:
-                        self.last_weather_data = new_weather  # Update Cache
-                
-                # Verwende immer die gecachten Wetterdaten (auch zwischen API-Calls!)
+                # GPU Info - Durchschnitt aller konfigurierten GPUs (vom GPU-Poller)
+                gpu_usage, gpu_temp = self.last_gpu_stats
+                
+                # Hole ALLE Inverter-Daten - nur wenn eine CSV-Zeile fällig ist oder
+                # sich der Mining-Status geändert hat; sonst reicht der letzte Snapshot
+                # (die Start/Stop-Entscheidung nutzt nur get_available_solar_power)
+                full_snapshot = (
+                    current_time - self._last_snapshot_ts >= FULL_SNAPSHOT_INTERVAL
+                    or self.is_mining != was_mining
+                    or not self.last_inverter_data
+                )
+                if full_snapshot:
+                    self._last_snapshot_ts = current_time
+                    inverter_data = await self.get_all_inverter_data()
+                    self.last_inverter_data = inverter_data
+                else:
+                    inverter_data = self.last_inverter_data
+                
+                # Prüfe Inverter Alarme (nutzt den Register-Snapshot von oben)
+                if current_time - last_alarm_check >= ALARM_CHECK_INTERVAL:
+                    try:
+                        await self.check_inverter_alarms()
+                        last_alarm_check = current_time
+                    except asyncio.TimeoutError:
+                        # Timeout during alarm check - not critical, just skip this check
+                        last_alarm_check = current_time  # Update timer to prevent spam
+                    except Exception as e:
+                        error_logger.warning(f"Alarm check failed: {e}")
+                        last_alarm_check = current_time  # Update timer to prevent spam
+                
+                # Verwende immer die gecachten Wetterdaten (vom Wetter-Task aktualisiert)
                 weather_data = self.last_weather_data
                 
                 # Get current algorithm(s) for logging
-                current_algos = self.excavator.get_current_algorithms()
+                current_algos = self.excavator.get_current_algorithms(workers)
                 algo_str = ""
                 if current_algos:
                     unique_algos = set(current_algos.values())
                     algo_str = ",".join(sorted(unique_algos))
                 
-                # DATA LOGGING - CSV für Auswertungen/ML
-                try:
-                    with open(DATA_LOG_FILE, 'a', newline='', encoding='utf-8') as f:
-                        writer = csv.writer(f)
-                        writer.writerow([
-                            # Basis
-                            datetime.now().isoformat(),
-                            int(datetime.now().timestamp()),
-                            # Solar/Grid
-                            solar,
-                            house,
-                            actual_house_consumption,
-                            max(0, house),  # Einspeisung (nur positiv)
-                            max(0, -house),  # Netzbezug (nur negativ -> positiv)
-                            available,
-                            # Mining
-                            1 if self.is_mining else 0,
-                            1 if self.gpu_paused else 0,
-                            total_hashrate / 1e6 if total_hashrate > 0 else 0,
-                            algo_str,
-                            self.excavator.consecutive_errors,
-                            self.start_confirmations,
-                            self.stop_confirmations,
-                            # GPU
-                            gpu_usage,
-                            gpu_temp,
-                            # String-Daten (PV)
-                            pv1_voltage,
-                            pv1_current,
-                            pv1_power,
-                            pv2_voltage,
-                            pv2_current,
-                            pv2_power,
-                            # Grid Details (3 Phasen)
-                            grid_a_voltage,
-                            grid_b_voltage,
-                            grid_c_voltage,
-                            grid_a_current,
-                            grid_b_current,
-                            grid_c_current,
-                            grid_a_power,
-                            grid_b_power,
-                            grid_c_power,
-                            # Inverter Status
-                            inverter_data.get('internal_temperature') or 0,
-                            inverter_data.get('efficiency') or 0,
-                            inverter_data.get('daily_yield_energy') or 0,
-                            inverter_data.get('accumulated_yield_energy') or 0,
-                            # Batterie (optional)
-                            inverter_data.get('battery_charge_discharge_power') or 0,
-                            inverter_data.get('battery_state_of_capacity') or 0,
-                            # Wetter
-                            weather_data.get('temperature_c', 0) if weather_data else 0,
-                            weather_data.get('cloud_cover_percent', 0) if weather_data else 0,
-                            weather_data.get('wind_speed_kmh', 0) if weather_data else 0,
-                            weather_data.get('precipitation_mm', 0) if weather_data else 0,
-                            weather_data.get('global_radiation_wm2', 0) if weather_data else 0,
-                            weather_data.get('direct_radiation_wm2', 0) if weather_data else 0,
-                            weather_data.get('diffuse_radiation_wm2', 0) if weather_data else 0,
-                            # Inverter Alarms (safe conversion: Liste → int, leere Liste → 0)
-                            (inverter_data.get('alarm_1')[0] if (isinstance(inverter_data.get('alarm_1'), list) and len(inverter_data.get('alarm_1', [])) > 0) else (inverter_data.get('alarm_1') if not isinstance(inverter_data.get('alarm_1'), list) else 0)) or 0,
-                            (inverter_data.get('alarm_2')[0] if (isinstance(inverter_data.get('alarm_2'), list) and len(inverter_data.get('alarm_2', [])) > 0) else (inverter_data.get('alarm_2') if not isinstance(inverter_data.get('alarm_2'), list) else 0)) or 0,
-                            (inverter_data.get('alarm_3')[0] if (isinstance(inverter_data.get('alarm_3'), list) and len(inverter_data.get('alarm_3', [])) > 0) else (inverter_data.get('alarm_3') if not isinstance(inverter_data.get('alarm_3'), list) else 0)) or 0,
-                            inverter_data.get('device_status') or 0
-                        ])
-                except Exception as e:
-                    error_logger.error(f"Data logging Fehler: {e}")
-                    error_logger.debug(f"Traceback:\n{traceback.format_exc()}")
+                # DATA LOGGING - CSV für Auswertungen/ML (eine Zeile pro vollem Snapshot)
+                if full_snapshot:
+                    # Werte einmal in Locals auspacken statt Lookups im Row-Literal
+                    # (Alarme sind bereits von get_all_inverter_data() zu int normalisiert)
+                    get_inv = inverter_data.get
+                    
+                    # String- und Phasenleistung (P = U * I) in einem Durchgang (sichere None-Handling)
+                    # Ein Durchgang über alle Paare, dann Spannungen/Ströme per Slice trennen
+                    power_values = [get_inv(key) or 0 for key in POWER_KEYS]
+                    voltages = power_values[0::2]
+                    currents = power_values[1::2]
+                    pv1_voltage, pv2_voltage, grid_a_voltage, grid_b_voltage, grid_c_voltage = voltages
+                    pv1_current, pv2_current, grid_a_current, grid_b_current, grid_c_current = currents
+                    pv1_power, pv2_power, grid_a_power, grid_b_power, grid_c_power = map(
+                        operator.mul, voltages, currents
+                    )
+                    
+                    weather = weather_data or EMPTY_WEATHER  # Alle Wetter-Keys immer vorhanden
+                    sample = {
+                        # Basis ('timestamp' wird erst beim Schreiben formatiert)
+                        'unix_timestamp': int(now_ts),
+                        # Solar/Grid
+                        'solar_production_w': solar,
+                        'grid_power_w': house,
+                        'house_consumption_w': actual_house_consumption,
+                        'grid_feed_in_w': max(0, house),  # Einspeisung (nur positiv)
+                        'grid_import_w': max(0, -house),  # Netzbezug (nur negativ -> positiv)
+                        'available_for_mining_w': available,
+                        # Mining
+                        'mining_active': 1 if self.is_mining else 0,
+                        'mining_paused': 1 if self.gpu_paused else 0,
+                        'hashrate_mhs': total_hashrate / 1e6 if total_hashrate > 0 else 0,
+                        'algorithm': algo_str,
+                        'excavator_errors': self.excavator.consecutive_errors,
+                        'start_confirmations': self.start_confirmations,
+                        'stop_confirmations': self.stop_confirmations,
+                        # GPU
+                        'gpu_usage_percent': gpu_usage,
+                        'gpu_temp_c': gpu_temp,
+                        # String-Daten (PV)
+                        'pv_01_voltage_v': pv1_voltage,
+                        'pv_01_current_a': pv1_current,
+                        'pv_01_power_w': pv1_power,
+                        'pv_02_voltage_v': pv2_voltage,
+                        'pv_02_current_a': pv2_current,
+                        'pv_02_power_w': pv2_power,
+                        # Grid Details (3 Phasen)
+                        'grid_A_voltage_v': grid_a_voltage,
+                        'grid_B_voltage_v': grid_b_voltage,
+                        'grid_C_voltage_v': grid_c_voltage,
+                        'grid_A_current_a': grid_a_current,
+                        'grid_B_current_a': grid_b_current,
+                        'grid_C_current_a': grid_c_current,
+                        'grid_A_power_w': grid_a_power,
+                        'grid_B_power_w': grid_b_power,
+                        'grid_C_power_w': grid_c_power,
+                        # Inverter Status
+                        'internal_temp_c': get_inv('internal_temperature') or 0,
+                        'efficiency_percent': get_inv('efficiency') or 0,
+                        'daily_yield_kwh': get_inv('daily_yield_energy') or 0,
+                        'total_yield_kwh': get_inv('accumulated_yield_energy') or 0,
+                        # Batterie (optional)
+                        'battery_power_w': get_inv('battery_charge_discharge_power') or 0,
+                        'battery_soc_percent': get_inv('battery_state_of_capacity') or 0,
+                        # Wetter
+                        'weather_temp_c': weather['temperature_c'],
+                        'weather_cloud_cover_percent': weather['cloud_cover_percent'],
+                        'weather_wind_speed_kmh': weather['wind_speed_kmh'],
+                        'weather_precipitation_mm': weather['precipitation_mm'],
+                        'weather_global_radiation_wm2': weather['global_radiation_wm2'],
+                        'weather_direct_radiation_wm2': weather['direct_radiation_wm2'],
+                        'weather_diffuse_radiation_wm2': weather['diffuse_radiation_wm2'],
+                        # Inverter Alarms
+                        'inverter_alarm_1': get_inv('alarm_1') or 0,
+                        'inverter_alarm_2': get_inv('alarm_2') or 0,
+                        'inverter_alarm_3': get_inv('alarm_3') or 0,
+                        'inverter_device_status': get_inv('device_status') or 0,
+                    }
+                    # Delta-Logging: unveränderte Werte nicht erneut schreiben,
+                    # aber spätestens alle DATA_LOG_HEARTBEAT Sekunden eine Zeile
+                    # (geschrieben wird im Writer-Task, Fehler loggt _csv_writer_loop)
+                    if (not DATA_LOG_DELTA_ONLY
+                            or current_time - self._last_logged_ts >= DATA_LOG_HEARTBEAT
+                            or sample_changed(sample, self._last_logged_sample)):
+                        sample['timestamp'] = now_dt.isoformat()
+                        self._queue_data_row(CSV_ROW_FULL(sample))
+                        self._last_logged_sample = sample
+                        self._last_logged_ts = current_time
                 
-                print(f"[{iteration:3d}] {now}")
-                print(f"      ☀️  {t('solar_production')}:       {solar:>6.0f} W")
+                # Status-Block sammeln und mit EINEM stdout-Write ausgeben
+                lines = []
+                lines.append(f"[{iteration:3d}] {now}")
+                lines.append(f"      ☀️  {lbl['solar_production']}:       {solar:>6.0f} W")
                 if house > 0:
-                    print(f"      🏠 {t('consumption')}:   {actual_house_consumption:>6.0f} W {t('house_consumption')}")
-                    print(f"      📤 {t('grid_export')}: {house:>6.0f} W {t('to_grid')}")
+                    lines.append(f"      🏠 {lbl['consumption']}:   {actual_house_consumption:>6.0f} W {lbl['house_consumption']}")
+                    lines.append(f"      📤 {lbl['grid_export']}: {house:>6.0f} W {lbl['to_grid']}")
                 else:
-                    print(f"      🏠 {t('consumption')}:   {actual_house_consumption:>6.0f} W {t('house_consumption')}")
-                    print(f"      📥 {t('grid_import')}:   {abs(house):>6.0f} W {t('from_grid')}")
-                print(f"      ✨ {t('available_power')}:   {available:>6.0f} W {t('for_mining')}")
+                    lines.append(f"      🏠 {lbl['consumption']}:   {actual_house_consumption:>6.0f} W {lbl['house_consumption']}")
+                    lines.append(f"      📥 {lbl['grid_import']}:   {abs(house):>6.0f} W {lbl['from_grid']}")
+                lines.append(f"      ✨ {lbl['available_power']}:   {available:>6.0f} W {lbl['for_mining']}")
                 
                 # Mining Status mit GPU-Anzahl und Hashrate-Validierung
                 if self.is_mining:
@@ -3568,23 +4607,20 @@ class SolarMiningController:
                     # Hashrate-Validierung: Mining sollte aktiv sein, aber prüfe ob Hashrate > 0
                     if total_hashrate == 0 and session_time > 120:  # Nach 2 Minuten sollte Hashrate da sein
                         status_icon = "🔴"
-                        print(f"      ⛏️  {t('mining_status')}:      {status_icon} Mining FEHLER ({active_count}/{len(DEVICE_IDS)} GPUs)")
-                        print(f"      ⚠️  WARNUNG: Kein Hashrate trotz aktivem Mining!")
-                        print(f"      ℹ️  Mögliche Ursachen:")
-                        print(f"         • DAG-Generierung läuft noch (warte 5-10 Min)")
-                        print(f"         • Algorithmus nicht unterstützt")
-                        print(f"         • GPU-Fehler oder Treiberproblem")
+                        lines.append(f"      ⛏️  {lbl['mining_status']}:      {status_icon} Mining FEHLER ({active_count}/{len(DEVICE_IDS)} GPUs)")
+                        lines.append(f"      ⚠️  WARNUNG: Kein Hashrate trotz aktivem Mining!")
+                        lines.append(f"      ℹ️  Mögliche Ursachen:")
+                        lines.append(f"         • DAG-Generierung läuft noch (warte 5-10 Min)")
+                        lines.append(f"         • Algorithmus nicht unterstützt")
+                        lines.append(f"         • GPU-Fehler oder Treiberproblem")
                         error_logger.warning(f"Mining active but no hashrate after {session_time:.0f}s - possible issue!")
                     elif active_count < target_count:
                         status_icon = "🟡"  # Könnte mehr GPUs nutzen
-                        print(f"      ⛏️  {t('mining_status')}:      {status_icon} Mining ({active_count}/{len(DEVICE_IDS)} GPUs)")
+                        lines.append(f"      ⛏️  {lbl['mining_status']}:      {status_icon} Mining ({active_count}/{len(DEVICE_IDS)} GPUs)")
                     else:
-                        print(f"      ⛏️  {t('mining_status')}:      {status_icon} Mining ({active_count}/{len(DEVICE_IDS)} GPUs)")
+                        lines.append(f"      ⛏️  {lbl['mining_status']}:      {status_icon} Mining ({active_count}/{len(DEVICE_IDS)} GPUs)")
                 else:
-                    print(f"      ⛏️  {t('mining_status')}:      🔴 {t('mining_stopped')}")
-                
-                # Get current algorithms for display
-                current_algos = self.excavator.get_current_algorithms()
+                    lines.append(f"      ⛏️  {lbl['mining_status']}:      🔴 {lbl['mining_stopped']}")
                 
                 if total_hashrate > 0:
                     # Show algorithm info
@@ -3592,11 +4628,11 @@ class SolarMiningController:
                         unique_algos = set(current_algos.values())
                         if len(unique_algos) == 1:
                             algo_name = list(unique_algos)[0]
-                            print(f"      📈 {algo_name.upper()}:   {total_hashrate/1e6:.2f} MH/s ✅")
+                            lines.append(f"      📈 {algo_name.upper()}:   {total_hashrate/1e6:.2f} MH/s ✅")
                         else:
-                            print(f"      📈 Total:       {total_hashrate/1e6:.2f} MH/s ✅")
+                            lines.append(f"      📈 Total:       {total_hashrate/1e6:.2f} MH/s ✅")
                     else:
-                        print(f"      📈 Total:       {total_hashrate/1e6:.2f} MH/s ✅")
+                        lines.append(f"      📈 Total:       {total_hashrate/1e6:.2f} MH/s ✅")
                     
                     # Show per-GPU hashrates if multiple GPUs
                     if len(gpu_hashrates) > 1:
@@ -3607,45 +4643,49 @@ class SolarMiningController:
                                 gpu_details.append(f"GPU{gpu_id} ({algo}): {speed/1e6:.1f}")
                             else:
                                 gpu_details.append(f"GPU{gpu_id}: {speed/1e6:.1f}")
-                        print(f"         └─ {', '.join(gpu_details)} MH/s")
+                        lines.append(f"         └─ {', '.join(gpu_details)} MH/s")
                     elif len(gpu_hashrates) == 1:
                         gpu_id = list(gpu_hashrates.keys())[0]
-                        print(f"         └─ GPU{gpu_id}")
+                        lines.append(f"         └─ GPU{gpu_id}")
                 elif self.is_mining:
                     # Mining läuft aber kein Hashrate - zeige Warnung
                     if session_time < 120:
-                        print(f"      📈 Total:       0.00 MH/s ⏳ (Initialisierung...)")
+                        lines.append(f"      📈 Total:       0.00 MH/s ⏳ (Initialisierung...)")
                     else:
-                        print(f"      📈 Total:       0.00 MH/s ❌ (FEHLER!)")
+                        lines.append(f"      📈 Total:       0.00 MH/s ❌ (FEHLER!)")
                 
                 if session_time > 0:
                     mins = int(session_time / 60)
                     secs = int(session_time % 60)
-                    print(f"      ⏱️  Session:     {mins}m {secs}s")
+                    lines.append(f"      ⏱️  Session:     {mins}m {secs}s")
                 
-                # Earnings alle 10 Minuten updaten (wenn API verfügbar)
-                if self.nicehash.authenticated and (iteration % 20 == 0 or (iteration == 1 and earnings is None)):
-                    earnings = self.nicehash.get_earnings_info()
+                # Earnings kommen aus dem Cache des Earnings-Tasks (kein API-Call im Loop)
+                earnings = self.last_earnings
                 
                 # Zeige detaillierte Earnings-Info (wenn verfügbar)
                 if earnings and self.nicehash.authenticated:
-                    print(f"      💰 Balance:     {self.nicehash.format_btc(earnings['unpaid_btc'])} unbezahlt")
+                    lines.append(f"      💰 Balance:     {self.nicehash.format_btc(earnings['unpaid_btc'])} unbezahlt")
                     if earnings.get('current_profitability', 0) > 0:
-                        print(f"      � Profit/Tag:  {self.nicehash.format_profitability(earnings['current_profitability'])}")
+                        lines.append(f"      � Profit/Tag:  {self.nicehash.format_profitability(earnings['current_profitability'])}")
                 
-                # Wetter-Daten anzeigen (alle 10 Minuten)
+                # Wetter-Daten anzeigen (gecacht, Abruf alle 15 Minuten)
                 if weather_data:
-                    print(f"      🌡️  Wetter:      {weather_data.get('temperature_c', 0):.1f}°C, " +
+                    lines.append(f"      🌡️  Wetter:      {weather_data.get('temperature_c', 0):.1f}°C, " +
                           f"☁️ {weather_data.get('cloud_cover_percent', 0):.0f}%, " +
                           f"☀️ {weather_data.get('global_radiation_wm2', 0):.0f} W/m²")
                 
                 # Rig Status alle 10 Minuten anzeigen (wenn mining aktiv)
-                if self.nicehash.authenticated and iteration % 20 == 0 and self.is_mining:
+                if (self.nicehash.authenticated and self.is_mining
+                        and current_time - self._last_rig_status_ts >= RIG_STATUS_INTERVAL):
+                    self._last_rig_status_ts = current_time
                     current_rig = self.nicehash.get_current_rig()
                     if current_rig:
                         rig_status = current_rig['status']
                         status_icon = "✅" if rig_status == "MINING" else "⏸️" if rig_status == "DISABLED" else "💤"
-                        print(f"      🖥️  Rig Status:  {status_icon} {rig_status}")
+                        lines.append(f"      🖥️  Rig Status:  {status_icon} {rig_status}")
+                
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
                 
                 # GPU MONITORING - Prüfe ob andere Software die GPU braucht
                 gpu_busy = False
@@ -3653,7 +4693,10 @@ class SolarMiningController:
                 gpu_process = None
                 
                 if GPU_CHECK_ENABLED and self.is_mining:
-                    gpu_busy, gpu_usage, gpu_process = self.gpu_monitor.get_gpu_usage_by_others()
+                    # GPU-Abfrage + Prozess-Scan sind blockierend -> im Thread
+                    gpu_busy, gpu_usage, gpu_process = await asyncio.to_thread(
+                        self.gpu_monitor.get_gpu_usage_by_others
+                    )
                     
                     if gpu_busy and not self.gpu_paused:
                         # GPU wird von anderem Prozess genutzt - STOPPE Mining für maximale Performance
@@ -3684,8 +4727,16 @@ class SolarMiningController:
                 # ==============================================================
                 # DYNAMISCHE GPU-SKALIERUNGS-LOGIK (nur wenn nicht GPU-gepaused)
                 # ==============================================================
+                # Skalierung laufender GPUs auf dem gleitenden Median - eine einzelne
+                # Wolke soll keine GPU abwerfen und im nächsten Tick wieder hinzufügen.
+                # Start/Stopp bleiben auf dem Rohwert (haben eigene Bestätigungszähler).
+                self._power_window.append(available)
+                smoothed_available = statistics.median(self._power_window)
+                
                 if not self.gpu_paused:
-                    target_gpu_count = self.calculate_target_gpu_count(available)
+                    target_gpu_count = self.calculate_target_gpu_count(
+                        smoothed_available if self.is_mining else available
+                    )
                     current_workers = self.get_active_workers_device_ids()
                     current_count = len(current_workers)
                     
@@ -3709,9 +4760,9 @@ class SolarMiningController:
                                     self.is_mining = True
                                     self.gpu_monitor.set_mining_active(True)
                                     self.start_confirmations = 0
-                                    self.mining_start_time = datetime.now()
+                                    self.mining_start_time = _now()
                                     self.mining_start_failures = 0
-                                    self.last_mining_attempt = time.time()
+                                    self.last_mining_attempt = _time()
                                     self.active_gpu_ids = self.get_active_workers_device_ids()
                                     print(f"      ✅ Mining gestartet mit GPUs: {', '.join(self.active_gpu_ids)}")
                                 else:
@@ -3728,7 +4779,7 @@ class SolarMiningController:
                     else:
                         # Prüfe ob wir GPUs hinzufügen oder entfernen müssen
                         if target_gpu_count != current_count:
-                            changed, new_count = await self.scale_gpus(available)
+                            changed, new_count = await self.scale_gpus(smoothed_available)
                             if changed:
                                 self.active_gpu_ids = self.get_active_workers_device_ids()
                                 print(f"      ℹ️  Aktive GPUs: {', '.join(self.active_gpu_ids)}")
@@ -3753,7 +4804,7 @@ class SolarMiningController:
                                     self.active_gpu_ids = []
                                     # Speichere Mining-Zeit
                                     if self.mining_start_time:
-                                        session_time = (datetime.now() - self.mining_start_time).total_seconds()
+                                        session_time = (_now() - self.mining_start_time).total_seconds()
                                         self.total_mining_time += session_time
                                         self.mining_start_time = None
                         else:
@@ -3765,14 +4816,46 @@ class SolarMiningController:
                 # ==============================================================
                 
                 # GPU Health Check - detect and fix stuck GPUs with 0 hashrate
-                if self.is_mining and iteration % 4 == 0:  # Check every 2 minutes (4 * 30s)
+                if self.is_mining and current_time - self._last_health_ts >= GPU_HEALTH_CHECK_INTERVAL:
+                    self._last_health_ts = current_time
                     await self.check_and_fix_stuck_gpus()
                 
+                # Adaptives Intervall: stabiles Mining mit viel Reserve -> seltener pollen,
+                # jede Grenzsituation oder Statusänderung -> sofort zurück auf CHECK_INTERVAL
+                if (self.is_mining and was_mining and not gpu_busy
+                        and available > STABLE_HEADROOM_POWER
+                        and self.start_confirmations == 0 and self.stop_confirmations == 0
+                        and self.calculate_target_gpu_count(smoothed_available) == len(self.active_gpu_ids)):
+                    self._stable_ticks += 1
+                else:
+                    self._stable_ticks = 0
+                sleep_factor = min(CHECK_INTERVAL_MAX_FACTOR, 1 + self._stable_ticks // STABLE_TICKS_PER_STEP)
+                
                 print("-" * 80)
-                await asyncio.sleep(CHECK_INTERVAL)
+                next_tick += CHECK_INTERVAL * sleep_factor
+                delay = next_tick - _loop_time()
+                if delay < 0:
+                    # Iteration länger als das Intervall: nicht aufholen, ab jetzt neu takten
+                    error_logger.warning("Main loop iteration overran the check interval by %.1fs", -delay)
+                    next_tick -= delay
+                    delay = 0
+                # Schläft bis zum nächsten Tick - oder bis der Excavator-Watcher meldet,
+                # dass der Prozess beendet ist (dann sofort Health-Check + Neustart)
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._excavator_exited.wait(), delay)
+                self._excavator_exited.clear()
                 
         except KeyboardInterrupt:
             print("\n\n⏹️  Beende Controller...")
+            self._stop.set()
+            
+            if self._earnings_task:
+                self._earnings_task.cancel()
+            if self._gpu_task:
+                self._gpu_task.cancel()
+            if self._weather_task:
+                self._weather_task.cancel()
+            self._shutdown_data_log()
             
             # Finale Statistik
             if self.mining_start_time:
@@ -3786,7 +4869,7 @@ class SolarMiningController:
                 
                 # Finale Earnings (mit Details wenn API verfügbar)
                 if self.nicehash.authenticated:
-                    earnings = self.nicehash.get_earnings_info()
+                    earnings = self.nicehash.get_cached_earnings(ttl=0)
                     if earnings:
                         print(f"\n💰 FINALE EARNINGS:")
                         print(f"   Unbezahlt:   {self.nicehash.format_btc(earnings['unpaid_btc'])}")
@@ -3805,8 +4888,9 @@ class SolarMiningController:
                     print("🛑 Beende Excavator...")
                     try:
                         self.excavator.send_command("quit")
+                        self.excavator.close()
                         self.excavator_process.wait(timeout=5)
-                    except:
+                    except Exception:
                         self.excavator_process.terminate()
                     print("✅ Excavator beendet")
             
@@ -3820,9 +4904,12 @@ async def main():
     # ============================================================================
     # AUTO-UPDATE CHECKS
     # ============================================================================
-    print("=" * 80)
+    print(BANNER_LINE)
     print("🔄 AUTO-UPDATE CHECK")
-    print("=" * 80)
+    print(BANNER_LINE)
+    
+    # GitHub + PyPI parallel abfragen (die Checks selbst laufen danach aus dem Cache)
+    prefetch_release_info()
     
     # Check for huawei-solar package updates
     check_and_update_huawei_solar()
@@ -3830,14 +4917,14 @@ async def main():
     # Check for Excavator updates
     check_and_update_excavator(EXCAVATOR_PATH)
     
-    print("=" * 80)
+    print(BANNER_LINE)
     print()
     
     # Prüfe Konfiguration
     if "YOUR_WALLET_ADDRESS" in NICEHASH_WALLET:
-        print("=" * 80)
+        print(BANNER_LINE)
         print("⚠️  KONFIGURATION ERFORDERLICH!")
-        print("=" * 80)
+        print(BANNER_LINE)
         print()
         print("Bitte bearbeite die Datei und setze:")
         print(f"  NICEHASH_WALLET = 'deine_wallet_adresse.worker_name'")
@@ -3845,7 +4932,7 @@ async def main():
         print("Beispiel:")
         print("  NICEHASH_WALLET = '34HKWdzLxWBduUfJE9JxaFhoXnfC6gmePG.solar_rig'")
         print()
-        print("=" * 80)
+        print(BANNER_LINE)
         return
     
     controller = SolarMiningController()
@@ -3854,11 +4941,22 @@ async def main():
         await controller.connect()
         print()
         await controller.run()
+    except InverterUnreachableError as e:
+        # INVERTER_CONNECT_MAX_ATTEMPTS erreicht (Start oder Reconnect im Loop).
+        # Mining ist bereits gestoppt; finally räumt auf. Exit-Code 1, damit ein
+        # Service-Manager / die Aufgabenplanung den Controller neu startet.
+        error_logger.error(f"Giving up: {e}")
+        print(f"\n❌ {e} - beende Controller")
+        return 1
     except Exception as e:
         print(f"\n❌ Fehler: {e}")
         import traceback
         traceback.print_exc()
     finally:
+        controller._stop.set()
+        controller._shutdown_data_log()
+        controller.gpu_monitor.shutdown()
+        controller.excavator.close()
         if controller.bridge:
             await controller.bridge.stop()
 
@@ -3871,4 +4969,4 @@ if __name__ == "__main__":
     print("╚" + "=" * 78 + "╝")
     print()
     
-    asyncio.run(main())
+    sys.exit(asyncio.run(main()))
@@ -16,7 +16,6 @@ import asyncio
 import os
 import logging
 import traceback
-import csv
 from datetime import datetime, time as dt_time
 from pathlib import Path
 from dotenv import load_dotenv
@@ -29,6 +28,8 @@ from solar_core import (
     CSVLogger,
     AlarmDiagnostics,
     EmailNotifier,
+    read_register_block,
+    EMPTY_WEATHER,
     setup_logging as core_setup_logging,
     CSV_COLUMNS_MINIMAL
 )
@@ -61,6 +62,8 @@ WEATHER_UPDATE_INTERVAL = int(os.getenv("WEATHER_UPDATE_INTERVAL_SEC", "600"))
 # Check intervals
 CHECK_INTERVAL = int(os.getenv("CHECK_INTERVAL_SEC", "30"))
 ALARM_CHECK_INTERVAL = int(os.getenv("ALARM_CHECK_INTERVAL_SEC", "5"))
+WEATHER_UPDATE_EVERY = max(1, WEATHER_UPDATE_INTERVAL // CHECK_INTERVAL)  # Wetter-Update alle N Iterationen
+MODBUS_READ_TIMEOUT = int(os.getenv("MODBUS_READ_TIMEOUT", "10"))  # Upper bound per Modbus read (seconds)
 
 # Email configuration
 EMAIL_ENABLED = os.getenv("EMAIL_ENABLED", "false").lower() == "true"
@@ -76,15 +79,36 @@ EMAIL_SEND_ON_CRITICAL_ERROR = os.getenv("EMAIL_SEND_ON_CRITICAL_ERROR", "true")
 EMAIL_SEND_DAILY_SUMMARY = os.getenv("EMAIL_SEND_DAILY_SUMMARY", "false").lower() == "true"
 EMAIL_DAILY_SUMMARY_TIME = os.getenv("EMAIL_DAILY_SUMMARY_TIME", "18:00")
 
+# Contiguous inverter register blocks (ascending SUN2000 register order),
+# each read in ONE Modbus transaction via read_register_block()
+BLOCK_ALARMS = ("alarm_1", "alarm_2", "alarm_3")  # 32008-32010
+BLOCK_ALARMS_PV = BLOCK_ALARMS + (  # 32008-32019
+    "pv_01_voltage", "pv_01_current", "pv_02_voltage", "pv_02_current",
+)
+BLOCK_PV = BLOCK_ALARMS_PV[3:]  # 32016-32019
+BLOCK_STATUS = (  # 32064-32114
+    "input_power", "grid_A_voltage", "grid_B_voltage", "grid_C_voltage",
+    "efficiency", "internal_temperature", "device_status",
+    "accumulated_yield_energy", "daily_yield_energy",
+)
+BLOCK_GRID = ("grid_A_voltage", "grid_B_voltage", "grid_C_voltage", "grid_frequency")  # 32069-32085
+BLOCK_YIELD = ("accumulated_yield_energy", "daily_yield_energy")  # 32106-32114
+BLOCK_METER = ("power_meter_active_power", "grid_exported_energy")  # 37113-37119
+BLOCK_BATTERY = ("storage_state_of_capacity", "storage_charge_discharge_power")  # 37760-37765
+
 # LOGGING
 LOG_DIR = Path(os.getenv("LOG_DIR", "logs"))
 LOG_DIR.mkdir(exist_ok=True)
 ERROR_LOG_FILE = LOG_DIR / os.getenv("ERROR_LOG_FILENAME", "errors.log")
 DATA_LOG_FILE = LOG_DIR / os.getenv("CSV_FILENAME", "solar_data.csv")
+CSV_BUFFER_SIZE = 64 * 1024  # Write buffer of the persistent data CSV handle
+CSV_FLUSH_EVERY = 10  # Flush the data CSV every N rows (~5 min at CHECK_INTERVAL_SEC=30)
 
 # Setup Error Logger
+# LOG_LEVEL=INFO skips the debug diagnostics (tracebacks are only formatted via lazy exc_info)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG").upper()
 error_logger = logging.getLogger('error_logger')
-error_logger.setLevel(logging.DEBUG)
+error_logger.setLevel(getattr(logging, LOG_LEVEL, logging.DEBUG))
 error_handler = logging.FileHandler(ERROR_LOG_FILE, encoding='utf-8')
 error_handler.setLevel(logging.DEBUG)
 error_formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s')
@@ -225,28 +249,7 @@ Alarme heute: {summary_data.get('alarm_count', 0)}
         return False
 
 # WeatherAPI wird aus solar_core importiert (siehe oben)
-
-def init_data_log():
-    """Initialisiert CSV-Datei."""
-    if not DATA_LOG_FILE.exists():
-        with open(DATA_LOG_FILE, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'timestamp', 'unix_timestamp',
-                'solar_production_w', 'grid_power_w', 'house_consumption_w',
-                'grid_feed_in_w', 'grid_import_w',
-                'pv_01_voltage_v', 'pv_01_current_a', 'pv_01_power_w',
-                'pv_02_voltage_v', 'pv_02_current_a', 'pv_02_power_w',
-                'grid_A_voltage_v', 'grid_B_voltage_v', 'grid_C_voltage_v',
-                'internal_temp_c', 'efficiency_percent',
-                'daily_yield_kwh', 'total_yield_kwh',
-                'battery_power_w', 'battery_soc_percent',
-                'weather_temp_c', 'weather_cloud_cover_percent', 'weather_wind_speed_kmh',
-                'weather_precipitation_mm', 'weather_global_radiation_wm2',
-                'weather_direct_radiation_wm2', 'weather_diffuse_radiation_wm2',
-                'inverter_alarm_1', 'inverter_alarm_2', 'inverter_alarm_3',
-                'inverter_device_status'
-            ])
+# CSV-Header schreibt solar_core.CSVLogger, sobald die Datei leer ist
 
 
 class SolarMonitor:
@@ -263,7 +266,10 @@ class SolarMonitor:
         # PiEmailNotifier ist die Pi-spezifische Wrapper-Klasse
         self.email = PiEmailNotifier()
         self.last_weather_data = {}
+        self._weather_task = None  # Laufender Wetter-Abruf (Thread), blockiert den Loop nicht
         self.running = True
+        # Persistenter, gepufferter Handle auf DATA_LOG_FILE (Header bei leerer Datei)
+        self._data_log = CSVLogger(DATA_LOG_FILE, CSV_COLUMNS_MINIMAL, CSV_BUFFER_SIZE, CSV_FLUSH_EVERY)
         
         print("=" * 50)
         print(f"  {t('system_title_pi')}")
@@ -296,15 +302,25 @@ class SolarMonitor:
     async def check_inverter_alarms(self):
         """Prüft Inverter-Alarme mit vollständigem Kontext."""
         try:
-            alarm_1 = await self.bridge.client.get("alarm_1")
-            alarm_2 = await self.bridge.client.get("alarm_2")
-            alarm_3 = await self.bridge.client.get("alarm_3")
-            device_status = await self.bridge.client.get("device_status")
+            # Alarme als ein Block statt 3 Einzel-Requests
+            client = self.bridge.client
+            alarms = await read_register_block(client, BLOCK_ALARMS, MODBUS_READ_TIMEOUT)
+            
+            if len(alarms) < len(BLOCK_ALARMS):
+                # Timeout / Modbus busy - beim nächsten Intervall erneut
+                error_logger.warning("Alarm-Register nicht lesbar (Timeout oder Modbus belegt)")
+                return
             
-            # AlarmParser aus solar_core verwenden
-            alarm_1_val, alarm_1_obj = AlarmParser.get_alarm_details(alarm_1)
-            alarm_2_val, alarm_2_obj = AlarmParser.get_alarm_details(alarm_2)
-            alarm_3_val, alarm_3_obj = AlarmParser.get_alarm_details(alarm_3)
+            # Normalfall: alle drei Register leer (0 / keine Alarm-Objekte) ->
+            # weder AlarmParser noch device_status nötig
+            if not any(alarms.values()):
+                return
+            device_status = await asyncio.wait_for(client.get("device_status"), timeout=MODBUS_READ_TIMEOUT)
+            
+            # AlarmParser aus solar_core verwenden (fehlender Alarm-Block -> Fehler wie bisher)
+            alarm_1_val, alarm_1_obj = AlarmParser.get_alarm_details(alarms["alarm_1"])
+            alarm_2_val, alarm_2_obj = AlarmParser.get_alarm_details(alarms["alarm_2"])
+            alarm_3_val, alarm_3_obj = AlarmParser.get_alarm_details(alarms["alarm_3"])
             
             has_alarms = (alarm_1_val != 0 or alarm_2_val != 0 or alarm_3_val != 0 or 
                          alarm_1_obj is not None or alarm_2_obj is not None or alarm_3_obj is not None)
@@ -341,15 +357,16 @@ class SolarMonitor:
                 
                 error_logger.error(f"{t('device_status')}: {device_status.value}")
                 
+                # Grid-, PV- und Temperatur-Daten nacheinander lesen (ein Modbus-Client)
+                grid = await read_register_block(client, BLOCK_GRID, MODBUS_READ_TIMEOUT)
+                pv = await read_register_block(client, BLOCK_PV, MODBUS_READ_TIMEOUT)
+                temp = await read_register_block(client, ("internal_temperature",), MODBUS_READ_TIMEOUT)
+                
                 # Grid-Status
                 try:
                     error_logger.error("\n📊 GRID-STATUS:")
-                    grid_a_v = await self.bridge.client.get("grid_A_voltage")
-                    grid_b_v = await self.bridge.client.get("grid_B_voltage")
-                    grid_c_v = await self.bridge.client.get("grid_C_voltage")
-                    grid_freq = await self.bridge.client.get("grid_frequency")
-                    
-                    grid_info = f"Phase A: {grid_a_v.value:.1f}V, B: {grid_b_v.value:.1f}V, C: {grid_c_v.value:.1f}V, Freq: {grid_freq.value:.2f}Hz"
+                    grid_info = (f"Phase A: {grid['grid_A_voltage']:.1f}V, B: {grid['grid_B_voltage']:.1f}V, "
+                                 f"C: {grid['grid_C_voltage']:.1f}V, Freq: {grid['grid_frequency']:.2f}Hz")
                     error_logger.error(f"  {grid_info}")
                     alarm_details['grid_details'] = grid_info
                 except Exception as e:
@@ -358,12 +375,8 @@ class SolarMonitor:
                 # PV-Status
                 try:
                     error_logger.error("\n☀️ PV-STRINGS:")
-                    pv1_v = await self.bridge.client.get("pv_01_voltage")
-                    pv1_a = await self.bridge.client.get("pv_01_current")
-                    pv2_v = await self.bridge.client.get("pv_02_voltage")
-                    pv2_a = await self.bridge.client.get("pv_02_current")
-                    
-                    pv_info = f"String 1: {pv1_v.value:.1f}V@{pv1_a.value:.2f}A, String 2: {pv2_v.value:.1f}V@{pv2_a.value:.2f}A"
+                    pv_info = (f"String 1: {pv['pv_01_voltage']:.1f}V@{pv['pv_01_current']:.2f}A, "
+                               f"String 2: {pv['pv_02_voltage']:.1f}V@{pv['pv_02_current']:.2f}A")
                     error_logger.error(f"  {pv_info}")
                     alarm_details['pv_details'] = pv_info
                 except Exception as e:
@@ -372,8 +385,7 @@ class SolarMonitor:
                 # Temperatur
                 try:
                     error_logger.error("\n🌡️ TEMPERATUREN:")
-                    internal_temp = await self.bridge.client.get("internal_temperature")
-                    temp_info = f"Intern: {internal_temp.value:.1f}°C"
+                    temp_info = f"Intern: {temp['internal_temperature']:.1f}°C"
                     error_logger.error(f"  {temp_info}")
                     alarm_details['temp_details'] = temp_info
                 except Exception as e:
@@ -386,97 +398,89 @@ class SolarMonitor:
                 self.email.send_alarm_notification(alarm_details)
                 
         except Exception as e:
-            error_logger.error(f"Alarm-Check Fehler: {e}\n{traceback.format_exc()}")
+            error_logger.error(f"Alarm-Check Fehler: {e}")
+            error_logger.debug("Traceback:", exc_info=True)
     
     async def log_data(self):
         """Loggt Daten in CSV."""
         try:
-            # Hole Inverter-Daten
-            input_power = await self.bridge.client.get("input_power")
-            grid_exported = await self.bridge.client.get("grid_exported_energy")
-            meter_active_power = await self.bridge.client.get("power_meter_active_power")
+            # Hole Inverter-Daten: 4 Register-Blöcke (je eine Modbus-Transaktion) statt
+            # 20 einzelner Requests. Nacheinander wie im Controller: auf einem Client
+            # parallel angestellte Reads warten hintereinander und verbrauchen dabei
+            # ihre eigenen Timeouts
+            client = self.bridge.client
+            regs = {}
+            for block in (
+                BLOCK_ALARMS_PV,  # Alarme + PV Strings
+                BLOCK_STATUS,  # Leistung, Grid, Inverter, Ertrag
+                BLOCK_METER,
+                BLOCK_BATTERY,  # Fehlt ohne Batterie -> 0
+            ):
+                regs.update(await read_register_block(client, block, MODBUS_READ_TIMEOUT))
             
-            # PV Strings
-            pv1_v = await self.bridge.client.get("pv_01_voltage")
-            pv1_a = await self.bridge.client.get("pv_01_current")
-            pv2_v = await self.bridge.client.get("pv_02_voltage")
-            pv2_a = await self.bridge.client.get("pv_02_current")
-            
-            # Grid
-            grid_a = await self.bridge.client.get("grid_A_voltage")
-            grid_b = await self.bridge.client.get("grid_B_voltage")
-            grid_c = await self.bridge.client.get("grid_C_voltage")
-            
-            # Inverter
-            internal_temp = await self.bridge.client.get("internal_temperature")
-            efficiency = await self.bridge.client.get("efficiency")
-            daily_yield = await self.bridge.client.get("daily_yield_energy")
-            total_yield = await self.bridge.client.get("accumulated_yield_energy")
-            
-            # Battery
-            storage_charge = await self.bridge.client.get("storage_charge_discharge_power")
-            storage_soc = await self.bridge.client.get("storage_state_of_capacity")
-            
-            # Alarme
-            alarm_1 = await self.bridge.client.get("alarm_1")
-            alarm_2 = await self.bridge.client.get("alarm_2")
-            alarm_3 = await self.bridge.client.get("alarm_3")
-            device_status = await self.bridge.client.get("device_status")
-            
-            # Berechne Werte
-            solar_production = input_power.value if input_power.value else 0
-            grid_power = meter_active_power.value if meter_active_power.value else 0
+            # Berechne Werte (fehlende Pflicht-Register -> KeyError -> Logging-Fehler wie bisher)
+            solar_production = regs["input_power"] or 0
+            grid_power = regs["power_meter_active_power"] or 0
             grid_feed_in = max(0, grid_power)
             grid_import = max(0, -grid_power)
             house_consumption = solar_production - grid_power
             
-            # Wetter (gecached)
-            weather = self.last_weather_data
+            # Wetter (gecached; vor dem ersten Abruf Nullen - alle Keys immer vorhanden)
+            weather = self.last_weather_data or EMPTY_WEATHER
             
-            # CSV schreiben - AlarmParser.extract_alarm_value() aus solar_core verwenden
-            with open(DATA_LOG_FILE, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    datetime.now().isoformat(),
-                    int(time.time()),
-                    solar_production,
-                    grid_power,
-                    house_consumption,
-                    grid_feed_in,
-                    grid_import,
-                    pv1_v.value, pv1_a.value, pv1_v.value * pv1_a.value,
-                    pv2_v.value, pv2_a.value, pv2_v.value * pv2_a.value,
-                    grid_a.value, grid_b.value, grid_c.value,
-                    internal_temp.value, efficiency.value,
-                    daily_yield.value, total_yield.value,
-                    storage_charge.value if storage_charge else 0,
-                    storage_soc.value if storage_soc else 0,
-                    weather.get('temperature_c', 0),
-                    weather.get('cloud_cover_percent', 0),
-                    weather.get('wind_speed_kmh', 0),
-                    weather.get('precipitation_mm', 0),
-                    weather.get('global_radiation_wm2', 0),
-                    weather.get('direct_radiation_wm2', 0),
-                    weather.get('diffuse_radiation_wm2', 0),
-                    AlarmParser.extract_alarm_value(alarm_1),
-                    AlarmParser.extract_alarm_value(alarm_2),
-                    AlarmParser.extract_alarm_value(alarm_3),
-                    device_status.value
-                ])
+            # CSV-Zeile als Tuple (Reihenfolge = CSV_COLUMNS_MINIMAL)
+            # AlarmParser.extract_alarm_value() aus solar_core verwenden
+            now_dt = datetime.now()
+            row = (
+                now_dt.isoformat(),
+                int(now_dt.timestamp()),
+                solar_production,
+                grid_power,
+                house_consumption,
+                grid_feed_in,
+                grid_import,
+                regs["pv_01_voltage"], regs["pv_01_current"], regs["pv_01_voltage"] * regs["pv_01_current"],
+                regs["pv_02_voltage"], regs["pv_02_current"], regs["pv_02_voltage"] * regs["pv_02_current"],
+                regs["grid_A_voltage"], regs["grid_B_voltage"], regs["grid_C_voltage"],
+                regs["internal_temperature"], regs["efficiency"],
+                regs["daily_yield_energy"], regs["accumulated_yield_energy"],
+                regs.get("storage_charge_discharge_power") or 0,
+                regs.get("storage_state_of_capacity") or 0,
+                weather['temperature_c'],
+                weather['cloud_cover_percent'],
+                weather['wind_speed_kmh'],
+                weather['precipitation_mm'],
+                weather['global_radiation_wm2'],
+                weather['direct_radiation_wm2'],
+                weather['diffuse_radiation_wm2'],
+                AlarmParser.extract_alarm_value(regs["alarm_1"]),
+                AlarmParser.extract_alarm_value(regs["alarm_2"]),
+                AlarmParser.extract_alarm_value(regs["alarm_3"]),
+                regs["device_status"],
+            )
+            self._data_log.write_row(row)
             
             # Output status
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] Solar: {solar_production:4.0f}W | "
+            print(f"[{now_dt.strftime('%H:%M:%S')}] Solar: {solar_production:4.0f}W | "
                   f"Grid: {grid_power:5.0f}W | Consumption: {house_consumption:4.0f}W | "
-                  f"Temp: {weather.get('temperature_c', 0):.1f}°C")
+                  f"Temp: {weather['temperature_c']:.1f}°C")
             
         except Exception as e:
-            error_logger.error(f"Logging error: {e}\n{traceback.format_exc()}")
+            error_logger.error(f"Logging error: {e}")
+            error_logger.debug("Traceback:", exc_info=True)
             print(f"✗ {t('logging_failed')}: {e}")
     
+    def _on_weather(self, task):
+        """Done-Callback des Wetter-Tasks: Cache nur mit gültigen Daten ersetzen."""
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            error_logger.warning(f"Weather update failed: {task.exception()}")
+        elif task.result():
+            self.last_weather_data = task.result()
+    
     async def run(self):
         """Main loop."""
-        init_data_log()
-        
         if not await self.connect_inverter():
             return
         
@@ -497,14 +501,19 @@ class SolarMonitor:
         asyncio.create_task(alarm_checker())
         
         iteration = 0
+        # Feste Deadlines statt "loggen, dann CHECK_INTERVAL schlafen": die Dauer
+        # der Iteration verschiebt den Takt nicht (gleichmäßige Abstände in der CSV)
+        loop_time = asyncio.get_running_loop().time
+        next_tick = loop_time()
         
         try:
             while self.running:
-                # Wetter-Update
-                if self.weather and iteration % (WEATHER_UPDATE_INTERVAL // CHECK_INTERVAL) == 0:
-                    new_weather = self.weather.get_current_weather()
-                    if new_weather:
-                        self.last_weather_data = new_weather
+                # Wetter-Update im Hintergrund - ein langsamer HTTP-Abruf verzögert
+                # den nächsten Modbus-Poll nicht; log_data() nimmt den letzten Stand
+                if (self.weather and iteration % WEATHER_UPDATE_EVERY == 0
+                        and (self._weather_task is None or self._weather_task.done())):
+                    self._weather_task = asyncio.create_task(asyncio.to_thread(self.weather.get_current_weather))
+                    self._weather_task.add_done_callback(self._on_weather)
                 
                 # Daten loggen
                 await self.log_data()
@@ -512,12 +521,11 @@ class SolarMonitor:
                 # Daily Summary Check
                 if self.email.check_daily_summary_time():
                     # Hole Summary-Daten aus CSV
-                    daily_yield = await self.bridge.client.get("daily_yield_energy")
-                    total_yield = await self.bridge.client.get("accumulated_yield_energy")
+                    yields = await read_register_block(self.bridge.client, BLOCK_YIELD, MODBUS_READ_TIMEOUT)
                     
                     summary_data = {
-                        'daily_yield': daily_yield.value,
-                        'total_yield': total_yield.value,
+                        'daily_yield': yields.get('daily_yield_energy', 0),
+                        'total_yield': yields.get('accumulated_yield_energy', 0),
                         'avg_temp': self.last_weather_data.get('temperature_c', 0),
                         'avg_clouds': self.last_weather_data.get('cloud_cover_percent', 0),
                         'alarm_count': 0  # TODO: Count from logs
@@ -526,7 +534,14 @@ class SolarMonitor:
                     self.email.send_daily_summary(summary_data)
                 
                 iteration += 1
-                await asyncio.sleep(CHECK_INTERVAL)
+                next_tick += CHECK_INTERVAL
+                delay = next_tick - loop_time()
+                if delay < 0:
+                    # Iteration länger als das Intervall: nicht aufholen, ab jetzt neu takten
+                    error_logger.warning("Loop iteration overran CHECK_INTERVAL by %.1fs", -delay)
+                    next_tick -= delay
+                    delay = 0
+                await asyncio.sleep(delay)
                 
         except KeyboardInterrupt:
             print(f"\n\n🛑 {t('shutdown_by_user')}...")
@@ -537,10 +552,10 @@ class SolarMonitor:
             self.email.send_critical_error(error_msg)
         finally:
             self.running = False
+            self._data_log.close()
             print(f"✓ {t('monitoring_stopped')}")
 
 
 if __name__ == "__main__":
-    import time
     monitor = SolarMonitor()
     asyncio.run(monitor.run())